@@ -0,0 +1,263 @@
+"""
+Model benchmarks, on synthetic worlds from `benchmarks.worldgen`.
+
+Times the model operations that grow with the size of a campaign: loading and saving a
+project, `restore_links`, `Faction.assets_by_type`, upkeep, resolving a full round of turns
+with the AI, moving and selling assets in batches, and building and querying the
+`SearchIndex` and the `RulesIndex`. Each case is run a few times and the best time is
+reported. Run from the repository root:
+
+```sh
+python -m benchmarks.bench_model --size medium --save          # Store the results as a baseline
+python -m benchmarks.bench_model --size medium --compare       # Fail on regressions against it
+```
+
+Results are stored as JSON, by default in `benchmarks/baseline.json`, which is not checked in:
+timings only compare on the same machine.
+"""
+
+import argparse
+import json
+import random
+import sys
+import tempfile
+import time
+from collections.abc import Callable
+from dataclasses import dataclass
+from pathlib import Path
+
+from benchmarks.bench_render import headless_app, render_frames
+from benchmarks.worldgen import SIZES, generate_project
+from src.ai import AIController, AISettings
+from src.project import Project, load_project, restore_links, save_project
+from src.search_index import SearchIndex
+from src.spatial_index import SpatialIndex
+from src.stream_loader import load_yaml_stream
+from src.system import AssetType, RulesIndex
+from src.system.rules_search import catalog_entries
+from src.turn import FactionTurn
+from src.wwn_app import WwnApp
+
+ROOT = Path(__file__).resolve().parent.parent
+BASELINE = ROOT / "benchmarks" / "baseline.json"
+
+# Best of a few runs, to filter out noise from the OS
+REPEAT = 5
+# Slowdown against the baseline that counts as a regression
+TOLERANCE = 1.3
+SEED = 0
+
+
+@dataclass(frozen=True, slots=True)
+class Case:
+    """A benchmark: `setup` builds fresh state outside of the timing, `run` is timed on it."""
+
+    name: str
+    setup: Callable[[], object]
+    run: Callable[[object], object]
+
+
+def _fast_ai() -> AIController:
+    # Heuristic scoring in this process, so the round is timed rather than the process pool
+    return AIController(AISettings(rollouts=1, depth=0, workers=1), seed=SEED)
+
+
+def _round_setup(filename: str) -> tuple:
+    random.seed(SEED)
+    project = load_project(filename)
+    index = SpatialIndex()
+    index.rebuild(project.factions)
+    return project, index, _fast_ai()
+
+
+def _play_round(state: tuple) -> None:
+    project, index, ai = state
+    factions, locations, turn = project.factions, project.locations, project.turn
+    turn.start_round(factions)
+    turn.run_npc_turns(
+        main_action=lambda faction: ai.act(faction, turn, factions, locations, index),
+        include_players=True,
+    )
+    ai.close()
+
+
+def _restructure_setup(filename: str) -> tuple:
+    project = load_project(filename)
+    index = SpatialIndex()
+    index.rebuild(project.factions)
+    return project, index, FactionTurn(turn_order=project.factions)
+
+
+def _restructure(state: tuple) -> None:
+    # Every faction moves half of its assets and sells a quarter, in batches
+    project, index, turn = state
+    rng = random.Random(SEED)
+    for faction in project.factions:
+        assets = list(faction.assets)
+        rng.shuffle(assets)
+        half, quarter = len(assets) // 2, len(assets) // 4
+        turn.move_assets({asset: rng.choice(project.locations) for asset in assets[:half]}, index)
+        turn.sell_assets(faction, assets[half : half + quarter], index)
+
+
+# Headless app of the frame case, created on first use and kept for the other runs
+_apps: dict[str, WwnApp] = {}
+FRAMES = 10
+
+
+def _frame_setup(filename: str, scratch: str) -> WwnApp:
+    if filename not in _apps:
+        _apps[filename] = headless_app(filename, scratch)
+    return _apps[filename]
+
+
+def _draw_frames(app: WwnApp) -> None:
+    render_frames(app, FRAMES)
+
+
+def _close_apps() -> None:
+    for app in _apps.values():
+        app.close()
+    _apps.clear()
+
+
+# Type-ahead of a few queries, one prefix at a time
+QUERIES = ("informers", "kind:asset type:force loc:location 1", "faction 12")
+
+
+def _search_setup(project: Project) -> SearchIndex:
+    search = SearchIndex()
+    search.rebuild(project.factions, project.locations)
+    return search
+
+
+def _type_ahead(search: SearchIndex) -> None:
+    for query in QUERIES:
+        for end in range(1, len(query) + 1):
+            search.search(query[:end])
+
+
+# Rules queries, typed one letter at a time
+RULES_QUERIES = ("attack twice", "stealth", "bases of influence")
+# Copies of the catalog in the rules cases, standing in for large homebrew catalogs
+RULES_COPIES = 10
+
+
+def _rules_type_ahead(index: RulesIndex) -> None:
+    for query in RULES_QUERIES:
+        for end in range(1, len(query) + 1):
+            index.search(query[:end])
+
+
+def _unlinked(filename: str) -> Project:
+    data = load_yaml_stream(filename)
+    return Project(data["factions"], data["locations"], data.get("turn") or FactionTurn())
+
+
+def cases(filename: str, scratch: str) -> list[Case]:
+    """List the benchmark cases, on the project in `filename`. Files are written to `scratch`."""
+    project = load_project(filename)
+    return [
+        Case("load", lambda: filename, load_project),
+        Case("save", lambda: project, lambda p: save_project(f"{scratch}/save.yaml", p)),
+        Case("restore_links", lambda: _unlinked(filename), restore_links),
+        Case(
+            "assets_by_type",
+            lambda: project.factions,
+            lambda factions: [
+                faction.assets_by_type(asset_type)
+                for faction in factions
+                for asset_type in AssetType
+            ],
+        ),
+        Case(
+            "upkeep",
+            lambda: project.factions,
+            lambda factions: [faction.upkeep_due() for faction in factions],
+        ),
+        Case("round", lambda: _round_setup(filename), _play_round),
+        Case("restructure", lambda: _restructure_setup(filename), _restructure),
+        Case(
+            "search_rebuild",
+            lambda: project,
+            lambda p: SearchIndex().rebuild(p.factions, p.locations),
+        ),
+        Case("search", lambda: _search_setup(project), _type_ahead),
+        Case("rules_index", lambda: catalog_entries() * RULES_COPIES, RulesIndex),
+        Case(
+            "rules",
+            lambda: RulesIndex(catalog_entries() * RULES_COPIES),
+            _rules_type_ahead,
+        ),
+        Case("frame", lambda: _frame_setup(filename, scratch), _draw_frames),
+    ]
+
+
+def time_case(case: Case, repeat: int = REPEAT) -> float:
+    """Return the best time of a case, in milliseconds."""
+    best = float("inf")
+    for _ in range(repeat):
+        state = case.setup()
+        start_time = time.perf_counter()
+        case.run(state)
+        best = min(best, time.perf_counter() - start_time)
+    return best * 1000
+
+
+def main(argv: list[str] = None) -> int:
+    parser = argparse.ArgumentParser(description="Time model operations on a synthetic world.")
+    parser.add_argument("--size", choices=SIZES, default="medium")
+    parser.add_argument("--repeat", type=int, default=REPEAT)
+    parser.add_argument("--only", nargs="*", help="Only run these cases.")
+    parser.add_argument(
+        "--save", nargs="?", const=BASELINE, type=Path, help="Store the results in this file."
+    )
+    parser.add_argument(
+        "--compare", nargs="?", const=BASELINE, type=Path, help="Compare with stored results."
+    )
+    args = parser.parse_args(argv)
+
+    baseline: dict[str, float] = {}
+    if args.compare:
+        try:
+            stored = json.loads(args.compare.read_text(encoding="utf-8"))
+        except FileNotFoundError:
+            sys.stderr.write(f"No stored results in {args.compare}, run with --save first\n")
+            return 2
+        if stored["size"] != args.size:
+            sys.stderr.write(f"{args.compare} has results for size {stored['size']}\n")
+            return 2
+        baseline = stored["results"]
+
+    factions, locations, assets = SIZES[args.size]
+    results: dict[str, float] = {}
+    failed = False
+    with tempfile.TemporaryDirectory() as scratch:
+        filename = f"{scratch}/world.yaml"
+        save_project(filename, generate_project(factions, locations, assets, seed=SEED))
+        sys.stdout.write(
+            f"{args.size}: {factions} factions, {locations} locations, {assets} assets\n"
+        )
+        for case in cases(filename, scratch):
+            if args.only and case.name not in args.only:
+                continue
+            elapsed_ms = results[case.name] = time_case(case, args.repeat)
+            status = ""
+            if case.name in baseline:
+                ratio = elapsed_ms / baseline[case.name]
+                status = f"{ratio:5.2f}x baseline"
+                if ratio > TOLERANCE:
+                    status += f"  REGRESSION (over {TOLERANCE}x)"
+                    failed = True
+            sys.stdout.write(f"{case.name:<20} {elapsed_ms:10.2f} ms  {status}".rstrip() + "\n")
+        _close_apps()
+
+    if args.save:
+        args.save.write_text(
+            json.dumps({"size": args.size, "results": results}, indent=2) + "\n", encoding="utf-8"
+        )
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
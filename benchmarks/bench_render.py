@@ -0,0 +1,153 @@
+"""
+GUI render benchmark, without a window.
+
+Runs `WwnApp` in headless mode (see `src/app.py`) on a synthetic world from
+`benchmarks.worldgen`, draws a number of frames, and reports the CPU time of each window per
+frame. Needs imgui_bundle, but no display or OpenGL. Run from the repository root:
+
+```sh
+python -m benchmarks.bench_render --size medium --frames 300
+python -m benchmarks.bench_render --size medium --allocations   # Memory allocated per window
+```
+
+With `--allocations` the frames are drawn again under `tracemalloc`, which reports the bytes
+each window allocates per frame: the peak held at once while it's drawn, and what is still held
+once it's done, along with the labels it had to build (see `src/labels.py`). In steady state
+all three should be close to zero; the lines that hold on to the most memory are listed below.
+
+The `frame` case of `benchmarks.bench_model` uses the same setup, for regression checks.
+"""
+
+import argparse
+import sys
+import tempfile
+import time
+import tracemalloc
+
+from benchmarks.worldgen import SIZES, generate_project
+from src.project import save_project
+from src.wwn_app import WwnApp
+
+# Frames drawn before timing, so windows are laid out and fonts are built
+WARMUP_FRAMES = 5
+# Window size of the headless app
+WIDTH = 1920
+HEIGHT = 1080
+# Allocation sites listed by --allocations
+TOP_SITES = 10
+
+
+def headless_app(filename: str, scratch: str) -> WwnApp:
+    """Create a headless app on a project file, with its other files in `scratch`."""
+    config_data = {
+        "ui": {"headless": True, "width": WIDTH, "height": HEIGHT},
+        "project": {
+            "filename": filename,
+            "eventfile": f"{scratch}/events.jsonl",
+            "historyfile": f"{scratch}/history.sqlite",
+        },
+        "ai": {"workers": 1},
+    }
+    app = WwnApp(config_data)
+    # The project loads in the background, the windows are drawn once it's done
+    while app.project_load:
+        draw_frame(app)
+        time.sleep(0.001)
+    for _ in range(WARMUP_FRAMES):
+        draw_frame(app)
+    return app
+
+
+def draw_frame(app: WwnApp) -> None:
+    app.start_frame()
+    app.execute()
+    app.end_frame()
+
+
+def render_frames(app: WwnApp, frames: int) -> tuple[list[float], dict[str, float]]:
+    """
+    Draw frames and return the CPU time of each frame and of each window, in seconds.
+
+    Window times are totals over all the frames.
+    """
+    frame_times: list[float] = []
+    app.window_times = {}
+    for _ in range(frames):
+        start_time = time.thread_time()
+        draw_frame(app)
+        frame_times.append(time.thread_time() - start_time)
+    window_times, app.window_times = app.window_times, None
+    return frame_times, window_times
+
+
+def trace_frames(
+    app: WwnApp, frames: int
+) -> tuple[dict[str, list[int]], list[tracemalloc.StatisticDiff]]:
+    """
+    Draw frames under tracemalloc, and return the allocations of each window, in bytes.
+
+    Returns the [peak, net, labels built] totals over all the frames, see
+    `WwnApp.window_allocations`, and the source lines by how much more memory they hold at the
+    end than at the start.
+    """
+    tracemalloc.start()
+    try:
+        start = tracemalloc.take_snapshot()
+        app.window_allocations = {}
+        for _ in range(frames):
+            draw_frame(app)
+        allocations, app.window_allocations = app.window_allocations, None
+        end = tracemalloc.take_snapshot()
+    finally:
+        tracemalloc.stop()
+    ignore = [tracemalloc.Filter(inclusive=False, filename_pattern=tracemalloc.__file__)]
+    sites = end.filter_traces(ignore).compare_to(start.filter_traces(ignore), "lineno")
+    return allocations, sites
+
+
+def main(argv: list[str] = None) -> int:
+    parser = argparse.ArgumentParser(description="Time headless GUI frames on a synthetic world.")
+    parser.add_argument("--size", choices=SIZES, default="medium")
+    parser.add_argument("--frames", type=int, default=200)
+    parser.add_argument(
+        "--allocations", action="store_true", help="Also report the memory allocated per window."
+    )
+    args = parser.parse_args(argv)
+
+    factions, locations, assets = SIZES[args.size]
+    with tempfile.TemporaryDirectory() as scratch:
+        filename = f"{scratch}/world.yaml"
+        save_project(filename, generate_project(factions, locations, assets))
+        app = headless_app(filename, scratch)
+        try:
+            frame_times, window_times = render_frames(app, max(1, args.frames))
+            if args.allocations:
+                allocations, sites = trace_frames(app, max(1, args.frames))
+        finally:
+            app.close()
+
+    frames = len(frame_times)
+    frame_times.sort()
+    sys.stdout.write(
+        f"{args.size}: {factions} factions, {locations} locations, {assets} assets,"
+        f" {frames} frames\n"
+    )
+    for name, total in sorted(window_times.items(), key=lambda item: -item[1]):
+        sys.stdout.write(f"{name:<20} {total / frames * 1000:10.3f} ms/frame\n")
+    sys.stdout.write(
+        f"{'frame':<20} {sum(frame_times) / frames * 1000:10.3f} ms/frame"
+        f"  (median {frame_times[frames // 2] * 1000:.3f}, max {frame_times[-1] * 1000:.3f})\n"
+    )
+    if args.allocations:
+        sys.stdout.write(f"\n{'per frame':<20} {'peak B':>10} {'net B':>10} {'labels':>10}\n")
+        for name, (peak, net, built) in sorted(allocations.items(), key=lambda item: -item[1][0]):
+            sys.stdout.write(
+                f"{name:<20} {peak / frames:10.0f} {net / frames:10.0f} {built / frames:10.1f}\n"
+            )
+        for site in sites[:TOP_SITES]:
+            sys.stdout.write(f"{site}\n")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
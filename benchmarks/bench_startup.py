@@ -0,0 +1,78 @@
+"""
+Startup time benchmark.
+
+Imports the headless modules in a fresh interpreter with `python -X importtime`, reports
+their cumulative import time (best of a few runs), and fails if one of them is over budget
+or pulls in a GUI library. Run from the repository root:
+
+```sh
+python -m benchmarks.bench_startup
+```
+"""
+
+import subprocess
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+
+# Modules that must stay importable without any GUI library
+HEADLESS_MODULES = [
+    "src.system",
+    "src.faction",
+    "src.turn",
+    "src.project",
+    "src.diff",
+    "src.history",
+    "src.metrics",
+    "src.world_snapshot",
+    "src.monte_carlo",
+    "src.wwn_app",
+    "cli",
+]
+GUI_MODULES = ("imgui_bundle", "glfw", "OpenGL")
+# Budget for the cumulative import time of each module, in milliseconds
+BUDGET_MS = 150
+# Best of a few runs, to filter out noise from the OS
+REPEAT = 3
+
+
+def import_times(module: str) -> dict[str, int]:
+    """Import `module` in a new interpreter and return cumulative import times in us, by module."""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        capture_output=True,
+        text=True,
+        cwd=ROOT,
+        check=True,
+    )
+    times: dict[str, int] = {}
+    for line in result.stderr.splitlines():
+        # Format: "import time: <self us> | <cumulative us> | <indented module name>"
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative, name = line.removeprefix("import time:").split("|")
+        times[name.strip()] = int(cumulative)
+    return times
+
+
+def main() -> int:
+    failed = False
+    for module in HEADLESS_MODULES:
+        runs = [import_times(module) for _ in range(REPEAT)]
+        times = min(runs, key=lambda run: run[module])
+        elapsed_ms = times[module] / 1000
+        gui_imports = sorted({name for name in times if name.split(".")[0] in GUI_MODULES})
+        status = "OK"
+        if elapsed_ms > BUDGET_MS:
+            status = f"OVER BUDGET ({BUDGET_MS} ms)"
+            failed = True
+        if gui_imports:
+            status = f"IMPORTS GUI ({', '.join(gui_imports[:3])})"
+            failed = True
+        sys.stdout.write(f"{module:<20} {elapsed_ms:8.1f} ms  {status}\n")
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
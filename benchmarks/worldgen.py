@@ -0,0 +1,126 @@
+"""
+Synthetic world generator, for benchmarks and load testing.
+
+Builds a linked project with the given number of factions, locations and assets. The same
+seed always gives the same world, uuids included:
+
+```sh
+python -m benchmarks.worldgen Project/big.yaml --factions 200 --locations 100 --assets 20000
+```
+
+Factions get random attributes, one or two tags, a goal and some bases of influence. Assets
+are spread evenly over the factions and drawn from `cunning_list()`, `force_list()` and
+`wealth_list()`, from the tiers the owner's attributes allow, and placed at random locations.
+"""
+
+import argparse
+import sys
+from copy import copy
+from random import Random
+from uuid import UUID
+
+from src.asset import Asset
+from src.base_of_influence import BaseOfInfluence
+from src.faction import Faction
+from src.location import Location
+from src.project import Project, save_project
+from src.system import AssetType, cunning_list, force_list, goals_list, tags_list, wealth_list
+from src.tag import Tag
+
+# Attribute range of generated factions
+MIN_ATTRIBUTE = 1
+MAX_ATTRIBUTE = 6
+MAX_BASES = 3
+MAX_TAGS = 2
+# (factions, locations, assets) of the world sizes used by the benchmarks
+SIZES = {
+    "small": (20, 10, 500),
+    "medium": (100, 50, 5000),
+    "large": (1000, 300, 50000),
+}
+
+
+def _uuid(rng: Random) -> str:
+    return str(UUID(int=rng.getrandbits(128), version=4))
+
+
+def generate_project(factions: int, locations: int, assets: int, seed: int = 0) -> Project:
+    """Generate a linked project. Returns the same project for the same arguments."""
+    rng = Random(seed)
+    prototypes = {
+        AssetType.CUNNING: cunning_list(),
+        AssetType.FORCE: force_list(),
+        AssetType.WEALTH: wealth_list(),
+    }
+    tags, goals = tags_list(), goals_list()
+    project = Project()
+    project.locations = [
+        Location(name=f"Location {idx}", uuid=_uuid(rng), desc=f"Generated location {idx}.")
+        for idx in range(max(1, locations))
+    ]
+    for idx in range(factions):
+        faction = Faction(
+            uuid=_uuid(rng),
+            name=f"Faction {idx}",
+            desc=f"Generated faction {idx}.",
+            cunning=rng.randint(MIN_ATTRIBUTE, MAX_ATTRIBUTE),
+            force=rng.randint(MIN_ATTRIBUTE, MAX_ATTRIBUTE),
+            wealth=rng.randint(MIN_ATTRIBUTE, MAX_ATTRIBUTE),
+            treasure=rng.randint(0, 20),
+            tags=[Tag(tag) for tag in rng.sample(tags, rng.randint(1, MAX_TAGS))],
+            goal=copy(rng.choice(goals)),
+            npc=idx % 2 == 0,
+        )
+        for _ in range(rng.randint(1, MAX_BASES)):
+            location = rng.choice(project.locations)
+            base = BaseOfInfluence(
+                uuid=_uuid(rng),
+                owner=faction.uuid,
+                location=location,
+                max_hp=rng.randint(1, faction.max_hp()),
+            )
+            faction.bases.append(base)
+            location.bases.append(base)
+        project.factions.append(faction)
+
+    # Assets round-robin over the factions, from the tiers each one can buy
+    for idx in range(assets):
+        faction = project.factions[idx % len(project.factions)] if project.factions else None
+        if faction is None:
+            break
+        limits = {
+            AssetType.CUNNING: faction.cunning,
+            AssetType.FORCE: faction.force,
+            AssetType.WEALTH: faction.wealth,
+        }
+        asset_type = rng.choice(list(AssetType))
+        prototype = rng.choice(
+            [
+                prototype
+                for prototype in prototypes[asset_type]
+                if prototype.requirements.tier <= limits[asset_type]
+            ]
+        )
+        location = rng.choice(project.locations)
+        asset = Asset(uuid=_uuid(rng), owner=faction.uuid, prototype=prototype, loc=location)
+        asset.hp = rng.randint(1, asset.max_hp())
+        faction.assets.append(asset)
+        location.assets.append(asset)
+    return project
+
+
+def main(argv: list[str] = None) -> int:
+    parser = argparse.ArgumentParser(description="Generate a synthetic project file.")
+    parser.add_argument("output")
+    parser.add_argument("--factions", type=int, default=100)
+    parser.add_argument("--locations", type=int, default=50)
+    parser.add_argument("--assets", type=int, default=2000)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args(argv)
+    project = generate_project(args.factions, args.locations, args.assets, args.seed)
+    save_project(args.output, project)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
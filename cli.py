@@ -0,0 +1,426 @@
+"""
+Headless command line tools for project files.
+
+Runs without a window or any GUI library, for scripting and batch jobs:
+
+```sh
+python cli.py validate Project/wwn.yaml          # Check links and values, exit code 1 on problems
+python cli.py convert Project/wwn.yaml out.yaml  # Rewrite a project in the current file format
+python cli.py diff old.yaml new.yaml             # List added, removed and changed objects, by uuid
+python cli.py simulate Project/wwn.yaml -n 10 -o sim.yaml  # Play out rounds with the AI
+python cli.py stats Project/wwn.yaml --json      # Per-faction summary
+python cli.py export Project/wwn.yaml -o wwn.jsonl  # Newline-delimited JSON records
+python cli.py history Project/history.sqlite <uuid> --field treasure  # Values over past turns
+python cli.py snapshot Project/wwn.yaml world.snap  # Memory-mapped columns for analysis workers
+python cli.py forecast Project/wwn.yaml -n 10 --trials 1000  # Monte Carlo outcome of 10 rounds
+python cli.py search Project/wwn.yaml "kind:asset type:force loc:harbor"  # Find objects by words
+python cli.py rules "attack twice"               # Find rules of assets, tags, qualities and goals
+```
+
+Outputs are written one line at a time, so they can be piped into other tools.
+"""
+
+import argparse
+import json
+import logging
+import os
+import random
+import sys
+import time
+from collections.abc import Iterable
+from typing import TYPE_CHECKING
+
+from config import CONFIG_FILE_PATH, cache_dir, open_yaml
+from src.faction import Faction
+from src.goal_tracker import GoalTracker
+from src.project import (
+    Project,
+    export_json,
+    load_project,
+    save_project,
+    validate_project,
+)
+from src.spatial_index import SpatialIndex
+from src.system import configure_catalog, rules_index
+
+# The commands import the rest of what they need, so the tool starts fast whatever the command
+if TYPE_CHECKING:
+    from src.monte_carlo import SharedWorld
+
+logger = logging.getLogger(__name__)
+
+# Exit codes
+EXIT_OK = 0
+EXIT_PROBLEMS = 1
+EXIT_ERROR = 2
+
+
+class CliError(Exception):
+    """An error that ends the command, reported without a traceback."""
+
+
+def _load(filename: str) -> Project:
+    project = load_project(filename)
+    if project is None:
+        raise CliError(f"Could not load project {filename}")
+    return project
+
+
+def _write_lines(lines: Iterable[str], filename: str = None) -> None:
+    """Write lines to a file, or to stdout if no filename is given."""
+    if filename is None:
+        sys.stdout.writelines(lines)
+        return
+    with open(filename, mode="w", encoding="utf-8") as out_file:
+        out_file.writelines(lines)
+
+
+def validate(args: argparse.Namespace) -> int:
+    project = _load(args.project)
+    problems = project.problems + validate_project(project)
+    _write_lines(f"{problem}\n" for problem in problems)
+    return EXIT_PROBLEMS if problems else EXIT_OK
+
+
+def convert(args: argparse.Namespace) -> int:
+    save_project(args.output, _load(args.project))
+    return EXIT_OK
+
+
+def diff(args: argparse.Namespace) -> int:
+    from src.diff import diff_projects
+
+    differences = False
+    for change in diff_projects(_load(args.old), _load(args.new)):
+        differences = True
+        if args.json:
+            sys.stdout.write(json.dumps(change.to_dict(), separators=(",", ":")) + "\n")
+        else:
+            sys.stdout.write(f"{change}\n")
+    return EXIT_PROBLEMS if differences else EXIT_OK
+
+
+def simulate(args: argparse.Namespace) -> int:
+    from src.ai import AIController, AISettings
+    from src.events import EventLog
+    from src.history import HistoryStore
+
+    if args.seed is not None:
+        random.seed(args.seed)
+    project = _load(args.project)
+    factions, locations, turn = project.factions, project.locations, project.turn
+    if not factions:
+        raise CliError("The project has no factions")
+    index = SpatialIndex()
+    index.rebuild(factions)
+    # Events are only written out if asked for, but the goal tracker always needs them
+    event_log = EventLog(args.events or os.devnull)
+    goal_tracker = GoalTracker(factions)
+    event_log.subscribe(goal_tracker.on_event)
+    turn.event_log = event_log
+    turn.goal_tracker = goal_tracker
+
+    ai = AIController(AISettings.from_config(args.config_data), seed=args.seed)
+    history = HistoryStore(args.history) if args.history else None
+    start_time = time.perf_counter()
+    completed = 0
+    try:
+        for _ in range(args.rounds):
+            # A round that was in progress when the project was saved is finished first
+            if not turn.turn_order:
+                turn.start_round(factions)
+            completed += turn.run_npc_turns(
+                main_action=lambda faction: ai.act(faction, turn, factions, locations, index),
+                include_players=True,
+            )
+            if turn.turn_order:
+                raise CliError(f"Turn {turn.turn_idx} stopped in state {turn.state.name}")
+            if history:
+                history.record(project)
+    finally:
+        ai.close()
+        event_log.flush()
+        if history:
+            history.close()
+    logger.info(
+        f"Simulated {args.rounds} rounds ({completed} faction turns) in {time.perf_counter() - start_time:.2f}s"  # noqa: E501
+    )
+    if args.output:
+        save_project(args.output, project)
+    _write_lines(_stats_lines(factions, as_json=args.json))
+    return EXIT_OK
+
+
+def _faction_stats(faction: Faction) -> dict:
+    return {
+        "uuid": faction.uuid,
+        "name": faction.name,
+        "npc": faction.npc,
+        "cunning": faction.cunning,
+        "force": faction.force,
+        "wealth": faction.wealth,
+        "hp": faction.hp,
+        "max_hp": faction.max_hp(),
+        "treasure": faction.treasure,
+        "treasure_gain": faction.treasure_gain(),
+        "upkeep": faction.upkeep_due(),
+        "exp": faction.exp,
+        "assets": len(faction.assets),
+        "bases": len(faction.bases),
+        "goal": faction.goal.name if faction.goal else None,
+    }
+
+
+def _stats_lines(factions: list[Faction], as_json: bool) -> Iterable[str]:
+    for faction in factions:
+        stats = _faction_stats(faction)
+        if as_json:
+            yield json.dumps(stats, separators=(",", ":")) + "\n"
+        else:
+            yield (
+                f"{stats['name']:<24} C{stats['cunning']} F{stats['force']} W{stats['wealth']}"
+                f"  HP {stats['hp']}/{stats['max_hp']}"
+                f"  Treasure {stats['treasure']} (+{stats['treasure_gain']} -{stats['upkeep']})"
+                f"  Exp {stats['exp']}  Assets {stats['assets']}  Bases {stats['bases']}"
+                f"  Goal {stats['goal'] or '-'}\n"
+            )
+
+
+def stats(args: argparse.Namespace) -> int:
+    _write_lines(_stats_lines(_load(args.project).factions, as_json=args.json))
+    return EXIT_OK
+
+
+def export(args: argparse.Namespace) -> int:
+    _write_lines(export_json(_load(args.project)), args.output)
+    return EXIT_OK
+
+
+def history(args: argparse.Namespace) -> int:
+    from src.history import HistoryStore
+
+    if not os.path.exists(args.historyfile):
+        raise CliError(f"No history file {args.historyfile}")
+    store = HistoryStore(args.historyfile)
+    try:
+        if args.field:
+            lines = (
+                f"{turn}\t{json.dumps(value)}\n"
+                for turn, value in store.series(args.uuid, args.field, args.first, args.last)
+            )
+        else:
+            turns = store.turns()
+            turn = args.last if args.last is not None else (turns[-1] if turns else 0)
+            record = store.record_at(args.uuid, turn)
+            if record is None:
+                raise CliError(f"{args.uuid} not found at turn {turn}")
+            lines = [json.dumps(record, separators=(",", ":")) + "\n"]
+        _write_lines(lines)
+    finally:
+        store.close()
+    return EXIT_OK
+
+
+def snapshot(args: argparse.Namespace) -> int:
+    from src.world_snapshot import write_snapshot
+
+    project = _load(args.project)
+    size = write_snapshot(args.output, project.factions, project.locations, project.turn.turn_idx)
+    logger.info(f"Wrote {size} bytes to {args.output}")
+    return EXIT_OK
+
+
+def _forecast_world(filename: str) -> tuple["SharedWorld", list[str]]:
+    """Lay out a project, or a world snapshot (.snap), in shared memory. Also returns the faction names."""  # noqa: E501
+    from src.monte_carlo import SharedWorld
+    from src.world_snapshot import WorldSnapshot
+
+    if filename.endswith(".snap"):
+        try:
+            snapshot = WorldSnapshot(filename)
+        except (OSError, ValueError) as e:
+            raise CliError(f"Could not open snapshot {filename}: {e}") from e
+        return SharedWorld.from_snapshot(snapshot), snapshot.strings(snapshot.factions["name"])
+    project = _load(filename)
+    names = [faction.name for faction in project.factions]
+    return SharedWorld.from_model(project.factions, project.locations), names
+
+
+def forecast(args: argparse.Namespace) -> int:
+    from src.monte_carlo import OUTCOMES, MonteCarlo
+
+    world, names = _forecast_world(args.project)
+    with world:
+        result = MonteCarlo(world, workers=args.workers).run(args.rounds, args.trials, args.seed)
+    lines = []
+    for row, name in enumerate(names):
+        stats = {"name": name}
+        for column, outcome in enumerate(OUTCOMES):
+            stats[outcome] = round(float(result.mean[row, column]), 2)
+            stats[f"{outcome}_std"] = round(float(result.std[row, column]), 2)
+        if args.json:
+            lines.append(json.dumps(stats, separators=(",", ":")) + "\n")
+        else:
+            lines.append(
+                f"{name}: survived {stats['survived']:.0%}, HP {stats['hp']} ± {stats['hp_std']},"
+                f" Treasure {stats['treasure']}, Assets {stats['assets']}, Bases {stats['bases']}\n"
+            )
+    _write_lines(lines)
+    return EXIT_OK
+
+
+def search(args: argparse.Namespace) -> int:
+    from src.search_index import DEFAULT_LIMIT, SearchIndex
+
+    project = _load(args.project)
+    index = SearchIndex()
+    index.rebuild(project.factions, project.locations)
+    lines = []
+    limit = DEFAULT_LIMIT if args.limit is None else args.limit
+    for entity in index.search(args.query, limit):
+        record = {"kind": type(entity).__name__, "uuid": entity.uuid, "name": str(entity)}
+        if args.json:
+            lines.append(json.dumps(record, separators=(",", ":")) + "\n")
+        else:
+            lines.append(f"{record['kind']}\t{record['uuid']}\t{record['name']}\n")
+    _write_lines(lines)
+    return EXIT_OK if lines else EXIT_PROBLEMS
+
+
+def rules(args: argparse.Namespace) -> int:
+    lines = []
+    for entry in rules_index().search(args.query, args.limit):
+        if args.json:
+            record = {
+                "kind": entry.kind,
+                "id": entry.ident,
+                "name": entry.name,
+                "rules": entry.text,
+            }
+            lines.append(json.dumps(record, separators=(",", ":")) + "\n")
+        else:
+            lines.append(f"{entry.title}\n    {entry.text}\n")
+    _write_lines(lines)
+    return EXIT_OK if lines else EXIT_PROBLEMS
+
+
+def parse_args(argv: list[str] = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        prog="cli.py", description="Headless tools for WWN faction turn project files."
+    )
+    parser.add_argument("--config", default=CONFIG_FILE_PATH, help="Config file to use.")
+    parser.add_argument("-v", "--verbose", action="store_true", help="Log progress to stderr.")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    command = commands.add_parser("validate", help="Check a project for broken links and values.")
+    command.add_argument("project")
+    command.set_defaults(func=validate)
+
+    command = commands.add_parser("convert", help="Rewrite a project in the current format.")
+    command.add_argument("project")
+    command.add_argument("output")
+    command.set_defaults(func=convert)
+
+    command = commands.add_parser("diff", help="List the differences between two projects.")
+    command.add_argument("old")
+    command.add_argument("new")
+    command.add_argument("--json", action="store_true", help="Print the changes as JSON lines.")
+    command.set_defaults(func=diff)
+
+    command = commands.add_parser("simulate", help="Play out rounds with the AI.")
+    command.add_argument("project")
+    command.add_argument("-n", "--rounds", type=int, default=1, help="Number of rounds.")
+    command.add_argument("-o", "--output", help="Save the resulting project to this file.")
+    command.add_argument("--events", help="Append the turn events to this file.")
+    command.add_argument("--seed", type=int, help="Seed the dice, for repeatable runs.")
+    command.add_argument("--history", help="Record the end of each round in this history file.")
+    command.add_argument("--json", action="store_true", help="Print the stats as JSON lines.")
+    command.set_defaults(func=simulate)
+
+    command = commands.add_parser("stats", help="Print a summary of each faction.")
+    command.add_argument("project")
+    command.add_argument("--json", action="store_true", help="Print JSON lines.")
+    command.set_defaults(func=stats)
+
+    command = commands.add_parser("export", help="Export a project as JSON lines.")
+    command.add_argument("project")
+    command.add_argument("-o", "--output", help="Output file, stdout by default.")
+    command.set_defaults(func=export)
+
+    command = commands.add_parser(
+        "history", help="Look up an object in the campaign history, by uuid."
+    )
+    command.add_argument("historyfile")
+    command.add_argument("uuid")
+    command.add_argument("--field", help="Print this field for each turn, e.g. treasure.")
+    command.add_argument("--first", type=int, help="First turn of the --field series.")
+    command.add_argument(
+        "--last", type=int, help="Last turn of the series, or turn of the record to print."
+    )
+    command.set_defaults(func=history)
+
+    command = commands.add_parser(
+        "snapshot", help="Write a memory-mapped world snapshot, see src/world_snapshot.py."
+    )
+    command.add_argument("project")
+    command.add_argument("output")
+    command.set_defaults(func=snapshot)
+
+    command = commands.add_parser(
+        "forecast", help="Play out rounds of fighting many times, and print the average outcome."
+    )
+    command.add_argument("project", help="Project file, or world snapshot (.snap).")
+    command.add_argument("-n", "--rounds", type=int, default=1, help="Number of rounds.")
+    command.add_argument("--trials", type=int, default=1000, help="Number of trials.")
+    command.add_argument("--workers", type=int, default=0, help="Processes, 0 for one per CPU.")
+    command.add_argument("--seed", type=int, help="Seed the dice, for repeatable runs.")
+    command.add_argument("--json", action="store_true", help="Print JSON lines.")
+    command.set_defaults(func=forecast)
+
+    command = commands.add_parser(
+        "search", help="Find factions, assets and locations, see src/search_index.py."
+    )
+    command.add_argument("project")
+    command.add_argument("query", help="Words to match, e.g. 'kind:asset type:force loc:harbor'.")
+    command.add_argument("--limit", type=int, help="Most results to print.")
+    command.add_argument("--json", action="store_true", help="Print JSON lines.")
+    command.set_defaults(func=search)
+
+    command = commands.add_parser(
+        "rules", help="Find the rules of assets, tags, qualities and goals, best matches first."
+    )
+    command.add_argument("query", help="Words to match, the last one as a prefix.")
+    command.add_argument("--limit", type=int, default=10, help="Most results to print.")
+    command.add_argument("--json", action="store_true", help="Print JSON lines.")
+    command.set_defaults(func=rules)
+
+    return parser.parse_args(argv)
+
+
+def main(argv: list[str] = None) -> int:
+    args = parse_args(argv)
+    logging.basicConfig(
+        level=logging.INFO if args.verbose else logging.WARNING,
+        format="%(levelname)s: %(message)s",
+        stream=sys.stderr,
+    )
+    # Passed on to the commands with the arguments
+    args.config_data = open_yaml(args.config) or {}
+    # Homebrew assets, loaded on top of the default asset catalog
+    configure_catalog(
+        homebrew=args.config_data.get("project", {}).get("homebrew", []),
+        cache_dir=cache_dir(args.config_data, args.config),
+    )
+    try:
+        return args.func(args)
+    except CliError as e:
+        logger.error(str(e))
+        return EXIT_ERROR
+    except BrokenPipeError:
+        # The reader went away, e.g. `cli.py export ... | head`. Silence the final flush.
+        os.dup2(os.open(os.devnull, os.O_WRONLY), sys.stdout.fileno())
+        return EXIT_PROBLEMS
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,12 +1,16 @@
 """Opens the config.yaml file and parses it into a dict."""
 
 import logging
+from pathlib import Path
 
 import yaml
 
 logger = logging.getLogger(__name__)
 
 CONFIG_FILE_PATH = "config.yaml"
+DEFAULT_PROJECT = "Project/wwn.yaml"
+# Directory of the compiled catalog and other derived caches, next to the project file
+CACHE_DIR_NAME = ".cache"
 
 
 def open_config() -> dict:
@@ -14,6 +18,19 @@ def open_config() -> dict:
     return open_yaml(CONFIG_FILE_PATH)
 
 
+def cache_dir(config_data: dict, config_file: str = CONFIG_FILE_PATH) -> str:
+    """
+    Return the absolute path of the cache directory, next to the configured project file.
+
+    A relative project filename is taken relative to the config file, or to the application
+    directory if there is no config file, never to the current directory.
+    """
+    project = config_data.get("project", {}).get("filename", DEFAULT_PROJECT)
+    config_path = Path(config_file).resolve()
+    base = config_path.parent if config_path.is_file() else Path(__file__).resolve().parent
+    return str((base / project).parent / CACHE_DIR_NAME)
+
+
 def open_yaml(filename: str) -> dict:
     """Open the yaml file and parse its contents."""
     try:
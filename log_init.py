@@ -4,6 +4,10 @@ Sets up the logging.
 The default setup is to created colored logs for the console, and
 generate a log to file under Logs/ folder.
 
+Log records are put on a bounded queue and written to the console and file by a
+background thread, so that logging never blocks the GUI thread on disk I/O. The log
+file is rotated when it grows too large.
+
 The logging can be configured in config.yaml with the following params:
 ```yaml
 logging:
@@ -11,11 +15,19 @@ logging:
   verbosity           : DEBUG   # Verbosity of log messages in the console.
                                 # Valid levels: DEBUG, INFO, WARNING, ERROR, CRITICAL
                                 # Full log will always be available in a file.
+  queue_size          : 10000   # Max number of log records waiting to be written.
+  drop_policy         : oldest  # What to do when the queue is full:
+                                # oldest (drop oldest record), newest (drop new record), block
+  max_bytes           : 5000000 # Rotate the log file when it grows past this size.
+  backup_count        : 3       # Number of rotated log files to keep.
 ```
 """
 
+import atexit
 import logging
+import queue
 from logging import LogRecord
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
 from typing import Self
 
 # Python has a logging library that will do what we want.
@@ -24,6 +36,15 @@ from typing import Self
 
 
 DEFAULT_LOGFILE = "Project/wwn.log"
+DEFAULT_QUEUE_SIZE = 10000
+DEFAULT_DROP_POLICY = "oldest"
+DEFAULT_MAX_BYTES = 5_000_000
+DEFAULT_BACKUP_COUNT = 3
+
+# Background thread writing queued log records, see initialize_logging
+_listener: QueueListener = None
+# shutdown_logging is registered to run at exit once, however many times logging is set up
+_atexit_registered = False
 
 
 class ColorFormatter(logging.Formatter):
@@ -56,8 +77,79 @@ class ColorFormatter(logging.Formatter):
         return super().format(record)
 
 
+class DroppingQueueHandler(QueueHandler):
+    """
+    QueueHandler for a bounded queue, with a policy for when the queue is full.
+
+    - `oldest`: Drop the oldest queued record to make room for the new one.
+    - `newest`: Drop the new record.
+    - `block`: Wait for the writer thread to make room.
+
+    The number of dropped records is reported in the log once there is room again.
+    """
+
+    DROP_POLICIES = ("oldest", "newest", "block")
+
+    def __init__(self: Self, log_queue: queue.Queue, drop_policy: str) -> None:
+        """Initialize DroppingQueueHandler object."""
+        super().__init__(log_queue)
+        if drop_policy not in DroppingQueueHandler.DROP_POLICIES:
+            raise ValueError(f"Invalid log drop policy '{drop_policy}'")
+        self.drop_policy = drop_policy
+        self.dropped = 0
+
+    def enqueue(self: Self, record: LogRecord) -> None:
+        """Put a record on the queue, applying the drop policy if it is full."""
+        if self.drop_policy == "block":
+            self.queue.put(record)
+            return
+        if self.dropped and not self.queue.full():
+            dropped = self.dropped
+            try:
+                self._put(self._dropped_record())
+            except queue.Full:
+                # Another thread filled the queue first, report them all next time
+                self.dropped += dropped
+        try:
+            self._put(record)
+        except queue.Full:
+            self.dropped += 1
+
+    def _put(self: Self, record: LogRecord) -> None:
+        if self.drop_policy == "oldest" and self.queue.full():
+            try:
+                self.queue.get_nowait()
+                self.dropped += 1
+            except queue.Empty:
+                pass
+        self.queue.put_nowait(record)
+
+    def _dropped_record(self: Self) -> LogRecord:
+        record = logging.makeLogRecord(
+            {
+                "name": __name__,
+                "levelno": logging.INFO,
+                "levelname": "INFO",
+                "msg": f"Log queue full, dropped {self.dropped} log records",
+            }
+        )
+        self.dropped = 0
+        return record
+
+
+class BlockingQueueListener(QueueListener):
+    """QueueListener that waits for room on a full queue to stop, rather than raising."""
+
+    def enqueue_sentinel(self: Self) -> None:
+        """Queue the stop sentinel behind the waiting records, as the writer thread drains them."""
+        self.queue.put(self._sentinel)
+
+
 def initialize_logging(config_data: dict) -> None:
     """Call once in main, before any calls to the logging library."""
+    global _listener, _atexit_registered
+    shutdown_logging()
+
     # Defines the format of the colored logs
     color_log_fmt = "%(color)s[%(asctime)s] %(name)-16s %(levelname)-8s %(message)s%(color_reset)s"
     color_log_formatter = ColorFormatter(fmt=color_log_fmt)
@@ -70,18 +162,20 @@ def initialize_logging(config_data: dict) -> None:
 
     config_project: dict = config_data.get("project", {})
     logfile = config_project.get("logfile", DEFAULT_LOGFILE)
-    # Set up logging to file
-    logging.basicConfig(
+    config_logging = config_data.get("logging", {})
+    # Set up logging to file, rotated by size
+    file_handler = RotatingFileHandler(
         filename=logfile,
-        filemode="a",  # Log everything in the file
-        level=logging.DEBUG,
-        force=True,  # Restart everything in the logger (allows for reinit)
+        mode="a",  # Log everything in the file
+        maxBytes=config_logging.get("max_bytes", DEFAULT_MAX_BYTES),
+        backupCount=config_logging.get("backup_count", DEFAULT_BACKUP_COUNT),
+        encoding="utf-8",
     )
+    file_handler.setLevel(logging.DEBUG)
     # Apply non-colored, file-specific formatter to file output
-    logging.getLogger("").root.handlers[0].setFormatter(file_log_formatter)
+    file_handler.setFormatter(file_log_formatter)
 
     # Get the visible log level for the console logger from config.yaml
-    config_logging = config_data.get("logging", {})
     console_log_level = config_logging.get("verbosity", "DEBUG")
     color_log = config_logging.get("color_log", False)
 
@@ -95,12 +189,37 @@ def initialize_logging(config_data: dict) -> None:
         formatter_to_use = color_log_formatter  # Apply color formatter
     console.setFormatter(formatter_to_use)
 
-    # Add the handlers to the root logger
-    logging.getLogger("").addHandler(console)
+    # The root logger only puts records on the queue, the listener thread writes them out
+    log_queue = queue.Queue(maxsize=config_logging.get("queue_size", DEFAULT_QUEUE_SIZE))
+    queue_handler = DroppingQueueHandler(
+        log_queue, drop_policy=config_logging.get("drop_policy", DEFAULT_DROP_POLICY)
+    )
+    root = logging.getLogger("")
+    for handler in root.handlers[:]:  # Restart everything in the logger (allows for reinit)
+        root.removeHandler(handler)
+        handler.close()
+    root.setLevel(logging.DEBUG)
+    root.addHandler(queue_handler)
+
+    _listener = BlockingQueueListener(log_queue, file_handler, console, respect_handler_level=True)
+    _listener.start()
+    if not _atexit_registered:
+        atexit.register(shutdown_logging)
+        _atexit_registered = True
 
     # Now the logging to file/console is configured!
 
 
+def shutdown_logging() -> None:
+    """Write out all queued log records and stop the writer thread."""
+    global _listener
+    if _listener:
+        _listener.stop()
+        for handler in _listener.handlers:
+            handler.close()
+        _listener = None
+
+
 # Examples of using logging:
 #
 # import logging
@@ -1,7 +1,8 @@
 import logging
 
-from config import open_config
-from log_init import initialize_logging
+from config import CONFIG_FILE_PATH, cache_dir, open_config
+from log_init import initialize_logging, shutdown_logging
+from src.system import configure_catalog
 from src.wwn_app import WwnApp
 
 logger = logging.getLogger(__name__)
@@ -12,6 +13,11 @@ def main() -> None:
     config_data = open_config()
     # Initialize logging
     initialize_logging(config_data)
+    # Homebrew assets, loaded on top of the default asset catalog
+    configure_catalog(
+        homebrew=config_data.get("project", {}).get("homebrew", []),
+        cache_dir=cache_dir(config_data, CONFIG_FILE_PATH),
+    )
 
     logger.debug("Started WWN-faction-turn app")
     # Initialize app and GUI
@@ -24,6 +30,7 @@ def main() -> None:
     app.close()
 
     logger.debug("Closed WWN-faction-turn app")
+    shutdown_logging()
 
 
 if __name__ == "__main__":
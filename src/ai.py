@@ -0,0 +1,943 @@
+"""
+AI controller for NPC factions.
+
+For each faction in the turn order, the controller lists the legal main actions, scores
+them, and picks the best one as a `Decision` for the GM to approve. Actions are scored on a
+`SimWorld`, a compact copy of the factions, assets and bases made of plain records, which
+is cheap to copy and to send to worker processes.
+
+Each candidate action is applied to copies of the world, followed by `depth` rounds of
+random attack, move, create or repair actions by the faction and its neighbours (the
+rivals with the most assets and bases in the same locations). The resulting worlds are
+scored with the weights in `Heuristic` and averaged. With a depth of 0, the action is
+scored by the heuristic alone. The rollouts are spread over a process pool.
+
+Approved decisions are applied to the real model by `AIController.apply`, through the rule
+methods of `FactionTurn`, after checking them against the current state. The GUI plans in the
+background with `RoundPlan`.
+"""
+
+import logging
+import os
+import threading
+import time
+from collections import Counter
+from dataclasses import dataclass, field, replace
+from functools import cache
+from math import ceil, floor
+from random import Random
+from typing import Self
+
+from src.base_of_influence import BaseOfInfluence
+from src.faction import Faction
+from src.lazy_import import lazy_import
+from src.location import Location
+from src.spatial_index import SpatialIndex
+from src.system import (
+    QUALITY,
+    AssetPrototype,
+    AssetType,
+    asset_catalog,
+    catalog_settings,
+    configure_catalog,
+)
+from src.turn import FactionTurn
+
+# The process pool pulls in multiprocessing, only import it when planning
+futures = lazy_import("concurrent.futures")
+multiprocessing = lazy_import("multiprocessing")
+
+logger = logging.getLogger(__name__)
+
+TurnFSM = FactionTurn.TurnFSM
+
+# Score of a faction that has been destroyed
+DESTROYED_SCORE = -1000.0
+
+
+@dataclass(frozen=True, slots=True)
+class Heuristic:
+    """Weights of the world score of a faction."""
+
+    hp: float = 2.0
+    treasure: float = 1.0
+    # Per Treasure of purchase cost, scaled by the asset's remaining hit points
+    assets: float = 1.5
+    # Per hit point of the faction's bases of influence
+    bases: float = 0.5
+    # Subtracted per point of the neighbouring rivals' average score
+    rivals: float = 0.5
+
+
+@dataclass(frozen=True, slots=True)
+class AISettings:
+    """AI controller settings, read from the `ai` section of config.yaml."""
+
+    # Number of scored samples per candidate action
+    rollouts: int = 6
+    # Rounds played out after the action, 0 to only use the heuristic
+    depth: int = 1
+    # Max number of candidate actions scored per faction
+    candidates: int = 16
+    # Max number of neighbouring rivals simulated in the rollouts
+    rivals: int = 4
+    # Worker processes, 0 for one per CPU and 1 to run in the GUI process
+    workers: int = 0
+    heuristic: Heuristic = field(default_factory=Heuristic)
+
+    @staticmethod
+    def from_config(config_data: dict) -> "AISettings":
+        config_ai: dict = config_data.get("ai", {})
+        defaults = AISettings()
+        return AISettings(
+            rollouts=config_ai.get("rollouts", defaults.rollouts),
+            depth=config_ai.get("depth", defaults.depth),
+            candidates=config_ai.get("candidates", defaults.candidates),
+            rivals=config_ai.get("rivals", defaults.rivals),
+            workers=config_ai.get("workers", defaults.workers),
+            heuristic=Heuristic(**config_ai.get("weights", {})),
+        )
+
+
+@dataclass(frozen=True, slots=True)
+class Decision:
+    """A faction's main action, referring to assets, bases and locations by uuid."""
+
+    faction: str  # uuid
+    # One of the ACTION_* states, or POST_ACTION to skip the main action
+    state: FactionTurn.TurnFSM
+    # Per action: (attacker, target), (asset, location) for moves, (asset or faction, None)
+    # for repairs, (location, None) for expand, (prototype id, location) for create, and
+    # (asset, None) for hide and sell
+    targets: tuple[tuple[str, str | None], ...] = ()
+    # Hit points of the new base, for expand
+    amount: int = 0
+    score: float = 0.0
+
+    def describe(self: Self, names: dict[str, str]) -> str:
+        """Describe the action, with uuids looked up in `names`."""
+
+        def name(key: str) -> str:
+            return names.get(key, key)
+
+        match self.state:
+            case TurnFSM.ACTION_ATTACK:
+                pairs = [f"{name(atk)} -> {name(tgt)}" for atk, tgt in self.targets]
+                return f"Attack: {', '.join(pairs)}"
+            case TurnFSM.ACTION_MOVE_ASSET:
+                pairs = [f"{name(asset)} to {name(loc)}" for asset, loc in self.targets]
+                return f"Move {', '.join(pairs)}"
+            case TurnFSM.ACTION_REPAIR_ASSET:
+                return f"Repair {', '.join(name(target) for target, _ in self.targets)}"
+            case TurnFSM.ACTION_EXPAND_INFLUENCE:
+                return f"Expand influence to {name(self.targets[0][0])} ({self.amount} HP)"
+            case TurnFSM.ACTION_CREATE_ASSET:
+                ident, loc = self.targets[0]
+                return f"Create {_prototype(ident)} at {name(loc)}"
+            case TurnFSM.ACTION_HIDE_ASSET:
+                return f"Hide {', '.join(name(asset) for asset, _ in self.targets)}"
+            case TurnFSM.ACTION_SELL_ASSET:
+                return f"Sell {', '.join(name(asset) for asset, _ in self.targets)}"
+            case _:
+                return "Skip main action"
+
+
+def _prototype(ident: str) -> AssetPrototype:
+    return asset_catalog().by_id[ident]
+
+
+# Simulated world
+
+
+@dataclass(slots=True)
+class SimFaction:
+    uuid: str
+    cunning: int
+    force: int
+    wealth: int
+    magic: int
+    treasure: int
+    hp: int
+    max_hp: int
+    paralyzed: bool = False
+    repaired: bool = False
+
+    def clone(self: Self) -> "SimFaction":
+        return SimFaction(
+            self.uuid,
+            self.cunning,
+            self.force,
+            self.wealth,
+            self.magic,
+            self.treasure,
+            self.hp,
+            self.max_hp,
+            self.paralyzed,
+            self.repaired,
+        )
+
+    def attribute(self: Self, asset_type: AssetType) -> int:
+        match asset_type:
+            case AssetType.CUNNING:
+                return self.cunning
+            case AssetType.FORCE:
+                return self.force
+            case AssetType.WEALTH:
+                return self.wealth
+            case _:
+                return 0
+
+
+@dataclass(slots=True)
+class SimAsset:
+    uuid: str
+    owner: str
+    prototype: str  # id
+    hp: int
+    loc: str | None
+    stealth: bool
+    repair_cost: int = 1
+
+    def clone(self: Self) -> "SimAsset":
+        return SimAsset(
+            self.uuid, self.owner, self.prototype, self.hp, self.loc, self.stealth, self.repair_cost
+        )
+
+
+@dataclass(slots=True)
+class SimBase:
+    uuid: str
+    owner: str
+    loc: str | None
+    hp: int
+
+    def clone(self: Self) -> "SimBase":
+        return SimBase(self.uuid, self.owner, self.loc, self.hp)
+
+
+class SimWorld:
+    """Compact copy of the factions, assets and bases, for simulating actions."""
+
+    def __init__(
+        self: Self,
+        factions: dict[str, SimFaction],
+        assets: dict[str, SimAsset],
+        bases: dict[str, SimBase],
+        locations: list[str],
+    ) -> None:
+        """Initialize SimWorld object."""
+        self.factions = factions
+        self.assets = assets
+        self.bases = bases
+        self.locations = locations
+
+    @staticmethod
+    def from_model(factions: list[Faction], locations: list[Location]) -> "SimWorld":
+        """Copy the model into a SimWorld. Uninitialized assets are left out."""
+        sim_factions: dict[str, SimFaction] = {}
+        sim_assets: dict[str, SimAsset] = {}
+        sim_bases: dict[str, SimBase] = {}
+        for faction in factions:
+            sim_factions[faction.uuid] = SimFaction(
+                uuid=faction.uuid,
+                cunning=faction.cunning,
+                force=faction.force,
+                wealth=faction.wealth,
+                magic=faction.magic.value,
+                treasure=faction.treasure,
+                hp=faction.hp,
+                max_hp=faction.max_hp(),
+                paralyzed=faction.goal_change_paralysis,
+            )
+            for asset in faction.assets:
+                if asset.is_initialized():
+                    sim_assets[asset.uuid] = SimAsset(
+                        uuid=asset.uuid,
+                        owner=faction.uuid,
+                        prototype=asset.prototype.strings.id,
+                        hp=asset.hp,
+                        loc=asset.loc.uuid if asset.loc else None,
+                        stealth=asset.has_quality(QUALITY.Stealth),
+                        repair_cost=asset.repair_cost,
+                    )
+            for base in faction.bases:
+                sim_bases[base.uuid] = SimBase(
+                    uuid=base.uuid,
+                    owner=faction.uuid,
+                    loc=base.location.uuid if base.location else None,
+                    hp=base.hp,
+                )
+        return SimWorld(sim_factions, sim_assets, sim_bases, [loc.uuid for loc in locations])
+
+    def copy(self: Self) -> "SimWorld":
+        return SimWorld(
+            {uuid: faction.clone() for uuid, faction in self.factions.items()},
+            {uuid: asset.clone() for uuid, asset in self.assets.items()},
+            {uuid: base.clone() for uuid, base in self.bases.items()},
+            self.locations,
+        )
+
+    def assets_of(self: Self, owner: str) -> list[SimAsset]:
+        return [asset for asset in self.assets.values() if asset.owner == owner]
+
+    def bases_of(self: Self, owner: str) -> list[SimBase]:
+        return [base for base in self.bases.values() if base.owner == owner]
+
+    def _overlap(self: Self, owner: str) -> Counter[str]:
+        """Count the assets and bases of each rival in the locations where `owner` is."""
+        entities = [*self.assets.values(), *self.bases.values()]
+        locs = {entity.loc for entity in entities if entity.owner == owner and entity.loc}
+        return Counter(
+            entity.owner for entity in entities if entity.loc in locs and entity.owner != owner
+        )
+
+    def neighbours(self: Self, owner: str) -> set[str]:
+        """Return the rival factions with assets or bases where `owner` has any."""
+        return set(self._overlap(owner))
+
+    def local(self: Self, owner: str, max_rivals: int) -> "SimWorld":
+        """
+        Return the part of the world around a faction.
+
+        The local world holds the faction and the `max_rivals` rivals with the most assets
+        and bases in its locations. Records are shared with this world, so copy the local
+        world before changing it.
+        """
+        keep = {owner} | {rival for rival, _ in self._overlap(owner).most_common(max_rivals)}
+        return SimWorld(
+            {uuid: faction for uuid, faction in self.factions.items() if uuid in keep},
+            {uuid: asset for uuid, asset in self.assets.items() if asset.owner in keep},
+            {uuid: base for uuid, base in self.bases.items() if base.owner in keep},
+            self.locations,
+        )
+
+    def value(self: Self, owner: str, heuristic: Heuristic) -> float:
+        """Score the position of a single faction."""
+        faction = self.factions[owner]
+        if faction.hp <= 0:
+            return DESTROYED_SCORE
+        asset_value = 0.0
+        for asset in self.assets_of(owner):
+            prototype = _prototype(asset.prototype)
+            asset_value += prototype.requirements.cost * asset.hp / prototype.stats.max_hp
+        base_hp = sum(base.hp for base in self.bases_of(owner))
+        return (
+            heuristic.hp * faction.hp
+            + heuristic.treasure * faction.treasure
+            + heuristic.assets * asset_value
+            + heuristic.bases * base_hp
+        )
+
+    def score(self: Self, owner: str, heuristic: Heuristic) -> float:
+        """Score a faction's position relative to its neighbours."""
+        score = self.value(owner, heuristic)
+        rivals = self.neighbours(owner)
+        if rivals:
+            rival_total = sum(self.value(rival, heuristic) for rival in rivals)
+            score -= heuristic.rivals * rival_total / len(rivals)
+        return score
+
+    # Rules, mirroring FactionTurn
+
+    def start_turn(self: Self, owner: str) -> None:
+        """Gain treasure and pay upkeep."""
+        faction = self.factions[owner]
+        faction.treasure += ceil(faction.wealth / 2 + (faction.force + faction.cunning) / 4)
+        upkeep = 0
+        counts = dict.fromkeys(AssetType, 0)
+        for asset in self.assets_of(owner):
+            asset.repair_cost = 1
+            prototype = _prototype(asset.prototype)
+            upkeep += prototype.stats.upkeep
+            counts[prototype.type] += 1
+        for asset_type, count in counts.items():
+            upkeep += max(0, count - faction.attribute(asset_type))
+        faction.treasure -= min(faction.treasure, upkeep)
+        faction.repaired = False
+
+    def _weakest_target(self: Self, loc: str, owner: str) -> SimAsset | SimBase | None:
+        """Pick the rival asset or base with the fewest hit points in a location."""
+        targets = [
+            asset
+            for asset in self.assets.values()
+            if asset.loc == loc and asset.owner != owner and not asset.stealth
+        ]
+        targets.extend(
+            base for base in self.bases.values() if base.loc == loc and base.owner != owner
+        )
+        return min(targets, key=lambda target: target.hp, default=None)
+
+    def legal_actions(self: Self, owner: str, rng: Random, limit: int) -> list[Decision]:
+        """
+        List candidate main actions for a faction, skipping the main action first.
+
+        If there are more than `limit` candidates, a random selection is returned.
+        """
+        faction = self.factions[owner]
+        actions = [Decision(owner, TurnFSM.POST_ACTION)]
+        if faction.paralyzed or faction.hp <= 0:
+            return actions
+        assets = self.assets_of(owner)
+        base_locs = {base.loc for base in self.bases_of(owner) if base.loc}
+        rival_base_locs = {base.loc for base in self.bases.values() if base.owner != owner}
+
+        attack = self._attack_decision(owner, assets)
+        if attack:
+            actions.append(attack)
+
+        # Move: armed assets towards rival bases, the others back to the faction's bases
+        for asset in assets:
+            armed = _prototype(asset.prototype).stats.atk_type is not None
+            for loc in (rival_base_locs if armed else base_locs) - {asset.loc}:
+                actions.append(Decision(owner, TurnFSM.ACTION_MOVE_ASSET, ((asset.uuid, loc),)))
+
+        repair = self._repair_decision(owner, assets)
+        if repair:
+            actions.append(repair)
+
+        # Expand: half the faction's treasure on a base where it has assets but no base
+        if faction.treasure > 0:
+            base_hp = max(1, faction.treasure // 2)
+            for loc in {asset.loc for asset in assets if asset.loc} - base_locs:
+                actions.append(
+                    Decision(owner, TurnFSM.ACTION_EXPAND_INFLUENCE, ((loc, None),), base_hp)
+                )
+
+        # Create: any affordable asset at any of the faction's bases
+        for prototype in _buyable(faction):
+            for loc in base_locs:
+                actions.append(
+                    Decision(owner, TurnFSM.ACTION_CREATE_ASSET, ((prototype.strings.id, loc),))
+                )
+
+        # Hide: the most valuable assets the faction can afford to hide
+        if (
+            faction.cunning >= FactionTurn.HIDE_ACTION_CUNNING_REQUIREMENT
+            and faction.treasure >= FactionTurn.HIDE_ACTION_COST
+        ):
+            hideable = [
+                asset
+                for asset in assets
+                if not asset.stealth and asset.loc and asset.loc not in rival_base_locs
+            ]
+            hideable.sort(key=lambda asset: _prototype(asset.prototype).requirements.cost)
+            count = faction.treasure // FactionTurn.HIDE_ACTION_COST
+            if hideable:
+                hidden = tuple((asset.uuid, None) for asset in hideable[-count:])
+                actions.append(Decision(owner, TurnFSM.ACTION_HIDE_ASSET, hidden))
+
+        # Sell: any single asset
+        for asset in assets:
+            actions.append(Decision(owner, TurnFSM.ACTION_SELL_ASSET, ((asset.uuid, None),)))
+
+        if len(actions) > limit:
+            actions = actions[:1] + rng.sample(actions[1:], max(0, limit - 1))
+        return actions
+
+    def random_action(self: Self, owner: str, rng: Random) -> Decision:
+        """Pick a random attack, move, create or repair action, as the rollout policy."""
+        faction = self.factions[owner]
+        skip = Decision(owner, TurnFSM.POST_ACTION)
+        if faction.paralyzed or faction.hp <= 0:
+            return skip
+        assets = self.assets_of(owner)
+        match rng.randrange(4):
+            case 0:
+                return self._attack_decision(owner, assets) or skip
+            case 1:
+                if not assets:
+                    return skip
+                asset = rng.choice(assets)
+                if _prototype(asset.prototype).stats.atk_type is not None:
+                    bases = [base for base in self.bases.values() if base.owner != owner]
+                else:
+                    bases = self.bases_of(owner)
+                if bases:
+                    loc = rng.choice(bases).loc
+                    return Decision(owner, TurnFSM.ACTION_MOVE_ASSET, ((asset.uuid, loc),))
+            case 2:
+                bases = self.bases_of(owner)
+                buyable = _buyable(faction)
+                if bases and buyable:
+                    ident = rng.choice(buyable).strings.id
+                    loc = rng.choice(bases).loc
+                    return Decision(owner, TurnFSM.ACTION_CREATE_ASSET, ((ident, loc),))
+            case _:
+                return self._repair_decision(owner, assets) or skip
+        return skip
+
+    def _attack_decision(self: Self, owner: str, assets: list[SimAsset]) -> Decision | None:
+        """Every armed asset attacks the weakest visible rival in its location."""
+        attacks = []
+        for asset in assets:
+            stats = _prototype(asset.prototype).stats
+            if asset.loc is None or not (stats.atk_type and stats.def_type and stats.damage):
+                continue
+            target = self._weakest_target(asset.loc, owner)
+            if target:
+                attacks.append((asset.uuid, target.uuid))
+        if attacks:
+            return Decision(owner, TurnFSM.ACTION_ATTACK, tuple(attacks))
+        return None
+
+    def _repair_decision(self: Self, owner: str, assets: list[SimAsset]) -> Decision | None:
+        """Repair each damaged asset once, and the faction."""
+        faction = self.factions[owner]
+        if faction.treasure <= 0:
+            return None
+        repairs = [(asset.uuid, None) for asset in assets if asset.hp < _max_hp(asset)]
+        if faction.hp < faction.max_hp:
+            repairs.append((owner, None))
+        if repairs:
+            return Decision(owner, TurnFSM.ACTION_REPAIR_ASSET, tuple(repairs))
+        return None
+
+    def apply(self: Self, decision: Decision, rng: Random) -> None:
+        """Apply a decision. Targets that no longer exist are skipped."""
+        faction = self.factions[decision.faction]
+        match decision.state:
+            case TurnFSM.ACTION_ATTACK:
+                for attacker_id, target_id in decision.targets:
+                    attacker = self.assets.get(attacker_id)
+                    target = self.assets.get(target_id) or self.bases.get(target_id)
+                    if attacker and target:
+                        self._attack(faction, attacker, target, rng)
+            case TurnFSM.ACTION_MOVE_ASSET:
+                for asset_id, loc in decision.targets:
+                    if asset_id in self.assets:
+                        self.assets[asset_id].loc = loc
+            case TurnFSM.ACTION_REPAIR_ASSET:
+                for target_id, _ in decision.targets:
+                    if target_id == faction.uuid:
+                        self._repair_faction(faction)
+                    elif target_id in self.assets:
+                        self._repair_asset(faction, self.assets[target_id])
+            case TurnFSM.ACTION_EXPAND_INFLUENCE:
+                loc = decision.targets[0][0]
+                if 0 < decision.amount <= faction.treasure:
+                    faction.treasure -= decision.amount
+                    uuid = f"sim-{rng.getrandbits(64):x}"
+                    self.bases[uuid] = SimBase(uuid, faction.uuid, loc, decision.amount)
+            case TurnFSM.ACTION_CREATE_ASSET:
+                ident, loc = decision.targets[0]
+                prototype = _prototype(ident)
+                if prototype.requirements.cost <= faction.treasure:
+                    faction.treasure -= prototype.requirements.cost
+                    uuid = f"sim-{rng.getrandbits(64):x}"
+                    stealth = bool(prototype.stats.quality_mask & QUALITY.Stealth.mask)
+                    self.assets[uuid] = SimAsset(
+                        uuid, faction.uuid, ident, prototype.stats.max_hp, loc, stealth
+                    )
+            case TurnFSM.ACTION_HIDE_ASSET:
+                for asset_id, _ in decision.targets:
+                    if asset_id in self.assets and faction.treasure >= FactionTurn.HIDE_ACTION_COST:
+                        faction.treasure -= FactionTurn.HIDE_ACTION_COST
+                        self.assets[asset_id].stealth = True
+            case TurnFSM.ACTION_SELL_ASSET:
+                for asset_id, _ in decision.targets:
+                    asset = self.assets.pop(asset_id, None)
+                    if asset:
+                        prototype = _prototype(asset.prototype)
+                        if asset.hp >= prototype.stats.max_hp:
+                            faction.treasure += floor(prototype.requirements.cost / 2)
+        faction.paralyzed = False
+
+    def _attack(
+        self: Self,
+        faction: SimFaction,
+        attacker: SimAsset,
+        target: SimAsset | SimBase,
+        rng: Random,
+    ) -> None:
+        stats = _prototype(attacker.prototype).stats
+        defender = self.factions[target.owner]
+        attack_roll = rng.randint(1, 10) + faction.attribute(stats.atk_type)
+        defense_roll = rng.randint(1, 10) + defender.attribute(stats.def_type)
+        if attack_roll > defense_roll:
+            self._damage(target, stats.damage.roll(rng))
+        elif isinstance(target, SimAsset):
+            counter = _prototype(target.prototype).stats.counter
+            if counter:
+                self._damage(attacker, counter.roll(rng))
+
+    def _damage(self: Self, target: SimAsset | SimBase, damage: int) -> None:
+        if isinstance(target, SimBase):
+            damage = min(damage, target.hp)
+            self.factions[target.owner].hp -= damage
+        target.hp -= damage
+        if target.hp <= 0:
+            if isinstance(target, SimBase):
+                self.bases.pop(target.uuid, None)
+            else:
+                self.assets.pop(target.uuid, None)
+
+    @staticmethod
+    def _repair_asset(faction: SimFaction, asset: SimAsset) -> None:
+        if faction.treasure < asset.repair_cost:
+            return
+        faction.treasure -= asset.repair_cost
+        prototype = _prototype(asset.prototype)
+        repair_amount = ceil(faction.attribute(prototype.type) / 2)
+        asset.hp = min(prototype.stats.max_hp, asset.hp + repair_amount)
+        asset.repair_cost += 1
+
+    @staticmethod
+    def _repair_faction(faction: SimFaction) -> None:
+        if faction.repaired or faction.treasure < FactionTurn.FACTION_REPAIR_COST:
+            return
+        attributes = (faction.cunning, faction.force, faction.wealth)
+        faction.treasure -= FactionTurn.FACTION_REPAIR_COST
+        faction.hp = min(faction.max_hp, faction.hp + ceil((max(attributes) + min(attributes)) / 2))
+        faction.repaired = True
+
+
+def _max_hp(asset: SimAsset) -> int:
+    return _prototype(asset.prototype).stats.max_hp
+
+
+def _buyable(faction: SimFaction) -> list[AssetPrototype]:
+    """Return the assets a faction meets the requirements for and can afford."""
+    prototypes = _buyable_prototypes(
+        asset_catalog().hash, faction.cunning, faction.force, faction.wealth, faction.magic
+    )
+    return [
+        prototype for prototype in prototypes if prototype.requirements.cost <= faction.treasure
+    ]
+
+
+@cache
+def _buyable_prototypes(
+    catalog_hash: str,  # noqa: ARG001, only part of the cache key
+    cunning: int,
+    force: int,
+    wealth: int,
+    magic: int,
+) -> list[AssetPrototype]:
+    attributes = {AssetType.CUNNING: cunning, AssetType.FORCE: force, AssetType.WEALTH: wealth}
+    return [
+        prototype
+        for prototype in asset_catalog().prototypes
+        if prototype.requirements.magic_level.value <= magic
+        and prototype.requirements.tier <= attributes[prototype.type]
+    ]
+
+
+# Scoring, also run in worker processes
+
+
+def _init_worker(settings: dict) -> None:
+    configure_catalog(**settings)
+
+
+def _rollout(
+    world: SimWorld, owner: str, decision: Decision, settings: AISettings, rng: Random
+) -> float:
+    """Apply a decision to a copy of the world, play out `depth` rounds and score the result."""
+    world = world.copy()
+    world.apply(decision, rng)
+    actors = sorted(world.neighbours(owner) | {owner})
+    for _ in range(settings.depth):
+        rng.shuffle(actors)
+        for actor in actors:
+            world.start_turn(actor)
+            world.apply(world.random_action(actor, rng), rng)
+    return world.score(owner, settings.heuristic)
+
+
+def _score_batch(
+    world: SimWorld, owner: str, decisions: list[Decision], settings: AISettings, seed: int
+) -> list[float]:
+    """Return the mean rollout score of each decision."""
+    rng = Random(seed)
+    scores = []
+    for decision in decisions:
+        total = sum(
+            _rollout(world, owner, decision, settings, rng) for _ in range(settings.rollouts)
+        )
+        scores.append(total / max(1, settings.rollouts))
+    return scores
+
+
+class AIController:
+    """Plans and applies the main actions of NPC factions."""
+
+    def __init__(self: Self, settings: AISettings = None, seed: int = None) -> None:
+        """Initialize AIController object."""
+        self.settings = settings or AISettings()
+        self.rng = Random(seed)
+        # Planned decisions, by faction uuid
+        self.plans: dict[str, Decision] = {}
+        self._pool: "futures.ProcessPoolExecutor" = None
+        self._workers = self.settings.workers or os.cpu_count() or 1
+
+    def close(self: Self) -> None:
+        """Shut down the worker processes."""
+        if self._pool:
+            self._pool.shutdown(cancel_futures=True)
+            self._pool = None
+
+    def _executor(self: Self) -> "futures.ProcessPoolExecutor | None":
+        if self._workers <= 1:
+            return None
+        if self._pool is None:
+            # Forking the GUI process would copy its logging and server threads' locks in
+            # whatever state they are in, so start the workers fresh
+            self._pool = futures.ProcessPoolExecutor(
+                max_workers=self._workers,
+                mp_context=multiprocessing.get_context("spawn"),
+                initializer=_init_worker,
+                initargs=(catalog_settings(),),
+            )
+        return self._pool
+
+    def decide(self: Self, world: SimWorld, owner: str) -> Decision:
+        """Pick the best scoring main action for a faction."""
+        world = world.local(owner, self.settings.rivals)
+        candidates = world.legal_actions(owner, self.rng, self.settings.candidates)
+        if len(candidates) == 1:
+            return candidates[0]
+        pool = self._executor()
+        if pool is None:
+            scores = _score_batch(world, owner, candidates, self.settings, self.rng.getrandbits(32))
+        else:
+            chunk_size = ceil(len(candidates) / self._workers)
+            pending = [
+                pool.submit(
+                    _score_batch,
+                    world,
+                    owner,
+                    candidates[start : start + chunk_size],
+                    self.settings,
+                    self.rng.getrandbits(32),
+                )
+                for start in range(0, len(candidates), chunk_size)
+            ]
+            scores = [score for future in pending for score in future.result()]
+        best = max(range(len(candidates)), key=scores.__getitem__)
+        return replace(candidates[best], score=scores[best])
+
+    def plan_round(
+        self: Self, turn: FactionTurn, factions: list[Faction], locations: list[Location]
+    ) -> dict[str, Decision]:
+        """
+        Plan the main action of every faction left in the turn order.
+
+        The factions are planned in turn order on one simulated world, each seeing the
+        expected outcome of the decisions before it. See `RoundPlan` to plan in the background.
+        """
+        self.plans = self._plan(*AIController._round_world(turn, factions, locations))
+        return self.plans
+
+    @staticmethod
+    def _round_world(
+        turn: FactionTurn, factions: list[Faction], locations: list[Location]
+    ) -> tuple[SimWorld, list[tuple[str, bool]]]:
+        """Copy the world, and list the factions left to plan and if they start a turn."""
+        world = SimWorld.from_model(factions, locations)
+        owners = []
+        for idx in range(turn.cur_faction, len(turn.turn_order)):
+            owner = turn.turn_order[idx].uuid
+            if idx == turn.cur_faction:
+                # The current faction may be past its main action already
+                if turn.state.value > TurnFSM.MAIN_ACTION.value:
+                    continue
+                # Or it may already have gained treasure and paid upkeep
+                owners.append((owner, turn.state.value < TurnFSM.SPECIAL_ABILITIES.value))
+            else:
+                owners.append((owner, True))
+        return world, owners
+
+    def _plan(self: Self, world: SimWorld, owners: list[tuple[str, bool]]) -> dict[str, Decision]:
+        start_time = time.perf_counter()
+        plans = {}
+        for owner, start_turn in owners:
+            if start_turn:
+                world.start_turn(owner)
+            decision = self.decide(world, owner)
+            world.apply(decision, self.rng)
+            plans[owner] = decision
+        logger.info(
+            f"Planned {len(plans)} faction actions in {time.perf_counter() - start_time:.2f}s"
+        )
+        return plans
+
+    def act(
+        self: Self,
+        faction: Faction,
+        turn: FactionTurn,
+        factions: list[Faction],
+        locations: list[Location],
+        index: SpatialIndex,
+    ) -> None:
+        """Take a faction's main action, as planned or else decided on the spot."""
+        decision = self.plans.pop(faction.uuid, None)
+        if decision is None:
+            decision = self.decide(SimWorld.from_model(factions, locations), faction.uuid)
+        self.apply(decision, turn, factions, locations, index)
+
+    def apply(
+        self: Self,
+        decision: Decision,
+        turn: FactionTurn,
+        factions: list[Faction],
+        locations: list[Location],
+        index: SpatialIndex,
+    ) -> None:
+        """
+        Apply a decision to the model.
+
+        A plan may be stale by the time it is approved, so each target is checked against the
+        current state first, with the same rules as `SimWorld.legal_actions`. Targets that no
+        longer exist or are no longer legal are skipped and logged.
+        """
+        owners = {faction.uuid: faction for faction in factions}
+        faction = owners[decision.faction]
+        # The faction's own assets, which are the only ones it can act with
+        own = {asset.uuid: asset for asset in faction.assets if asset.is_initialized()}
+        assets = {asset.uuid: asset for owner in factions for asset in owner.assets}
+        bases = {base.uuid: base for owner in factions for base in owner.bases}
+        locs = {loc.uuid: loc for loc in locations}
+        names = AIController.names(factions, locations)
+        skipped: list[str] = []
+
+        def skip(key: str, reason: str) -> None:
+            skipped.append(f"{names.get(key, key)} ({reason})")
+
+        if decision.state != TurnFSM.POST_ACTION and faction.goal_change_paralysis:
+            logger.warning(f"    {faction.name} changed goals and can't take a main action")
+            return
+        match decision.state:
+            case TurnFSM.ACTION_ATTACK:
+                for attacker_id, target_id in decision.targets:
+                    attacker = own.get(attacker_id)
+                    target = assets.get(target_id) or bases.get(target_id)
+                    # Either may have been destroyed by an earlier attack
+                    if not (attacker and target and attacker.hp > 0 and target.hp > 0):
+                        skip(attacker_id, "gone")
+                    elif not (
+                        attacker.prototype.stats.atk_type and attacker.prototype.stats.def_type
+                    ):
+                        skip(attacker_id, "can't attack")
+                    elif target.owner == faction.uuid or target.owner not in owners:
+                        skip(target_id, "not a rival")
+                    elif not isinstance(attacker.loc, Location) or attacker.loc != (
+                        target.location if isinstance(target, BaseOfInfluence) else target.loc
+                    ):
+                        skip(target_id, "not in the attacker's location")
+                    elif not isinstance(target, BaseOfInfluence) and target.has_quality(
+                        QUALITY.Stealth
+                    ):
+                        skip(target_id, "hidden")
+                    else:
+                        turn.attack(faction, attacker, target, owners, index)
+            case TurnFSM.ACTION_MOVE_ASSET:
+                moves = {}
+                for asset_id, loc_id in decision.targets:
+                    if asset_id in own and loc_id in locs:
+                        moves[own[asset_id]] = locs[loc_id]
+                    else:
+                        skip(asset_id, "gone")
+                turn.move_assets(moves, index)
+            case TurnFSM.ACTION_REPAIR_ASSET:
+                for target_id, _ in decision.targets:
+                    if target_id == faction.uuid:
+                        repaired = turn.repair_faction(faction, index)
+                    elif target_id in own:
+                        repaired = turn.repair_asset(faction, own[target_id], index)
+                    else:
+                        skip(target_id, "gone")
+                        continue
+                    if not repaired:
+                        skip(target_id, "can't afford or already repaired")
+            case TurnFSM.ACTION_EXPAND_INFLUENCE:
+                loc_id = decision.targets[0][0]
+                loc = locs.get(loc_id)
+                if loc is None or not index.assets(location=loc, owner=faction.uuid):
+                    skip(loc_id, "no assets there")
+                elif not turn.build_base(faction, loc, decision.amount, index):
+                    skip(loc_id, "can't afford")
+            case TurnFSM.ACTION_CREATE_ASSET:
+                ident, loc_id = decision.targets[0]
+                prototype = asset_catalog().by_id.get(ident)
+                loc = locs.get(loc_id)
+                buyable = _buyable_prototypes(
+                    asset_catalog().hash,
+                    faction.cunning,
+                    faction.force,
+                    faction.wealth,
+                    faction.magic.value,
+                )
+                if loc is None or not index.bases(location=loc, owner=faction.uuid):
+                    skip(loc_id, "no base there")
+                elif prototype not in buyable:
+                    skip(ident, "requirements not met")
+                elif not turn.create_asset(faction, prototype, loc, index):
+                    skip(ident, "can't afford")
+            case TurnFSM.ACTION_HIDE_ASSET:
+                for asset_id, _ in decision.targets:
+                    asset = own.get(asset_id)
+                    if faction.cunning < FactionTurn.HIDE_ACTION_CUNNING_REQUIREMENT:
+                        skip(asset_id, "Cunning too low")
+                    elif asset is None or not isinstance(asset.loc, Location):
+                        skip(asset_id, "gone")
+                    elif index.rival_bases(asset.loc, faction.uuid):
+                        skip(asset_id, "rival base there")
+                    elif not turn.hide_asset(faction, asset, index):
+                        skip(asset_id, "can't afford")
+            case TurnFSM.ACTION_SELL_ASSET:
+                selling = []
+                for asset_id, _ in decision.targets:
+                    if asset_id in own:
+                        selling.append(own[asset_id])
+                    else:
+                        skip(asset_id, "gone")
+                turn.sell_assets(faction, selling, index)
+        if decision.state != TurnFSM.POST_ACTION:
+            turn.action = decision.state
+        logger.info(f"    Main action: {decision.describe(names)}")
+        if skipped:
+            logger.warning(f"    Skipped, no longer legal: {', '.join(skipped)}")
+
+    @staticmethod
+    def names(factions: list[Faction], locations: list[Location]) -> dict[str, str]:
+        """Names of factions, assets, bases and locations by uuid, for `Decision.describe`."""
+        names = {loc.uuid: loc.name for loc in locations}
+        for faction in factions:
+            names[faction.uuid] = faction.name
+            for asset in faction.assets:
+                names[asset.uuid] = f"{asset}"
+            for base in faction.bases:
+                names[base.uuid] = f"{faction.name} base at {base.location}"
+        return names
+
+
+class RoundPlan:
+    """Plans a round in a background thread, for the GUI to poll."""
+
+    def __init__(
+        self: Self,
+        controller: AIController,
+        turn: FactionTurn,
+        factions: list[Faction],
+        locations: list[Location],
+    ) -> None:
+        """Initialize RoundPlan object and start planning."""
+        self.controller = controller
+        # The world is copied here, so the model can change while the rollouts run. The plans
+        # may be stale by then, which `AIController.apply` checks for.
+        self._world, self._owners = AIController._round_world(turn, factions, locations)
+        # The result once done, None on errors
+        self.plans: dict[str, Decision] | None = None
+        self._thread = threading.Thread(target=self._run, name="RoundPlan", daemon=True)
+        self._thread.start()
+
+    @property
+    def done(self: Self) -> bool:
+        return not self._thread.is_alive()
+
+    def _run(self: Self) -> None:
+        try:
+            self.plans = self.controller._plan(self._world, self._owners)
+        except Exception:
+            # E.g. the worker processes were shut down on exit
+            logger.exception("Error: Failed to plan the round")
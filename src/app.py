@@ -3,6 +3,11 @@ GUI Module.
 
 Responsible for setting up the GUI window using glfw, and handling the
 backend side of imgui rendering and event polling.
+
+With `headless: True` in the `ui` section of the config, no window or OpenGL context is
+created. Frames are built with `imgui.new_frame`/`imgui.render` as usual, but the draw data is
+dropped by a null renderer, so the cost of the GUI code can be measured on machines without a
+display, see `benchmarks/bench_render.py`.
 """
 
 import ctypes
@@ -10,14 +15,19 @@ import logging
 import sys
 from typing import Any, Self
 
-import glfw
-import OpenGL.GL as gl
-from imgui_bundle import imgui
-
 from src.layout_helper import LayoutHelper
+from src.lazy_import import lazy_import
+
+glfw = lazy_import("glfw")
+gl = lazy_import("OpenGL.GL")
+imgui = lazy_import("imgui_bundle.imgui")
+implot = lazy_import("imgui_bundle.implot")
 
 logger = logging.getLogger(__name__)
 
+# Time step of a headless frame, in seconds
+HEADLESS_FRAME_TIME = 1 / 60
+
 
 # Create the window that our GUI/visualization will be in
 def create_glfw_window(
@@ -56,6 +66,18 @@ def create_glfw_window(
     return window
 
 
+def _null_render(draw_data: "imgui.ImDrawData") -> None:
+    """Stand in for the renderer backend in headless mode. Nothing is drawn, textures are only marked as done."""  # noqa: E501
+    for texture in draw_data.textures or ():
+        if texture.status == imgui.ImTextureStatus.want_destroy:
+            texture.set_tex_id(0)
+            texture.set_status(imgui.ImTextureStatus.destroyed)
+        elif texture.status != imgui.ImTextureStatus.ok:
+            # Any id but 0, which means no texture
+            texture.set_tex_id(1)
+            texture.set_status(imgui.ImTextureStatus.ok)
+
+
 class App:
     """Class to handle the top level GUI window."""
 
@@ -68,15 +90,24 @@ class App:
         height = config_ui.get("height", 800)
 
         self.background_color = (0, 0, 0, 1)
+        self.headless: bool = config_ui.get("headless", False)
 
         # Create Window/Context and set up renderer
-        self.window = create_glfw_window(title=title, width=width, height=height)
-        gl.glClearColor(*self.background_color)
+        self.window = None
+        if not self.headless:
+            self.window = create_glfw_window(title=title, width=width, height=height)
+            gl.glClearColor(*self.background_color)
         imgui.create_context()
+        implot.create_context()
 
         self.io = imgui.get_io()
         self.io.config_flags |= imgui.ConfigFlags_.nav_enable_keyboard
         self.io.config_flags |= imgui.ConfigFlags_.docking_enable
+        if self.headless:
+            # Don't write imgui.ini, and take care of the font textures, see end_frame
+            self.io.set_ini_filename("")
+            self.io.display_size = imgui.ImVec2(width, height)
+            self.io.backend_flags |= imgui.BackendFlags_.renderer_has_textures
 
         self.io.fonts.add_font_from_file_ttf(
             filename="assets/fonts/FiraSans-Regular.ttf", size_pixels=16
@@ -112,6 +143,9 @@ class App:
         LayoutHelper.set_gui_color("slider_grab", color_primary_light)
         LayoutHelper.set_gui_color("title_bg_active", color_primary_light)
 
+        if self.headless:
+            return
+
         vsync: bool = config_ui.get("vsync", True)
         glfw.swap_interval(1 if vsync else 0)
 
@@ -126,10 +160,16 @@ class App:
 
     def is_open(self: Self) -> bool:
         """Return True while the GUI window is open. Return False if the user quits the program."""
+        if self.headless:
+            return True
         return not glfw.window_should_close(self.window)
 
     def start_frame(self: Self) -> None:
         """Call at start of frame to handle imgui setup, memory readout and event polling."""
+        if self.headless:
+            self.io.delta_time = HEADLESS_FRAME_TIME
+            imgui.new_frame()
+            return
         glfw.poll_events()
         imgui.backends.opengl3_new_frame()
         imgui.backends.glfw_new_frame()
@@ -142,6 +182,9 @@ class App:
     def end_frame(self: Self) -> None:
         """Finalize drawing. Should be called at the end of each frame."""
         imgui.render()
+        if self.headless:
+            _null_render(imgui.get_draw_data())
+            return
 
         gl.glClearColor(*self.background_color)
         gl.glClear(gl.GL_COLOR_BUFFER_BIT)
@@ -151,8 +194,13 @@ class App:
 
     def close(self: Self) -> None:
         """Cleanup imgui and cleanly close down glfw."""
+        if self.headless:
+            implot.destroy_context()
+            imgui.destroy_context()
+            return
         imgui.backends.opengl3_shutdown()
         imgui.backends.glfw_shutdown()
+        implot.destroy_context()
         imgui.destroy_context()
 
         glfw.destroy_window(self.window)
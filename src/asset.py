@@ -1,13 +1,27 @@
 from typing import Self
 
-from imgui_bundle import imgui
 from yamlable import YamlAble, yaml_info
 
+from src.labels import LABELS
 from src.layout_helper import LayoutHelper
+from src.lazy_import import lazy_import
 from src.location import Location
 from src.quality import Quality
+from src.spatial_index import SpatialIndex
 from src.style import STYLE
-from src.system import QUALITY, AssetPrototype, AssetType, cunning_list, force_list, wealth_list
+from src.system import (
+    QUALITY,
+    AssetPrototype,
+    AssetType,
+    cunning_list,
+    force_list,
+    prototype_by_id,
+    qualities_from_mask,
+    quality_mask,
+    wealth_list,
+)
+
+imgui = lazy_import("imgui_bundle.imgui")
 
 
 @yaml_info(yaml_tag_ns="wwn")
@@ -19,7 +33,7 @@ class Asset(YamlAble):
         uuid: str,
         loc: Location = None,
         hp: int = 0,
-        qualities: list[Quality] = None,
+        qualities: list[Quality | str] = None,
         desc: str = "",
     ) -> None:
         """Instantiate Asset object."""
@@ -32,27 +46,30 @@ class Asset(YamlAble):
             self.prototype = AssetType(prototype)
         # Restore from str
         elif isinstance(prototype, str):
-            for c in cunning_list():
-                if prototype == c.strings.id:
-                    self.prototype = c
-            for f in force_list():
-                if prototype == f.strings.id:
-                    self.prototype = f
-            for w in wealth_list():
-                if prototype == w.strings.id:
-                    self.prototype = w
+            self.prototype = prototype_by_id(prototype) or prototype
         self.hp = hp
         self.loc = loc
-        self.qualities: list[Quality] = qualities
-        if qualities is None:
-            self.qualities = []
+        # Qualities are stored as a bitmask, see `Quality.mask`
+        self.quality_mask: int = 0
         self.init_from_prototype(self.prototype)
+        # Restored assets keep their saved hit points
+        if hp:
+            self.hp = hp
+        # Restored assets keep their saved qualities over those of the prototype
+        if qualities is not None:
+            self.quality_mask = quality_mask(qualities)
         # Temporary stats (note, not saved)
         self.repair_cost = 1
         self.move_target: Location = None
 
     def __to_yaml_dict__(self: Self) -> dict:
-        prototype = self.prototype.strings.id if self.is_initialized() else self.prototype.value
+        if self.is_initialized():
+            prototype = self.prototype.strings.id
+        elif isinstance(self.prototype, AssetType):
+            prototype = self.prototype.value
+        else:
+            # Unknown prototype id, kept as is
+            prototype = self.prototype
         loc = self.loc.uuid if self.loc else self.loc
         return {
             "uuid": self.uuid,
@@ -71,8 +88,25 @@ class Asset(YamlAble):
         self.prototype = prototype
         if self.is_initialized():
             self.hp = self.max_hp()
-            if prototype.stats.qualities:
-                self.qualities.extend(prototype.stats.qualities)
+            self.quality_mask |= prototype.stats.quality_mask
+
+    @property
+    def qualities(self: Self) -> list[Quality]:
+        """List view of the quality bitmask. Modify through add_quality/remove_quality."""
+        return qualities_from_mask(self.quality_mask)
+
+    @qualities.setter
+    def qualities(self: Self, qualities: list[Quality | str]) -> None:
+        self.quality_mask = quality_mask(qualities)
+
+    def has_quality(self: Self, quality: Quality) -> bool:
+        return bool(self.quality_mask & quality.mask)
+
+    def add_quality(self: Self, quality: Quality) -> None:
+        self.quality_mask |= quality.mask
+
+    def remove_quality(self: Self, quality: Quality) -> None:
+        self.quality_mask &= ~quality.mask
 
     def __repr__(self: Self) -> str:
         if self.is_initialized():
@@ -86,18 +120,24 @@ class Asset(YamlAble):
 
     def render_brief(self: Self) -> None:
         """Render a hoverable brief."""
-        imgui.text(f"{self}")
+        imgui.text(str(self))
         LayoutHelper.add_tooltip(
-            f"{self.desc}\n\nLocation: {self.loc}\n\nHP{self.hp}/{self.max_hp()}"
+            LABELS.text(
+                self.uuid,
+                "brief",
+                "{0.desc}\n\nLocation: {0.loc}\n\nHP{0.hp}/{0.prototype.stats.max_hp}",
+                self,
+            )
         )
 
-    def render(self: Self, idx: str, locations: list[Location]) -> None:
+    def render(self: Self, locations: list[Location], index: SpatialIndex) -> None:
         """Render asset in GUI."""
+        imgui.push_id(self.uuid)
         # Handle uninitialized assets
         if not self.is_initialized():
             # Create a combo box for selecting assets of a given type
             if imgui.begin_combo(
-                label=f"Select asset type##{idx}",
+                label="Select asset type",
                 preview_value="Asset type",
             ):
                 match self.prototype:
@@ -111,16 +151,19 @@ class Asset(YamlAble):
                         asset_list = []
                 for asset_prototype in asset_list:
                     _, selected = imgui.selectable(
-                        label=f"{asset_prototype.strings.name}##{idx}",
+                        label=asset_prototype.strings.name,
                         p_selected=False,
                     )
                     LayoutHelper.add_tooltip(asset_prototype.strings.rules)
                     if selected:
                         self.init_from_prototype(asset_prototype)
+                        index.update_asset(self)
                 imgui.end_combo()
         else:
-            _, self.desc = imgui.input_text_multiline(label=f"Description##{idx}", str=self.desc)
-            if imgui.begin_combo(label=f"Location##{self.uuid}", preview_value=f"{self.loc}"):
+            changed, self.desc = imgui.input_text_multiline(label="Description", str=self.desc)
+            if changed:
+                index.changed(self)
+            if imgui.begin_combo(label="Location", preview_value=str(self.loc)):
                 for loc in locations:
                     _, selected = imgui.selectable(
                         label=f"{loc}##{loc.uuid}",
@@ -128,40 +171,52 @@ class Asset(YamlAble):
                     )
                     LayoutHelper.add_tooltip(loc.desc)
                     if selected:
-                        if self.loc:
-                            self.loc.assets.remove(self)
-                        self.loc = loc
-                        loc.assets.append(self)
+                        index.move_asset(self, loc)
                 imgui.end_combo()
 
-            _, self.hp = imgui.input_int(label=f"HP##{idx}", v=self.hp)
+            edited, self.hp = imgui.input_int(label="HP", v=self.hp)
+            if edited:
+                index.changed(self)
             imgui.same_line()
-            imgui.text(f"/{self.max_hp()}")
-            imgui.text_wrapped(f"Damage: {self.prototype.strings.damage_formula}")
-            imgui.text_wrapped(f"Counter: {self.prototype.strings.counter_formula}")
-            imgui.text_wrapped(self.prototype.strings.rules)
+            imgui.text(LABELS.text(self.uuid, "max_hp", "/{0.stats.max_hp}", self.prototype))
+            strings = self.prototype.strings
+            imgui.text_wrapped(
+                LABELS.text(strings.id, "damage", "Damage: {0.damage_formula}", strings)
+            )
+            imgui.text_wrapped(
+                LABELS.text(strings.id, "counter", "Counter: {0.counter_formula}", strings)
+            )
+            imgui.text_wrapped(strings.rules)
             if self.prototype.stats.upkeep:
-                imgui.text(f"Upkeep: {self.prototype.stats.upkeep}")
+                imgui.text(
+                    LABELS.text(strings.id, "upkeep", "Upkeep: {0.stats.upkeep}", self.prototype)
+                )
             # Qualities
             imgui.text("Qualities:")
-            if len(self.qualities) > 0:
-                rm_quality = -1
-                for q_idx, quality in enumerate(self.qualities):
+            qualities = self.qualities
+            if len(qualities) > 0:
+                rm_quality: Quality = None
+                for q_idx, quality in enumerate(qualities):
                     imgui.same_line()
                     imgui.text(quality.name)
                     LayoutHelper.add_tooltip(quality.rules)
                     if not quality.persistent:
                         imgui.same_line()
                         STYLE.button_color(STYLE.COL_RED)
-                        if imgui.button(f"X##rm_q_{idx}_{q_idx}", size=imgui.ImVec2(16, 20)):
-                            rm_quality = q_idx
+                        if imgui.button(
+                            LABELS.label(self.uuid, quality.id, "X"), size=imgui.ImVec2(16, 20)
+                        ):
+                            rm_quality = quality
                         STYLE.pop_color()
-                    if q_idx < len(self.qualities) - 1:
+                    if q_idx < len(qualities) - 1:
                         imgui.same_line()
-                if rm_quality >= 0:
-                    self.qualities.pop(rm_quality)
+                if rm_quality:
+                    self.remove_quality(rm_quality)
+                    index.update_asset(self)
 
-            if QUALITY.Stealth not in self.qualities:
+            if not self.has_quality(QUALITY.Stealth):
                 imgui.same_line()
-                if imgui.button(f"Add Stealth##{idx}"):
-                    self.qualities.append(QUALITY.Stealth)
+                if imgui.button("Add Stealth"):
+                    self.add_quality(QUALITY.Stealth)
+                    index.update_asset(self)
+        imgui.pop_id()
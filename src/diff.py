@@ -0,0 +1,132 @@
+"""
+Structural diffs between project snapshots.
+
+A project is compared as the flat records of `Project.records`: one per location, faction,
+asset and base of influence, plus the turn state. Records are matched by kind and uuid with a
+hash join, so a diff takes linear time. Only the old side is held in memory; the new side is
+streamed and changes are yielded as soon as they are found, with the removed records last.
+
+Either side can be a `Project`, loaded from a file or held by the GUI, or a `Snapshot` of
+one. A snapshot copies the records, so it keeps the state of the moment it was taken while
+the project goes on changing. Used by both the GUI and `cli.py diff`, so nothing here may
+import a GUI library.
+"""
+
+from collections.abc import Iterable, Iterator
+from dataclasses import dataclass
+from typing import Self
+
+from src.project import Project
+
+# Record key: (kind, uuid). The turn record has no uuid.
+RecordKey = tuple[str, str | None]
+
+
+@dataclass(frozen=True, slots=True)
+class Change:
+    """An added or removed record ("+", "-"), or a changed field of a record ("~")."""
+
+    op: str
+    kind: str
+    uuid: str | None
+    # Name and uuid of the object, for display
+    label: str
+    # Changed field, with nested fields separated by dots, e.g. "tags.0.name"
+    field: str | None = None
+    old: object = None
+    new: object = None
+
+    def __str__(self: Self) -> str:
+        if self.op != "~":
+            return f"{self.op} {self.label}"
+        if isinstance(self.old, list) and isinstance(self.new, list):
+            return f"~ {self.label}: {self.field} {_list_change(self.old, self.new)}"
+        return f"~ {self.label}: {self.field} {self.old!r} -> {self.new!r}"
+
+    def to_dict(self: Self) -> dict:
+        data = {"op": self.op, "kind": self.kind, "uuid": self.uuid, "label": self.label}
+        if self.op == "~":
+            data.update(field=self.field, old=self.old, new=self.new)
+        return data
+
+
+class Snapshot:
+    """The records of a project, as they were when the snapshot was taken."""
+
+    def __init__(self: Self, records: Iterable[dict], turn_idx: int = 0) -> None:
+        """Initialize Snapshot object."""
+        self.by_key: dict[RecordKey, dict] = {_key(record): record for record in records}
+        self.turn_idx = turn_idx
+
+    @staticmethod
+    def from_project(project: Project) -> "Snapshot":
+        # The records are built from scratch, so they don't share any data with the project
+        return Snapshot(project.records(), turn_idx=project.turn.turn_idx)
+
+    def records(self: Self) -> Iterator[dict]:
+        return iter(self.by_key.values())
+
+
+def _key(record: dict) -> RecordKey:
+    return (record["kind"], record.get("uuid"))
+
+
+def _label(record: dict) -> str:
+    name = record.get("name") or record.get("prototype")
+    uuid = record.get("uuid")
+    if name and uuid:
+        return f"{record['kind']} {name} ({uuid})"
+    return f"{record['kind']} {name or uuid or ''}".rstrip()
+
+
+def _list_change(old: list, new: list) -> str:
+    """Describe the change of a list field by the items added and removed."""
+    try:
+        old_items, new_items = set(old), set(new)
+    except TypeError:
+        # Unhashable items, such as nested records
+        return f"{old!r} -> {new!r}"
+    added = [item for item in new if item not in old_items]
+    removed = [item for item in old if item not in new_items]
+    if not added and not removed:
+        return "reordered"
+    return " ".join([*(f"+{item!r}" for item in added), *(f"-{item!r}" for item in removed)])
+
+
+def _field_changes(
+    record: dict, old: dict, new: dict, label: str, prefix: str = ""
+) -> Iterator[Change]:
+    """Yield the changed fields of a record, descending into nested dicts."""
+    for name in dict.fromkeys([*new, *old]):
+        value, old_value = new.get(name), old.get(name)
+        if value == old_value:
+            continue
+        field = f"{prefix}{name}"
+        if isinstance(value, dict) and isinstance(old_value, dict):
+            yield from _field_changes(record, old_value, value, label, prefix=f"{field}.")
+        else:
+            yield Change(
+                "~", record["kind"], record.get("uuid"), label, field, old=old_value, new=value
+            )
+
+
+def diff_projects(old: Project | Snapshot, new: Project | Snapshot) -> Iterator[Change]:
+    """
+    Yield the differences between two projects or snapshots.
+
+    Records are matched by kind and uuid. Added records come first in the order of the new
+    project, interleaved with the changed fields, and the removed records last.
+    """
+    if isinstance(old, Snapshot):
+        # Popped from below, so the snapshot itself must be left alone
+        old_records = dict(old.by_key)
+    else:
+        old_records = {_key(record): record for record in old.records()}
+    for record in new.records():
+        old_record = old_records.pop(_key(record), None)
+        if old_record is None:
+            yield Change("+", record["kind"], record.get("uuid"), _label(record))
+        else:
+            yield from _field_changes(record, old_record, record, _label(record))
+    for record in old_records.values():
+        yield Change("-", record["kind"], record.get("uuid"), _label(record))
@@ -0,0 +1,301 @@
+"""
+Markov chain model of a faction's long-run economy.
+
+Each turn a faction gains Treasure, pays upkeep for its assets and excess assets, repairs
+itself if it is damaged and can pay for it, and may be attacked by the rival assets at its
+bases of influence. With the asset mix held fixed, a turn only depends on the faction's
+(Treasure, hp), so the economy is a Markov chain over those states, plus an absorbing state
+for a destroyed faction.
+
+The transition matrix is sparse, and kept as parallel numpy arrays of (from, to, probability)
+entries; a distribution over the states is stepped with `np.bincount`. This gives the exact
+distribution after N turns, including the chance of having missed an upkeep payment, and the
+long-run distribution of a surviving faction, without running simulations.
+
+Chains and their results are cached by `EconomyParams`, the signature of everything in a
+faction's asset mix that affects its economy, so factions with the same mix share the work.
+
+The model is deliberately simple: Treasure above the cap is assumed spent on new assets, the
+faction repairs itself whenever it is damaged, and incoming damage isn't capped by the hit
+points of the base it lands on, which makes the destruction risk an upper bound.
+"""
+
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Self
+
+from src.faction import Faction
+from src.lazy_import import lazy_import
+from src.spatial_index import SpatialIndex
+from src.turn import FactionTurn
+
+# numpy is only needed once a chain is built
+np = lazy_import("numpy")
+
+# Share of the mass kept in place per steady state iteration, to damp periodic chains
+STEADY_STATE_LAZINESS = 0.1
+
+
+@dataclass(frozen=True, slots=True)
+class EconomySettings:
+    """Assumptions of the economy model."""
+
+    # Chance that each armed rival asset at one of the faction's bases attacks it in a turn
+    attack_rate: float = 0.25
+    # Treasure above this is assumed spent, which keeps the chain finite
+    treasure_cap: int = 60
+    # Default forecast length in turns
+    turns: int = 10
+
+    @staticmethod
+    def from_config(config_data: dict) -> "EconomySettings":
+        config_economy: dict = config_data.get("economy", {})
+        defaults = EconomySettings()
+        return EconomySettings(
+            attack_rate=config_economy.get("attack_rate", defaults.attack_rate),
+            treasure_cap=config_economy.get("treasure_cap", defaults.treasure_cap),
+            turns=config_economy.get("turns", defaults.turns),
+        )
+
+
+def _success_chance(attack: int, defense: int) -> float:
+    """Chance that 1d10 + attack beats 1d10 + defense."""
+    wins = sum(1 for a in range(1, 11) for d in range(1, 11) if a + attack > d + defense)
+    return wins / 100
+
+
+@dataclass(frozen=True, slots=True)
+class EconomyParams:
+    """Signature of a faction's economy, used as the cache key of its Markov chain."""
+
+    gain: int
+    upkeep: int
+    max_hp: int
+    repair_amount: int
+    repair_cost: int
+    treasure_cap: int
+    # Probability of each amount of incoming damage per turn, indexed by damage
+    damage: tuple[float, ...]
+
+    @staticmethod
+    def from_faction(
+        faction: Faction,
+        owners: dict[str, Faction],
+        index: SpatialIndex,
+        settings: EconomySettings,
+    ) -> "EconomyParams":
+        """Derive the economy signature of a faction's current assets, bases and rivals."""
+        max_hp = max(1, faction.max_hp())
+        damage = np.array([1.0])
+        for base in faction.bases:
+            if base.location is None:
+                continue
+            for asset in index.rival_assets(base.location, faction.uuid):
+                attacker = owners.get(asset.owner)
+                if attacker is None or not asset.is_initialized():
+                    continue
+                stats = asset.prototype.stats
+                if stats.damage is None or stats.atk_type is None:
+                    continue
+                hit = settings.attack_rate * _success_chance(
+                    attacker.get_attribute(stats.atk_type), faction.get_attribute(stats.def_type)
+                )
+                asset_damage = hit * np.array(stats.damage.distribution())
+                asset_damage[0] += 1 - hit
+                damage = np.convolve(damage, asset_damage)
+                # Damage past the faction's hit points all ends the same way
+                if len(damage) > max_hp + 1:
+                    damage = np.append(damage[:max_hp], damage[max_hp:].sum())
+        return EconomyParams(
+            gain=faction.treasure_gain(),
+            upkeep=faction.upkeep_due(),
+            max_hp=max_hp,
+            repair_amount=FactionTurn.faction_repair_amount(faction),
+            repair_cost=FactionTurn.FACTION_REPAIR_COST,
+            treasure_cap=settings.treasure_cap,
+            # Rounded, so that equal mixes give equal keys
+            damage=tuple(round(float(prob), 12) for prob in damage),
+        )
+
+
+class EconomyChain:
+    """
+    Sparse transition matrix over (shortfall, Treasure, hp) states.
+
+    The shortfall flag records if the faction has ever missed (part of) an upkeep payment, and
+    is only tracked when `track_shortfall` is set; the steady state doesn't need it. Each flag
+    value has its own absorbing state for a destroyed faction, after the transient states.
+    """
+
+    def __init__(self: Self, params: EconomyParams, track_shortfall: bool = True) -> None:
+        """Build the transitions of the chain."""
+        self.params = params
+        self.flags = 2 if track_shortfall else 1
+        cap, max_hp = params.treasure_cap, params.max_hp
+        self.transient = self.flags * (cap + 1) * max_hp
+        self.size = self.transient + self.flags
+
+        flag, treasure, hp = (
+            grid.ravel()
+            for grid in np.meshgrid(
+                np.arange(self.flags), np.arange(cap + 1), np.arange(1, max_hp + 1), indexing="ij"
+            )
+        )
+        # Gain Treasure, then pay upkeep as far as possible
+        treasure = np.minimum(treasure + params.gain, cap)
+        # Missed upkeep in the turn starting from each transient state
+        self.shortfall = treasure < params.upkeep
+        treasure = treasure - np.minimum(treasure, params.upkeep)
+        if self.flags > 1:
+            flag = flag | self.shortfall
+        # Repair the faction when damaged
+        repair = (hp < max_hp) & (treasure >= params.repair_cost)
+        treasure = np.where(repair, treasure - params.repair_cost, treasure)
+        hp = np.where(repair, np.minimum(max_hp, hp + params.repair_amount), hp)
+        # Incoming damage, one transition per possible amount
+        damage = np.flatnonzero(np.array(params.damage))
+        probs = np.array(params.damage)[damage]
+        hp_after = np.repeat(hp, len(damage)) - np.tile(damage, len(hp))
+        flag = np.repeat(flag, len(damage))
+        treasure = np.repeat(treasure, len(damage))
+        targets = np.where(
+            hp_after > 0,
+            self.state(flag, treasure, np.maximum(hp_after, 1)),
+            self.transient + flag,
+        )
+        destroyed = np.arange(self.transient, self.size)
+        self.rows = np.concatenate([np.repeat(np.arange(self.transient), len(damage)), destroyed])
+        self.cols = np.concatenate([targets, destroyed])
+        self.probs = np.concatenate([np.tile(probs, self.transient), np.ones(self.flags)])
+
+    def state(self: Self, flag: int, treasure: int, hp: int) -> int:
+        """Index of a transient state. Also works elementwise on numpy arrays."""
+        return (flag * (self.params.treasure_cap + 1) + treasure) * self.params.max_hp + hp - 1
+
+    def step(self: Self, dist: "np.ndarray") -> "np.ndarray":
+        """Advance a distribution over the states by one turn."""
+        return np.bincount(self.cols, weights=dist[self.rows] * self.probs, minlength=self.size)
+
+    def start(self: Self, treasure: int, hp: int) -> "np.ndarray":
+        """Distribution concentrated on a single starting state."""
+        dist = np.zeros(self.size)
+        if hp <= 0:
+            dist[self.transient] = 1.0
+        else:
+            treasure = min(max(0, treasure), self.params.treasure_cap)
+            dist[self.state(0, treasure, min(hp, self.params.max_hp))] = 1.0
+        return dist
+
+    def marginals(self: Self, dist: "np.ndarray") -> tuple["np.ndarray", "np.ndarray"]:
+        """Treasure and hp distributions of the surviving faction, unnormalized."""
+        grid = dist[: self.transient].reshape(
+            self.flags, self.params.treasure_cap + 1, self.params.max_hp
+        )
+        hp = np.concatenate([[dist[self.transient :].sum()], grid.sum(axis=(0, 1))])
+        return grid.sum(axis=(0, 2)), hp
+
+
+@dataclass(frozen=True)
+class EconomyForecast:
+    """Exact distribution of a faction's economy after a number of turns."""
+
+    turns: int
+    # Probability of each Treasure amount while surviving; sums to 1 - destroyed[-1]
+    treasure: "np.ndarray"
+    # Probability of each hp value, index 0 for a destroyed faction
+    hp: "np.ndarray"
+    # Per turn from 0 to `turns`, chance of having missed an upkeep payment by then
+    shortfall: "np.ndarray"
+    # Per turn from 0 to `turns`, chance of having been destroyed by then
+    destroyed: "np.ndarray"
+
+    def expected_treasure(self: Self) -> float:
+        """Mean Treasure of the surviving faction."""
+        alive = self.treasure.sum()
+        return float(self.treasure @ np.arange(len(self.treasure)) / alive) if alive else 0.0
+
+
+@dataclass(frozen=True)
+class EconomySteadyState:
+    """Long-run distribution of a surviving faction's economy."""
+
+    treasure: "np.ndarray"
+    hp: "np.ndarray"  # index 0 is unused, and always 0
+    # Fraction of turns where the upkeep can't be paid in full
+    shortfall_rate: float
+    # Chance per turn of being destroyed
+    destroy_rate: float
+    # False if the iteration stopped before settling, e.g. for a faction that can never repair
+    converged: bool
+
+    def expected_treasure(self: Self) -> float:
+        return float(self.treasure @ np.arange(len(self.treasure)))
+
+
+@lru_cache(maxsize=64)
+def economy_chain(params: EconomyParams, track_shortfall: bool = True) -> EconomyChain:
+    """Return the (cached) Markov chain of an economy."""
+    return EconomyChain(params, track_shortfall)
+
+
+@lru_cache(maxsize=256)
+def forecast(params: EconomyParams, treasure: int, hp: int, turns: int) -> EconomyForecast:
+    """Distribution of the economy after `turns` turns, from the given Treasure and hp."""
+    chain = economy_chain(params)
+    dist = chain.start(treasure, hp)
+    shortfall_states = np.zeros(chain.size, dtype=bool)
+    shortfall_states[chain.transient // 2 : chain.transient] = True
+    shortfall_states[chain.transient + 1] = True
+    destroyed = [dist[chain.transient :].sum()]
+    shortfall = [0.0]
+    for _ in range(turns):
+        dist = chain.step(dist)
+        destroyed.append(dist[chain.transient :].sum())
+        shortfall.append(dist[shortfall_states].sum())
+    treasure_dist, hp_dist = chain.marginals(dist)
+    return EconomyForecast(
+        turns=turns,
+        treasure=treasure_dist,
+        hp=hp_dist,
+        shortfall=np.array(shortfall),
+        destroyed=np.array(destroyed),
+    )
+
+
+@lru_cache(maxsize=64)
+def steady_state(
+    params: EconomyParams, tolerance: float = 1e-8, max_iterations: int = 500
+) -> EconomySteadyState:
+    """
+    Long-run distribution of the economy, given that the faction survives.
+
+    This is the quasi-stationary distribution of the chain, found by power iteration that
+    renormalizes the surviving mass after each turn. The iteration steps a slightly lazy
+    version of the chain, which has the same fixed point but can't oscillate.
+    """
+    chain = economy_chain(params, track_shortfall=False)
+    dist = chain.start(params.treasure_cap, params.max_hp)[: chain.transient]
+    padding = np.zeros(chain.size - chain.transient)
+    converged = False
+    for _ in range(max_iterations):
+        stepped = chain.step(np.concatenate([dist, padding]))[: chain.transient]
+        stepped = STEADY_STATE_LAZINESS * dist + (1 - STEADY_STATE_LAZINESS) * stepped
+        stepped /= stepped.sum()
+        converged = np.abs(stepped - dist).sum() < tolerance
+        dist = stepped
+        if converged:
+            break
+    survival = chain.step(np.concatenate([dist, padding]))[: chain.transient].sum()
+    treasure_dist, hp_dist = chain.marginals(np.concatenate([dist, padding]))
+    return EconomySteadyState(
+        treasure=treasure_dist,
+        hp=hp_dist,
+        shortfall_rate=float(dist[chain.shortfall].sum()),
+        destroy_rate=float(1 - survival),
+        converged=bool(converged),
+    )
+
+
+def expected_damage(params: EconomyParams) -> float:
+    """Mean incoming damage per turn."""
+    return float(np.array(params.damage) @ np.arange(len(params.damage)))
@@ -0,0 +1,228 @@
+"""
+Structured turn event log.
+
+Turn events, such as treasure gained or assets created, are recorded as typed events and
+written to a newline-delimited JSON file, one event per line:
+
+```json
+{"type": "treasure_gained", "turn_idx": 3, "faction": "6f1c...", "amount": 4, "total": 12}
+```
+
+Use `read_events` to stream the events back without loading the whole file.
+"""
+
+import json
+from collections.abc import Callable, Iterable, Iterator
+from dataclasses import asdict, dataclass, fields
+from pathlib import Path
+from typing import ClassVar, Self
+
+DEFAULT_EVENTFILE = "Project/events.jsonl"
+
+
+@dataclass(frozen=True, slots=True)
+class Event:
+    """Base class of all turn events."""
+
+    # Name of the event type in the event file
+    kind: ClassVar[str] = "event"
+
+    turn_idx: int
+    faction: str  # uuid
+
+    def to_dict(self: Self) -> dict:
+        return {"type": self.kind, **asdict(self)}
+
+
+@dataclass(frozen=True, slots=True)
+class TreasureGained(Event):
+    kind: ClassVar[str] = "treasure_gained"
+
+    amount: int
+    total: int
+
+
+@dataclass(frozen=True, slots=True)
+class UpkeepPaid(Event):
+    kind: ClassVar[str] = "upkeep_paid"
+
+    amount: int
+    total: int
+
+
+@dataclass(frozen=True, slots=True)
+class AssetCreated(Event):
+    kind: ClassVar[str] = "asset_created"
+
+    asset: str  # uuid
+    prototype: str  # id
+    location: str  # uuid
+    cost: int
+
+
+@dataclass(frozen=True, slots=True)
+class AssetSold(Event):
+    kind: ClassVar[str] = "asset_sold"
+
+    asset: str  # uuid
+    prototype: str  # id
+    price: int
+
+
+@dataclass(frozen=True, slots=True)
+class AssetMoved(Event):
+    kind: ClassVar[str] = "asset_moved"
+
+    asset: str  # uuid
+    source: str | None  # location uuid
+    target: str  # location uuid
+
+
+@dataclass(frozen=True, slots=True)
+class AssetDamaged(Event):
+    kind: ClassVar[str] = "asset_damaged"
+
+    asset: str  # uuid of the asset or base of influence
+    owner: str  # faction uuid of the damaged asset
+    source: str  # faction uuid of the asset dealing the damage
+    prototype: str | None  # id, None for a base of influence
+    damage: int
+    hp: int
+
+
+@dataclass(frozen=True, slots=True)
+class AssetDestroyed(Event):
+    kind: ClassVar[str] = "asset_destroyed"
+
+    asset: str  # uuid of the asset or base of influence
+    owner: str  # faction uuid of the destroyed asset
+    source: str  # faction uuid of the asset dealing the damage
+    prototype: str | None  # id, None for a base of influence
+
+
+@dataclass(frozen=True, slots=True)
+class BaseBuilt(Event):
+    kind: ClassVar[str] = "base_built"
+
+    base: str  # uuid
+    location: str  # uuid
+    max_hp: int
+
+
+@dataclass(frozen=True, slots=True)
+class TreasureSpent(Event):
+    """Treasure spent outside of buying assets and bases, such as on bribes."""
+
+    kind: ClassVar[str] = "treasure_spent"
+
+    amount: int
+    purpose: str
+    total: int
+
+
+@dataclass(frozen=True, slots=True)
+class MainActionTaken(Event):
+    kind: ClassVar[str] = "main_action_taken"
+
+    action: str | None  # ACTION_* state name, None if the main action was skipped
+
+
+@dataclass(frozen=True, slots=True)
+class GoalCompleted(Event):
+    kind: ClassVar[str] = "goal_completed"
+
+    goal: str  # name
+    difficulty: int
+
+
+@dataclass(frozen=True, slots=True)
+class LevelUp(Event):
+    kind: ClassVar[str] = "level_up"
+
+    attribute: str  # CUNNING, FORCE or WEALTH
+    level: int
+    exp_cost: int
+
+
+EVENT_TYPES: dict[str, type[Event]] = {
+    cls.kind: cls
+    for cls in (
+        TreasureGained,
+        UpkeepPaid,
+        AssetCreated,
+        AssetSold,
+        AssetMoved,
+        AssetDamaged,
+        AssetDestroyed,
+        BaseBuilt,
+        TreasureSpent,
+        MainActionTaken,
+        GoalCompleted,
+        LevelUp,
+    )
+}
+
+
+def event_from_dict(data: dict) -> Event | None:
+    """Rebuild a typed event from its dict form. Returns None for unknown event types."""
+    cls = EVENT_TYPES.get(data.get("type"))
+    if cls is None:
+        return None
+    return cls(**{field.name: data.get(field.name) for field in fields(cls)})
+
+
+class EventLog:
+    """
+    Collects turn events and appends them to an event file.
+
+    Events are buffered in memory and written out by `flush`, which the turn logic calls at
+    the end of each round, so that no file I/O happens while individual states are drawn.
+    Subscribers are called with each event as it is emitted.
+    """
+
+    def __init__(self: Self, filename: str = DEFAULT_EVENTFILE) -> None:
+        """Initialize EventLog object."""
+        self.filename = filename
+        self._pending: list[str] = []
+        self._subscribers: list[Callable[[Event], None]] = []
+
+    def subscribe(self: Self, callback: Callable[[Event], None]) -> None:
+        """Call `callback` with every emitted event."""
+        self._subscribers.append(callback)
+
+    def emit(self: Self, event: Event) -> None:
+        """Record an event."""
+        self._pending.append(json.dumps(event.to_dict(), separators=(",", ":")))
+        for callback in self._subscribers:
+            callback(event)
+
+    def flush(self: Self) -> None:
+        """Append all pending events to the event file."""
+        if not self._pending:
+            return
+        path = Path(self.filename)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with path.open(mode="a", encoding="utf-8") as event_file:
+            event_file.write("\n".join(self._pending) + "\n")
+        self._pending.clear()
+
+
+def read_events(filename: str, kinds: Iterable[str] = None) -> Iterator[Event]:
+    """
+    Stream the events in an event file, one line at a time.
+
+    If `kinds` is given, only events of those types are returned. Lines that can't be parsed
+    and unknown event types are skipped.
+    """
+    wanted = set(kinds) if kinds is not None else None
+    with open(filename, encoding="utf-8") as event_file:
+        for line in event_file:
+            try:
+                data = json.loads(line)
+            except json.JSONDecodeError:
+                continue
+            if wanted is not None and data.get("type") not in wanted:
+                continue
+            event = event_from_dict(data)
+            if event is not None:
+                yield event
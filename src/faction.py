@@ -3,18 +3,22 @@ from random import randint
 from typing import Self
 from uuid import uuid4
 
-from imgui_bundle import imgui
 from yamlable import YamlAble, yaml_info
 
 from src.asset import Asset
 from src.base_of_influence import BaseOfInfluence
 from src.goal import Goal
+from src.labels import LABELS
 from src.layout_helper import LayoutHelper
+from src.lazy_import import lazy_import
 from src.location import Location
+from src.spatial_index import SpatialIndex
 from src.style import STYLE
 from src.system import AssetType, MagicLevel, goals_list
 from src.tag import Tag
 
+imgui = lazy_import("imgui_bundle.imgui")
+
 
 @yaml_info(yaml_tag_ns="wwn")
 class Faction(YamlAble):
@@ -52,6 +56,7 @@ class Faction(YamlAble):
         bases: list[BaseOfInfluence] = None,
         tags: list[Tag] = None,
         goal_change_paralysis: bool = False,
+        npc: bool = False,
     ) -> None:
         """Initialize Faction object."""
         self.name = name
@@ -86,6 +91,8 @@ class Faction(YamlAble):
             self.tags = []
         # Temporary variables
         self.goal_change_paralysis = goal_change_paralysis
+        # NPC factions can have their turns resolved automatically
+        self.npc: bool = npc
 
     def __to_yaml_dict__(self: Self) -> dict:
         return {
@@ -106,6 +113,7 @@ class Faction(YamlAble):
             "bases": self.bases,
             "tags": self.tags,
             "goal_change_paralysis": self.goal_change_paralysis,
+            "npc": self.npc,
         }
 
     def __repr__(self: Self) -> str:
@@ -201,76 +209,119 @@ class Faction(YamlAble):
             return nr_assets - limit
         return 0
 
-    def render(self: Self, idx: int, locations: list[Location]) -> None:
+    def upkeep_due(self: Self) -> int:
+        """Total upkeep to pay this turn, for assets and excess assets."""
+        upkeep = self.asset_upkeep()
+        for asset_type in [AssetType.CUNNING, AssetType.FORCE, AssetType.WEALTH]:
+            upkeep += self.asset_excess(asset_type)
+        return upkeep
+
+    def render(self: Self, locations: list[Location], index: SpatialIndex) -> None:
         """Render faction in GUI."""
-        _, self.name = imgui.input_text(label=f"Name##{idx}", str=self.name)
-        _, self.desc = imgui.input_text_multiline(label=f"Description##{idx}", str=self.desc)
+        # Labels are told apart by the uuid on the ID stack, so they can be plain strings
+        imgui.push_id(self.uuid)
+        # Edits are reported to the index subscribers, see `SpatialIndex.changed`
+        changed = False
+        edited, self.name = imgui.input_text(label="Name", str=self.name)
+        changed |= edited
+        edited, self.desc = imgui.input_text_multiline(label="Description", str=self.desc)
+        changed |= edited
+        edited, self.npc = imgui.checkbox(label="NPC", v=self.npc)
+        changed |= edited
+        LayoutHelper.add_tooltip("NPC faction turns can be resolved automatically.")
         LayoutHelper.add_spacer()
         imgui.text("PRIMARY ATTRIBUTES")
         # Attributes
-        _, self.cunning = imgui.slider_int(
-            label=f"Cunning##{idx}", v=self.cunning, v_min=1, v_max=Faction.MAX_ATTRIBUTE
+        edited, self.cunning = imgui.slider_int(
+            label="Cunning",
+            v=self.cunning,
+            v_min=1,
+            v_max=Faction.MAX_ATTRIBUTE,
         )
-        _, self.force = imgui.slider_int(
-            label=f"Force##{idx}", v=self.force, v_min=1, v_max=Faction.MAX_ATTRIBUTE
+        changed |= edited
+        edited, self.force = imgui.slider_int(
+            label="Force",
+            v=self.force,
+            v_min=1,
+            v_max=Faction.MAX_ATTRIBUTE,
         )
-        _, self.wealth = imgui.slider_int(
-            label=f"Wealth##{idx}", v=self.wealth, v_min=1, v_max=Faction.MAX_ATTRIBUTE
+        changed |= edited
+        edited, self.wealth = imgui.slider_int(
+            label="Wealth",
+            v=self.wealth,
+            v_min=1,
+            v_max=Faction.MAX_ATTRIBUTE,
         )
-        _, magic_value = imgui.combo(
-            label=f"Magic##{idx}",
+        changed |= edited
+        edited, magic_value = imgui.combo(
+            label="Magic",
             current_item=self.magic.value,
             items=[x.name for x in MagicLevel],
         )
+        changed |= edited
         self.magic = MagicLevel(magic_value)
         LayoutHelper.add_spacer()
         # Secondary attributes
         imgui.text("SECONDARY ATTRIBUTES")
-        _, self.hp = imgui.input_int(
-            label=f"HP##{idx}", v=self.hp, flags=imgui.InputTextFlags_.chars_decimal
+        edited, self.hp = imgui.input_int(
+            label="HP",
+            v=self.hp,
+            flags=imgui.InputTextFlags_.chars_decimal,
         )
+        changed |= edited
         imgui.same_line()
-        imgui.text(f"/ {self.max_hp()}")
-        _, self.treasure = imgui.input_int(
-            label=f"Treasure##{idx}", v=self.treasure, flags=imgui.InputTextFlags_.chars_decimal
+        imgui.text(LABELS.format(self.uuid, "max_hp", "/ {}", self.max_hp()))
+        edited, self.treasure = imgui.input_int(
+            label="Treasure",
+            v=self.treasure,
+            flags=imgui.InputTextFlags_.chars_decimal,
         )
-        _, self.exp = imgui.input_int(
-            label=f"Exp##{idx}", v=self.exp, flags=imgui.InputTextFlags_.chars_decimal
-        )
-        _, self.notes = imgui.input_text_multiline(
-            label=f"Faction Notes##Faction_{self.uuid}", str=self.notes
+        changed |= edited
+        edited, self.exp = imgui.input_int(
+            label="Exp",
+            v=self.exp,
+            flags=imgui.InputTextFlags_.chars_decimal,
         )
+        changed |= edited
+        edited, self.notes = imgui.input_text_multiline(label="Faction Notes", str=self.notes)
+        changed |= edited
         LayoutHelper.add_spacer()
         # Render Tags
         tags_open = imgui.collapsing_header(
-            f"TAGS ({len(self.tags)})##{idx}",
+            LABELS.format(self.uuid, "tags", "TAGS ({})###tags", len(self.tags)),
             flags=imgui.TreeNodeFlags_.default_open,
         )
         if tags_open:
             rm_tag = -1
             # Add new tag
-            if imgui.button(f"Add Tag##{idx}"):
+            if imgui.button("Add Tag"):
                 self.tags.append(Tag(prototype=None))
+                changed = True
             # Iterate over all faction tags
             for tag_idx, tag in enumerate(self.tags):
-                tag.render(f"{idx}_{tag_idx}")
+                # Tags have no uuid, their index keeps the IDs apart
+                imgui.push_id(tag_idx)
+                changed |= tag.render(self.uuid)
                 # Remove button
                 STYLE.button_color(STYLE.COL_RED)
-                if imgui.button(f"X##rm_tag_{idx}_{tag_idx}"):
+                if imgui.button("X"):
                     rm_tag = tag_idx
                 STYLE.pop_color()
+                imgui.pop_id()
             # Remove any tag previously marked for removal
             if rm_tag != -1:
                 self.tags.pop(rm_tag)
+                changed = True
 
         LayoutHelper.add_spacer()
         # Goals
         imgui.text("CURRENT GOAL:")
         if self.goal:
-            self.goal.render(f"Fact_{self.uuid}")
+            changed |= self.goal.render(self.uuid)
             STYLE.button_color(STYLE.COL_RED)
-            if imgui.button(f"Clear goal##{idx}"):
+            if imgui.button("Clear goal"):
                 self.goal = None
+                changed = True
             STYLE.pop_color()
         elif imgui.begin_combo(label="Set Goal##Turn", preview_value="Set faction goal"):
             for goal in goals_list():
@@ -281,27 +332,29 @@ class Faction(YamlAble):
                 LayoutHelper.add_tooltip(goal.desc)
                 if selected:
                     self.goal = copy(goal)
+                    changed = True
             imgui.end_combo()
 
+        if changed:
+            index.changed(self)
         LayoutHelper.add_spacer()
 
         imgui.text("BASES OF INFLUENCE")
-        if imgui.button(f"Add Base##{idx}"):
-            self.bases.append(
-                BaseOfInfluence(uuid=uuid4().hex, owner=self.uuid, location=None, max_hp=0)
-            )
+        if imgui.button("Add Base"):
+            base = BaseOfInfluence(uuid=uuid4().hex, owner=self.uuid, location=None, max_hp=0)
+            self.bases.append(base)
+            index.add_base(base)
         rm_boi = -1
         for boi_idx, base in enumerate(self.bases):
             boi_open, boi_retain = imgui.collapsing_header(
-                f"  {base.location}##{base.uuid}",
+                LABELS.text(base.uuid, "header", "  {0.location}###{0.uuid}", base),
                 True,
                 flags=imgui.TreeNodeFlags_.default_open,
             )
             if boi_open and boi_retain:
+                imgui.push_id(base.uuid)
                 # Location
-                if imgui.begin_combo(
-                    label=f"Location##{base.uuid}", preview_value="Set base Location"
-                ):
+                if imgui.begin_combo(label="Location", preview_value="Set base Location"):
                     for loc in locations:
                         _, selected = imgui.selectable(
                             label=f"{loc}##{loc.uuid}",
@@ -309,22 +362,23 @@ class Faction(YamlAble):
                         )
                         LayoutHelper.add_tooltip(loc.desc)
                         if selected:
-                            if base.location:
-                                base.location.bases.remove(base)
-                            base.location = loc
-                            loc.bases.append(base)
+                            index.move_base(base, loc)
                     imgui.end_combo()
 
-                _, base.hp = imgui.input_int(label=f"HP##{base.uuid}", v=base.hp)
-                _, base.max_hp = imgui.input_int(label=f"Max HP##{base.uuid}", v=base.max_hp)
-                _, base.desc = imgui.input_text_multiline(
-                    label=f"Description##{base.uuid}",
+                edited_hp, base.hp = imgui.input_int(label="HP", v=base.hp)
+                edited_max, base.max_hp = imgui.input_int(label="Max HP", v=base.max_hp)
+                edited_desc, base.desc = imgui.input_text_multiline(
+                    label="Description",
                     str=base.desc,
                 )
+                if edited_hp or edited_max or edited_desc:
+                    index.changed(base)
+                imgui.pop_id()
             elif not boi_retain:
                 rm_boi = boi_idx
         if rm_boi != -1:
-            self.bases.pop(rm_boi)
+            base = self.bases.pop(rm_boi)
+            index.remove_base(base)
         LayoutHelper.add_spacer()
 
         imgui.text("ASSETS")
@@ -333,29 +387,36 @@ class Faction(YamlAble):
         for type_idx, asset_type in enumerate(
             [AssetType.CUNNING, AssetType.FORCE, AssetType.WEALTH]
         ):
+            group = asset_type.name
+            imgui.push_id(group)
             assets = self.assets_by_type(asset_type)
             group_open = imgui.collapsing_header(
-                f"{asset_type.name} ({len(assets)})##{idx}_{type_idx}",
+                LABELS.format(self.uuid, group, "{} ({})###header", group, len(assets)),
                 flags=imgui.TreeNodeFlags_.default_open,
             )
             if group_open:
-                if imgui.button(f"Add Asset##{idx}_{type_idx}"):
-                    self.assets.append(
-                        Asset(prototype=asset_type, owner=self.uuid, uuid=uuid4().hex)
-                    )
+                if imgui.button("Add Asset"):
+                    asset = Asset(prototype=asset_type, owner=self.uuid, uuid=uuid4().hex)
+                    self.assets.append(asset)
+                    index.add_asset(asset)
                 # Iterate over all assets, by type
-                for asset_idx, asset in enumerate(assets):
+                for asset in assets:
                     asset_open, asset_retain = imgui.collapsing_header(
-                        f"  {asset}##{idx}_{type_idx}_{asset_idx}",
+                        LABELS.text(asset.uuid, "header", "  {0}###{0.uuid}", asset),
                         True,
                         flags=imgui.TreeNodeFlags_.default_open,
                     )
                     if asset_open and asset_retain:
-                        asset.render(f"{idx}_{type_idx}_{asset_idx}", locations)
+                        asset.render(locations, index)
                     elif not asset_retain:
                         rm_asset = asset.uuid
+            imgui.pop_id()
             if type_idx < 3 - 1:
                 LayoutHelper.add_spacer()
         # Remove asset if we've pressed the remove button
         if rm_asset != "":
+            for asset in self.assets:
+                if asset.uuid == rm_asset:
+                    index.remove_asset(asset)
             self.assets = [asset for asset in self.assets if asset.uuid != rm_asset]
+        imgui.pop_id()
@@ -1,23 +1,42 @@
 from typing import Self
 
-from imgui_bundle import imgui
 from yamlable import YamlAble, yaml_info
 
+from src.lazy_import import lazy_import
+
+imgui = lazy_import("imgui_bundle.imgui")
+
 
 @yaml_info(yaml_tag_ns="wwn")
 class Goal(YamlAble):
-    def __init__(self: Self, name: str, desc: str, difficulty: int, notes: str = "") -> None:
+    def __init__(
+        self: Self,
+        name: str,
+        desc: str,
+        difficulty: int,
+        notes: str = "",
+        progress: dict[str, int] = None,
+    ) -> None:
         self.name = name
         self.desc = desc
         self.difficulty = difficulty
         self.notes = notes
+        # Progress counters, kept up to date by the GoalTracker
+        self.progress: dict[str, int] = progress
 
-    def render(self: Self, idx: str) -> None:
-        """Render the Goal."""
-        _, self.name = imgui.input_text(label=f"Name##Goal_{idx}", str=self.name)
-        _, self.desc = imgui.input_text_multiline(label=f"Description##Goal_{idx}", str=self.desc)
-        _, self.difficulty = imgui.input_int(label=f"Difficulty##Goal_{idx}", v=self.difficulty)
-        _, self.notes = imgui.input_text_multiline(label=f"Notes##Goal_{idx}", str=self.notes)
+    def render(self: Self, idx: str) -> bool:
+        """Render the Goal. Returns True if it was edited."""
+        imgui.push_id(idx)
+        renamed, self.name = imgui.input_text(label="Name##Goal", str=self.name)
+        edited_desc, self.desc = imgui.input_text_multiline(
+            label="Description##Goal", str=self.desc
+        )
+        edited_difficulty, self.difficulty = imgui.input_int(
+            label="Difficulty##Goal", v=self.difficulty
+        )
+        edited_notes, self.notes = imgui.input_text_multiline(label="Notes##Goal", str=self.notes)
+        imgui.pop_id()
+        return renamed or edited_desc or edited_difficulty or edited_notes
 
     def __to_yaml_dict__(self: Self) -> dict:
         return {
@@ -25,4 +44,5 @@ class Goal(YamlAble):
             "desc": self.desc,
             "difficulty": self.difficulty,
             "notes": self.notes,
+            "progress": self.progress,
         }
@@ -0,0 +1,157 @@
+"""
+Automatic goal progress tracking.
+
+The GoalTracker listens to turn events and keeps progress counters on each faction's current
+goal, in `Goal.progress`, so checking a goal is a lookup instead of a scan of the turn
+history. The counters are saved with the goal, and start over when a new goal is set.
+
+Only the goals that can be judged from turn events are tracked:
+
+* Blood the Enemy: damage dealt to rival assets and bases, against Force+Cunning+Wealth.
+* Expand Influence: building a base of influence at a location without one of the faction's.
+* Invincible Valor: destroying a rival Force asset with a higher tier than the faction's Force.
+* Peaceable Kingdom: turns in a row without an Attack action, against 4.
+* Sphere Dominance: rival assets destroyed of the chosen type, against the faction's rating in
+  it. Not tracked until a type is chosen with `set_sphere`.
+* Wealth of Kingdoms: Treasure spent on bribes, against 4 times the faction's Wealth.
+
+The other goals are judged by the GM.
+"""
+
+from typing import TYPE_CHECKING, Self
+
+from src.faction import Faction
+from src.lazy_import import lazy_import
+from src.system import GOALS, AssetType, prototype_by_id
+
+if TYPE_CHECKING:
+    from src.events import Event
+
+# The event types are only needed once events are sent
+events = lazy_import("src.events")
+
+PEACEABLE_KINGDOM_TURNS = 4
+WEALTH_OF_KINGDOMS_FACTOR = 4
+# TreasureSpent purpose counted by Wealth of Kingdoms
+BRIBES = "bribes"
+# Progress key of the asset type chosen for Sphere Dominance, stored by value
+SPHERE = "sphere"
+SPHERES = (AssetType.CUNNING, AssetType.FORCE, AssetType.WEALTH)
+
+
+class GoalTracker:
+    """Updates the progress of faction goals from turn events."""
+
+    def __init__(self: Self, factions: list[Faction] = None) -> None:
+        """Initialize GoalTracker object."""
+        self.bind(factions or [])
+
+    def bind(self: Self, factions: list[Faction]) -> None:
+        """Track the goals of a (new) list of factions."""
+        self._factions = factions
+        self._by_uuid = {faction.uuid: faction for faction in factions}
+
+    def _faction(self: Self, uuid: str) -> Faction | None:
+        faction = self._by_uuid.get(uuid)
+        if faction is None:
+            # The faction may have been added after bind
+            self._by_uuid = {faction.uuid: faction for faction in self._factions}
+            faction = self._by_uuid.get(uuid)
+        return faction
+
+    def _progress(self: Self, uuid: str, goal_name: str) -> dict[str, int] | None:
+        """Return the progress counters of a faction, if its current goal is `goal_name`."""
+        faction = self._faction(uuid)
+        if faction is None or faction.goal is None or faction.goal.name != goal_name:
+            return None
+        if faction.goal.progress is None:
+            faction.goal.progress = {}
+        return faction.goal.progress
+
+    def _count(self: Self, uuid: str, goal_name: str, key: str, amount: int) -> None:
+        progress = self._progress(uuid, goal_name)
+        if progress is not None:
+            progress[key] = progress.get(key, 0) + amount
+
+    def on_event(self: Self, event: "Event") -> None:
+        """Update the goal progress of the factions involved in an event."""
+        match event:
+            case events.AssetDamaged(source=source, owner=owner, damage=damage) if source != owner:
+                self._count(source, GOALS.BloodTheEnemy.name, "damage", damage)
+            case events.AssetDestroyed(source=source, owner=owner, prototype=ident) if (
+                source != owner and ident
+            ):
+                prototype = prototype_by_id(ident)
+                if prototype is None:
+                    return
+                self._count(source, GOALS.SphereDominance.name, prototype.type.name, 1)
+                faction = self._faction(source)
+                if (
+                    faction
+                    and prototype.type == AssetType.FORCE
+                    and prototype.requirements.tier > faction.force
+                ):
+                    self._count(source, GOALS.InvincibleValor.name, "destroyed", 1)
+            case events.BaseBuilt(faction=uuid, base=base_uuid, location=location):
+                # Only a base at a location where the faction had none counts
+                faction = self._faction(uuid)
+                if faction and not any(
+                    base.uuid != base_uuid
+                    and getattr(base.location, "uuid", base.location) == location
+                    for base in faction.bases
+                ):
+                    self._count(uuid, GOALS.ExpandInfluence.name, "bases", 1)
+            case events.MainActionTaken(faction=uuid, action=action):
+                progress = self._progress(uuid, GOALS.PeaceableKingdom.name)
+                if progress is not None:
+                    if action == "ACTION_ATTACK":
+                        progress["turns"] = 0
+                    else:
+                        progress["turns"] = progress.get("turns", 0) + 1
+            case events.TreasureSpent(
+                faction=uuid, purpose=purpose, amount=amount
+            ) if purpose == BRIBES:
+                self._count(uuid, GOALS.WealthOfKingdoms.name, "bribes", amount)
+
+    @staticmethod
+    def sphere(faction: Faction) -> AssetType | None:
+        """Return the asset type chosen for Sphere Dominance, if any."""
+        if faction.goal is None or not faction.goal.progress:
+            return None
+        value = faction.goal.progress.get(SPHERE)
+        return AssetType(value) if value is not None else None
+
+    def set_sphere(self: Self, faction: Faction, asset_type: AssetType) -> None:
+        """Choose the asset type of a faction's Sphere Dominance goal."""
+        progress = self._progress(faction.uuid, GOALS.SphereDominance.name)
+        if progress is not None:
+            progress[SPHERE] = asset_type.value
+
+    def status(self: Self, faction: Faction) -> tuple[int, int] | None:
+        """Return (progress, target) for the faction's goal, or None if it isn't tracked."""
+        goal = faction.goal
+        if goal is None:
+            return None
+        progress = goal.progress or {}
+        if goal.name == GOALS.BloodTheEnemy.name:
+            return progress.get("damage", 0), faction.force + faction.cunning + faction.wealth
+        if goal.name == GOALS.ExpandInfluence.name:
+            return min(1, progress.get("bases", 0)), 1
+        if goal.name == GOALS.InvincibleValor.name:
+            return min(1, progress.get("destroyed", 0)), 1
+        if goal.name == GOALS.PeaceableKingdom.name:
+            return progress.get("turns", 0), PEACEABLE_KINGDOM_TURNS
+        if goal.name == GOALS.SphereDominance.name:
+            # Only the chosen type counts, and nothing until one is chosen
+            sphere = self.sphere(faction)
+            if sphere is None:
+                return None
+            return progress.get(sphere.name, 0), faction.get_attribute(sphere)
+        if goal.name == GOALS.WealthOfKingdoms.name:
+            return progress.get("bribes", 0), WEALTH_OF_KINGDOMS_FACTOR * faction.wealth
+        return None
+
+    def is_complete(self: Self, faction: Faction) -> bool:
+        """Check if the faction's goal has been accomplished, for tracked goals."""
+        status = self.status(faction)
+        return status is not None and status[0] >= status[1]
@@ -0,0 +1,225 @@
+"""
+Campaign history store.
+
+Keeps the state of the project at the end of each round in an SQLite database, so that the
+state of past turns can be queried without loading old saves:
+
+```py
+history = HistoryStore("Project/history.sqlite")
+history.series(faction_uuid, "treasure", first=1, last=200)  # [(1, 12), (2, 15), ...]
+history.record_at(asset_uuid, turn=57)["loc"]                  # Location uuid on turn 57
+```
+
+Only the records (see `Project.records`) that changed since the previous recorded turn are
+stored, plus an empty row when an object is removed, so a turn takes as much space as what
+happened in it. A query for turn N finds the latest row at or before N for each object, using
+the indexes on (turn, kind, uuid) and (uuid, turn).
+
+Recording a turn that is already in the history replaces it and drops the later turns: after
+loading an older save and playing on, the history follows the new timeline.
+"""
+
+import json
+import logging
+import time
+from collections.abc import Iterator
+from itertools import groupby
+from operator import itemgetter
+from pathlib import Path
+from typing import TYPE_CHECKING, Self
+
+from src.lazy_import import lazy_import
+from src.project import Project
+
+if TYPE_CHECKING:
+    from src.diff import RecordKey, Snapshot
+
+# sqlite3 and the snapshots are only needed once the history is used
+diff = lazy_import("src.diff")
+sqlite3 = lazy_import("sqlite3")
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_HISTORYFILE = "Project/history.sqlite"
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS turns (
+    turn INTEGER PRIMARY KEY,
+    recorded REAL NOT NULL
+);
+CREATE TABLE IF NOT EXISTS records (
+    turn INTEGER NOT NULL,
+    kind TEXT NOT NULL,
+    uuid TEXT NOT NULL,
+    data TEXT  -- JSON record, NULL once the object is removed
+);
+CREATE UNIQUE INDEX IF NOT EXISTS records_by_turn ON records (turn, kind, uuid);
+CREATE INDEX IF NOT EXISTS records_by_uuid ON records (uuid, turn);
+"""
+
+
+def _encode(record: dict) -> str:
+    return json.dumps(record, separators=(",", ":"))
+
+
+class HistoryStore:
+    """Per-turn project states in an SQLite database."""
+
+    def __init__(self: Self, filename: str = DEFAULT_HISTORYFILE) -> None:
+        """Initialize HistoryStore object. The database is opened on first use."""
+        self.filename = filename
+        self._db: sqlite3.Connection = None
+        # Encoded records of the last recorded turn, to find what changed since
+        self._latest: dict["RecordKey", str] = None
+        self._latest_turn: int = None
+
+    @property
+    def db(self: Self) -> "sqlite3.Connection":
+        if self._db is None:
+            if self.filename != ":memory:":
+                Path(self.filename).parent.mkdir(parents=True, exist_ok=True)
+            self._db = sqlite3.connect(self.filename)
+            self._db.executescript(_SCHEMA)
+        return self._db
+
+    def close(self: Self) -> None:
+        if self._db is not None:
+            self._db.close()
+            self._db = None
+            self._latest = None
+
+    # Recording
+
+    def record(self: Self, project: Project) -> int:
+        """
+        Record the state of a project as of its current turn.
+
+        Returns the number of records written, i.e. those that changed since the previous
+        recorded turn.
+        """
+        turn = project.turn.turn_idx
+        start_time = time.perf_counter()
+        with self.db:
+            last_turn = self.last_turn()
+            if last_turn is not None and turn <= last_turn:
+                # Rewrite history from this turn on
+                self.db.execute("DELETE FROM records WHERE turn >= ?", (turn,))
+                self.db.execute("DELETE FROM turns WHERE turn >= ?", (turn,))
+                self._latest = None
+            if self._latest is None or self._latest_turn != self.last_turn():
+                self._latest_turn = self.last_turn()
+                self._latest = {
+                    (kind, uuid): data
+                    for kind, uuid, data in self._rows_at(self._latest_turn)
+                    if data is not None
+                }
+            rows: list[tuple[int, str, str, str | None]] = []
+            latest: dict["RecordKey", str] = {}
+            for record in project.records():
+                kind, uuid = record["kind"], record.get("uuid") or ""
+                data = _encode(record)
+                latest[(kind, uuid)] = data
+                if self._latest.get((kind, uuid)) != data:
+                    rows.append((turn, kind, uuid, data))
+            rows.extend((turn, kind, uuid, None) for kind, uuid in self._latest.keys() - latest)
+            self.db.executemany(
+                "INSERT INTO records (turn, kind, uuid, data) VALUES (?, ?, ?, ?)", rows
+            )
+            self.db.execute("INSERT INTO turns VALUES (?, ?)", (turn, time.time()))
+        self._latest, self._latest_turn = latest, turn
+        logger.debug(
+            f"Recorded turn {turn} ({len(rows)} changes) in {time.perf_counter() - start_time:.3f}s"
+        )
+        return len(rows)
+
+    # Queries
+
+    def turns(self: Self) -> list[int]:
+        """All recorded turns, in order."""
+        return [turn for (turn,) in self.db.execute("SELECT turn FROM turns ORDER BY turn")]
+
+    def last_turn(self: Self) -> int | None:
+        return self.db.execute("SELECT MAX(turn) FROM turns").fetchone()[0]
+
+    def _rows_at(self: Self, turn: int | None) -> Iterator[tuple[str, str, str | None]]:
+        """(kind, uuid, data) of each object's latest row at or before `turn`."""
+        if turn is None:
+            return iter(())
+        return self.db.execute(
+            "SELECT records.kind, records.uuid, records.data FROM records"
+            " JOIN (SELECT kind, uuid, MAX(turn) AS turn FROM records WHERE turn <= ?"
+            " GROUP BY kind, uuid) AS latest USING (kind, uuid, turn)",
+            (turn,),
+        )
+
+    def state_at(self: Self, turn: int) -> Iterator[dict]:
+        """Yield the records of the project as it was at the end of `turn`."""
+        for _, _, data in self._rows_at(turn):
+            if data is not None:
+                yield json.loads(data)
+
+    def snapshot(self: Self, turn: int) -> "Snapshot":
+        """Snapshot of the project at the end of `turn`, e.g. to diff against the current one."""
+        return diff.Snapshot(self.state_at(turn), turn_idx=turn)
+
+    def record_at(self: Self, uuid: str, turn: int) -> dict | None:
+        """Return the record of an object as it was at the end of `turn`, None if it didn't exist."""  # noqa: E501
+        row = self.db.execute(
+            "SELECT data FROM records WHERE uuid = ? AND turn <= ? ORDER BY turn DESC LIMIT 1",
+            (uuid, turn),
+        ).fetchone()
+        return json.loads(row[0]) if row and row[0] is not None else None
+
+    def replay(self: Self) -> Iterator[tuple[int, list[tuple[str, str, dict | None]]]]:
+        """
+        Yield each recorded turn in order, with the (kind, uuid, record) that changed in it.
+
+        The record is None for removed objects. Reading the whole history this way takes a
+        single pass over the table, e.g. to fill charts.
+        """
+        rows = self.db.execute("SELECT turn, kind, uuid, data FROM records ORDER BY turn")
+        changes = groupby(rows, key=itemgetter(0))
+        pending = next(changes, None)
+        for turn in self.turns():
+            records = []
+            # Turns without changes have no rows
+            if pending is not None and pending[0] == turn:
+                records = [
+                    (kind, uuid, json.loads(data) if data is not None else None)
+                    for _, kind, uuid, data in pending[1]
+                ]
+                pending = next(changes, None)
+            yield turn, records
+
+    def series(
+        self: Self, uuid: str, field: str, first: int = None, last: int = None
+    ) -> list[tuple[int, object]]:
+        """
+        Return (turn, value) of a field of an object for each recorded turn from first to last.
+
+        Nested fields are separated by dots, e.g. "goal.name". Turns where the object didn't
+        exist are left out.
+        """
+        first = first if first is not None else 0
+        last = last if last is not None else self.last_turn()
+        if last is None:
+            return []
+        changes = self.db.execute(
+            "SELECT turn, json_extract(data, ?), data IS NULL FROM records"
+            " WHERE uuid = ? AND turn <= ? ORDER BY turn",
+            (f"$.{field}", uuid, last),
+        ).fetchall()
+        recorded = self.db.execute(
+            "SELECT turn FROM turns WHERE turn BETWEEN ? AND ? ORDER BY turn", (first, last)
+        )
+        # Carry each change forward over the recorded turns until the next one
+        result: list[tuple[int, object]] = []
+        idx, value, exists = 0, None, False
+        for (turn,) in recorded:
+            while idx < len(changes) and changes[idx][0] <= turn:
+                _, value, removed = changes[idx]
+                exists = not removed
+                idx += 1
+            if exists:
+                result.append((turn, value))
+        return result
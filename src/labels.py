@@ -0,0 +1,114 @@
+"""
+Cache of the imgui labels and texts drawn each frame.
+
+Building labels and texts with f-strings allocates new strings for every widget, every frame,
+even though they almost never change. `LABELS` keeps them across frames, by entity uuid and
+field:
+
+```py
+imgui.collapsing_header(LABELS.label(faction.uuid, "header", faction.name))
+imgui.text(LABELS.text(asset.uuid, "at", "{0} ({0.loc})", asset))
+imgui.text(LABELS.format(faction.uuid, "sell", "Sell {} assets", count))
+```
+
+`text` entries are stamped with `version`, the number of model changes reported to the cache,
+and only rebuilt once it moves on. The cache subscribes to the spatial index and the event log,
+which see every change to the model (see `SpatialIndex.changed`), and forgets the entries of
+removed entities. Texts often show more than one entity, e.g. an asset and its location, so any
+change rebuilds the texts drawn after it, once. `text` takes the entities to show, and reads
+their fields in the format string, so nothing is built for entries that are still valid.
+
+`format` is for texts of GUI state that isn't reported, such as picks and their totals. Its
+entries are kept until the values differ, so pass values that already exist, such as numbers
+and names, not strings built for the call.
+
+Labels that never change don't need the cache: push the uuid of the entity on the ID stack with
+`imgui.push_id(uuid)`, and use plain string literals as labels.
+"""
+
+from typing import TYPE_CHECKING, Self
+
+if TYPE_CHECKING:
+    from src.events import Event
+
+
+class LabelCache:
+    """Labels and formatted texts, by entity uuid and field."""
+
+    def __init__(self: Self) -> None:
+        """Initialize LabelCache object."""
+        # uuid -> field -> (key, string), where the key is the label text, or the values or the
+        # version the string was built for. Nested, so lookups don't build tuples.
+        self.entries: dict[str, dict[str, tuple[str | tuple | int, str]]] = {}
+        # Number of model changes reported so far
+        self.version: int = 0
+        # Number of strings built, to check that they are reused from frame to frame
+        self.built: int = 0
+
+    def __len__(self: Self) -> int:
+        return sum(len(fields) for fields in self.entries.values())
+
+    def label(self: Self, uuid: str, field: str, text: str) -> str:
+        """Return a label showing `text`, with an ID that stays the same when `text` changes."""
+        try:
+            entry = self.entries[uuid][field]
+            if entry[0] == text:
+                return entry[1]
+        except KeyError:
+            pass
+        label = f"{text}###{uuid}_{field}"
+        self._store(uuid, field, text, label)
+        return label
+
+    def text(
+        self: Self, uuid: str, field: str, fmt: str, entity: object, other: object = None
+    ) -> str:
+        """Return `fmt.format(entity, other)`, kept until the model changes."""
+        try:
+            entry = self.entries[uuid][field]
+            if entry[0] == self.version:
+                return entry[1]
+        except KeyError:
+            pass
+        text = fmt.format(entity, other)
+        self._store(uuid, field, self.version, text)
+        return text
+
+    def format(self: Self, uuid: str, field: str, fmt: str, *values: object) -> str:
+        """Return `fmt` formatted with `values`, kept until the values change."""
+        try:
+            entry = self.entries[uuid][field]
+            if entry[0] == values:
+                return entry[1]
+        except KeyError:
+            pass
+        text = fmt.format(*values)
+        self._store(uuid, field, values, text)
+        return text
+
+    def _store(self: Self, uuid: str, field: str, key: str | tuple | int, string: str) -> None:
+        fields = self.entries.get(uuid)
+        if fields is None:
+            fields = self.entries[uuid] = {}
+        fields[field] = (key, string)
+        self.built += 1
+
+    def on_change(self: Self, entity: object, removed: bool = False) -> None:
+        """Count a change reported by the spatial index, and forget removed entities."""
+        self.version += 1
+        if removed:
+            self.forget(entity.uuid)
+
+    def on_event(self: Self, event: "Event") -> None:
+        """Count a change reported by the event log."""
+        self.version += 1
+
+    def forget(self: Self, uuid: str) -> None:
+        """Drop the entries of a removed entity."""
+        self.entries.pop(uuid, None)
+
+    def clear(self: Self) -> None:
+        self.entries.clear()
+
+
+LABELS = LabelCache()
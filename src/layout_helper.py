@@ -7,10 +7,19 @@ backend side of imgui rendering and event polling.
 
 import logging
 
-from imgui_bundle import imgui
+from src.lazy_import import lazy_import
+
+imgui = lazy_import("imgui_bundle.imgui")
 
 logger = logging.getLogger(__name__)
 
+# Colors renamed in imgui 1.90.9, by their old names
+RENAMED_COLORS = {
+    "tab_active": "tab_selected",
+    "tab_unfocused": "tab_dimmed",
+    "tab_unfocused_active": "tab_dimmed_selected",
+}
+
 
 class LayoutHelper:
     """
@@ -52,7 +61,7 @@ class LayoutHelper:
             imgui.end_tooltip()
 
     @staticmethod
-    def set_gui_color(ui_element: str, color: imgui.ImVec4) -> None:
+    def set_gui_color(ui_element: str, color: "imgui.ImVec4") -> None:
         """
         Set the color of a GUI element.
 
@@ -61,5 +70,7 @@ class LayoutHelper:
             ui_element: Check the demo window for valid values
             color: Tuple of (r, g, b, a) values.
         """
+        if not hasattr(imgui.Col_, ui_element):
+            ui_element = RENAMED_COLORS.get(ui_element, ui_element)
         ui_element = getattr(imgui.Col_, ui_element)
         imgui.get_style().set_color_(ui_element, color)
@@ -0,0 +1,37 @@
+"""
+Deferred imports of heavy modules.
+
+The GUI libraries (imgui_bundle, glfw, OpenGL) take a large part of the startup time,
+but are only needed once something is actually drawn. Importing them through
+`lazy_import` keeps headless tools that only use the model classes fast to start:
+
+```py
+imgui = lazy_import("imgui_bundle.imgui")
+
+imgui.text("Hello")  # imgui_bundle is imported here, on first use
+```
+"""
+
+import importlib
+from types import ModuleType
+from typing import Self
+
+
+class LazyModule(ModuleType):
+    """Module stand-in that imports the real module on first attribute access."""
+
+    def __init__(self: Self, name: str) -> None:
+        """Initialize LazyModule object."""
+        super().__init__(name)
+
+    def __getattr__(self: Self, attr: str) -> object:
+        # Only called for attributes not yet in __dict__, i.e. before the first import
+        module = importlib.import_module(self.__name__)
+        # Copy the module contents so later lookups don't go through __getattr__
+        self.__dict__.update(module.__dict__)
+        return getattr(module, attr)
+
+
+def lazy_import(name: str) -> ModuleType:
+    """Return a module proxy for `name`, which is imported on first use."""
+    return LazyModule(name)
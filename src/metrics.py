@@ -0,0 +1,187 @@
+"""
+Faction metrics over turns, for charts.
+
+The metrics of every faction are appended at the end of each round to preallocated numpy
+ring buffers, which keep the last `capacity` turns. A buffer has one row per faction (slot) and
+one column per turn; a faction that didn't exist on a turn has NaN there. New factions grow the
+buffers by doubling the number of slots, so appending is O(factions) and never reallocates
+per turn.
+
+For plotting, the lines are reduced to the pixel width of the chart by min/max downsampling:
+each pixel column gets the min and max of the turns it covers, which keeps spikes visible.
+The result is cached until the next append.
+"""
+
+from collections.abc import Iterable
+from typing import Self
+
+from src.faction import Faction
+from src.history import HistoryStore
+from src.lazy_import import lazy_import
+from src.system import AssetType, prototype_by_id
+
+# numpy is only needed once metrics are recorded
+np = lazy_import("numpy")
+
+DEFAULT_CAPACITY = 500
+# Faction slots allocated up front
+INITIAL_SLOTS = 16
+
+ASSET_TYPES = tuple(AssetType)
+METRICS = (
+    "HP",
+    "Treasure",
+    "Exp",
+    *(f"{asset_type.name.title()} assets" for asset_type in ASSET_TYPES),
+)
+
+
+def faction_metrics(faction: Faction) -> list[float]:
+    """Return the current metrics of a faction, in the order of METRICS."""
+    counts = dict.fromkeys(ASSET_TYPES, 0)
+    for asset in faction.assets:
+        if asset.is_initialized():
+            counts[asset.prototype.type] += 1
+    return [faction.hp, faction.treasure, faction.exp, *counts.values()]
+
+
+def downsample(
+    turns: "np.ndarray", values: "np.ndarray", width: int
+) -> tuple["np.ndarray", "np.ndarray"]:
+    """
+    Reduce lines to about 2 * `width` points with min/max downsampling.
+
+    `values` has one line per row. Each of `width` buckets of turns becomes two points, the
+    min and the max of the bucket. NaN values are ignored unless the whole bucket is NaN.
+    """
+    if width <= 0 or len(turns) <= 2 * width:
+        return turns, values
+    starts = np.linspace(0, len(turns), width, endpoint=False).astype(np.intp)
+    points = np.empty((*values.shape[:-1], 2 * width), dtype=values.dtype)
+    # All-NaN buckets give NaN, which is what they should plot as
+    with np.errstate(invalid="ignore"):
+        points[..., 0::2] = np.fmin.reduceat(values, starts, axis=-1)
+        points[..., 1::2] = np.fmax.reduceat(values, starts, axis=-1)
+    return np.repeat(turns[starts], 2), points
+
+
+class FactionMetrics:
+    """Ring buffers of the metrics of each faction at the end of each round."""
+
+    def __init__(self: Self, capacity: int = DEFAULT_CAPACITY) -> None:
+        """Initialize FactionMetrics object."""
+        self.capacity = max(1, capacity)
+        self.clear()
+
+    def clear(self: Self) -> None:
+        self.turns = np.zeros(self.capacity, dtype=np.float64)
+        # Indexed by [metric, slot, column]
+        self.values = np.full(
+            (len(METRICS), INITIAL_SLOTS, self.capacity), np.nan, dtype=np.float64
+        )
+        # Faction uuid -> slot, and names for the legend
+        self.slots: dict[str, int] = {}
+        self.names: dict[str, str] = {}
+        # Number of turns held, and the column the next turn goes to
+        self.count = 0
+        self.head = 0
+        # Metric -> (width, turns, values) of the last downsampled lines, until the next append
+        self._plot_cache: dict[int, tuple] = {}
+
+    def last_turn(self: Self) -> int | None:
+        return int(self.turns[(self.head - 1) % self.capacity]) if self.count else None
+
+    def _slot(self: Self, uuid: str, name: str) -> int:
+        self.names[uuid] = name
+        slot = self.slots.get(uuid)
+        if slot is None:
+            slot = len(self.slots)
+            if slot >= self.values.shape[1]:
+                grown = np.full_like(self.values, np.nan)
+                self.values = np.concatenate([self.values, grown], axis=1)
+            self.slots[uuid] = slot
+        return slot
+
+    def append(self: Self, turn: int, rows: Iterable[tuple[str, str, list[float]]]) -> None:
+        """
+        Append the (uuid, name, metrics) of each faction at the end of a turn.
+
+        Turns at or after `turn` that are already held are dropped first, as when the campaign
+        goes back to an older save.
+        """
+        while self.count and self.last_turn() >= turn:
+            self.head = (self.head - 1) % self.capacity
+            self.count -= 1
+        column = self.head
+        self.turns[column] = turn
+        self.values[:, :, column] = np.nan
+        slots: list[int] = []
+        values: list[list[float]] = []
+        for uuid, name, metrics in rows:
+            slots.append(self._slot(uuid, name))
+            values.append(metrics)
+        if slots:
+            self.values[:, slots, column] = np.array(values, dtype=np.float64).T
+        self.head = (self.head + 1) % self.capacity
+        self.count = min(self.count + 1, self.capacity)
+        self._plot_cache.clear()
+
+    def append_factions(self: Self, turn: int, factions: list[Faction]) -> None:
+        self.append(
+            turn, ((faction.uuid, faction.name, faction_metrics(faction)) for faction in factions)
+        )
+
+    def load_history(self: Self, history: HistoryStore) -> None:
+        """Fill the buffers from the campaign history, in a single pass over it."""
+        self.clear()
+        factions: dict[str, dict] = {}
+        # Asset uuid -> (owner, index in ASSET_TYPES), and the asset counts per owner
+        assets: dict[str, tuple[str, int]] = {}
+        counts: dict[str, list[int]] = {}
+        for turn, changes in history.replay():
+            for kind, uuid, record in changes:
+                if kind == "faction":
+                    if record is None:
+                        factions.pop(uuid, None)
+                    else:
+                        factions[uuid] = record
+                elif kind == "asset":
+                    if uuid in assets:
+                        owner, type_idx = assets.pop(uuid)
+                        counts[owner][type_idx] -= 1
+                    prototype = prototype_by_id(record["prototype"]) if record else None
+                    if prototype is not None:
+                        type_idx = ASSET_TYPES.index(prototype.type)
+                        assets[uuid] = (record["owner"], type_idx)
+                        counts.setdefault(record["owner"], [0] * len(ASSET_TYPES))[type_idx] += 1
+            self.append(
+                turn,
+                (
+                    (
+                        uuid,
+                        record.get("name", ""),
+                        [
+                            record.get("hp", 0),
+                            record.get("treasure", 0),
+                            record.get("exp", 0),
+                            *counts.get(uuid, [0] * len(ASSET_TYPES)),
+                        ],
+                    )
+                    for uuid, record in factions.items()
+                ),
+            )
+
+    def series(self: Self, metric: int) -> tuple["np.ndarray", "np.ndarray"]:
+        """Return the turns and values of one metric, oldest first, with one row per slot."""
+        columns = (self.head - self.count + np.arange(self.count)) % self.capacity
+        return self.turns[columns], self.values[metric, : len(self.slots)][:, columns]
+
+    def plot_data(self: Self, metric: int, width: int) -> tuple["np.ndarray", "np.ndarray"]:
+        """Return the turns and values of one metric, downsampled to `width` pixels. Cached."""
+        cached = self._plot_cache.get(metric)
+        if cached is None or cached[0] != width:
+            turns, values = downsample(*self.series(metric), width)
+            # The plot functions take contiguous arrays
+            cached = (width, np.ascontiguousarray(turns), np.ascontiguousarray(values))
+            self._plot_cache[metric] = cached
+        return cached[1], cached[2]
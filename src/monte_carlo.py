@@ -0,0 +1,416 @@
+"""
+Parallel Monte Carlo forecasts over a shared-memory world.
+
+For "what if" questions about the whole map, such as "who is still standing after 10 rounds
+of fighting where everyone stands", many trials of the same battle are played out over a
+process pool. The world is laid out once as numpy arrays in a single
+`multiprocessing.shared_memory` block: faction attributes, hp and treasure, and the owner,
+location, hp and prototype of every asset and base of influence. The workers attach to the
+block when they start, so a task is only a seed and a trial count, and no `Faction` or `Asset`
+is pickled. The shared arrays are read-only in the workers; each trial copies the few columns
+that change (hit points and treasure) into a private overlay and plays on those. A worker sends
+back the sums and sums of squares of the per-faction outcomes over its trials, so a result is
+a few small arrays whatever the size of the world.
+
+```py
+with SharedWorld.from_model(project.factions, project.locations) as world:
+    forecast = MonteCarlo(world, workers=4).run(rounds=10, trials=1000, seed=1)
+forecast.mean[:, OUTCOMES.index("hp")]  # Expected hit points of each faction after 10 rounds
+```
+
+A round follows the rules of `SimWorld` in `src.ai` for the parts that don't need a decision:
+each faction gains treasure and pays upkeep, then every armed asset attacks a random visible
+rival asset or base in its location, all at once. Hits deal the attacker's damage, misses take
+the defender's counterattack, and damage to a base is also taken from its faction's hit points.
+Assets don't move, and nothing is bought, repaired or sold.
+"""
+
+import logging
+import os
+import time
+from dataclasses import dataclass
+from math import ceil
+from typing import Self
+
+from src.faction import Faction
+from src.lazy_import import lazy_import
+from src.location import Location
+from src.system import (
+    QUALITY,
+    AssetPrototype,
+    AssetType,
+    Dice,
+    asset_catalog,
+    catalog_settings,
+    configure_catalog,
+)
+from src.world_snapshot import NONE, WorldSnapshot, world_arrays
+
+# Only needed once a forecast is run
+np = lazy_import("numpy")
+futures = lazy_import("concurrent.futures")
+shared_memory = lazy_import("multiprocessing.shared_memory")
+
+logger = logging.getLogger(__name__)
+
+ASSET_TYPES = tuple(AssetType)
+# Per-faction outcomes of a trial, the columns of `Forecast.mean` and `Forecast.std`
+OUTCOMES = ("hp", "treasure", "assets", "bases", "asset_hp", "survived")
+# Trials per task sent to a worker
+TRIALS_PER_TASK = 64
+# 1d10 attack and defense rolls
+ROLL_SIDES = 10
+
+
+def _dice(dice: Dice | None) -> tuple[int, int, int]:
+    return (dice.count, dice.sides, dice.bonus) if dice else (0, 1, 0)
+
+
+def _prototype_arrays(prototypes: list[AssetPrototype]) -> dict[str, "np.ndarray"]:
+    """Stats of the prototypes the world uses, indexed by prototype number."""
+
+    def attribute(asset_type: AssetType | None) -> int:
+        return ASSET_TYPES.index(asset_type) if asset_type else NONE
+
+    stats = [prototype.stats for prototype in prototypes]
+    return {
+        "proto_type": np.array([ASSET_TYPES.index(p.type) for p in prototypes], dtype=np.int32),
+        "proto_upkeep": np.array([s.upkeep for s in stats], dtype=np.int32),
+        "proto_armed": np.array(
+            [bool(s.atk_type and s.def_type and s.damage) for s in stats], dtype=bool
+        ),
+        "proto_atk": np.array([attribute(s.atk_type) for s in stats], dtype=np.int32),
+        "proto_def": np.array([attribute(s.def_type) for s in stats], dtype=np.int32),
+        "proto_damage": np.array([_dice(s.damage) for s in stats], dtype=np.int32).reshape(-1, 3),
+        "proto_counter": np.array([_dice(s.counter) for s in stats], dtype=np.int32).reshape(-1, 3),
+    }
+
+
+def _layout_arrays(
+    tables: dict[str, dict[str, "np.ndarray"]], prototype_ids: dict[int, str]
+) -> dict[str, "np.ndarray"]:
+    """
+    Lay out the arrays of the shared block from the columns of a world snapshot.
+
+    Assets and bases are "units": assets first, then bases, with prototype NONE for bases.
+    Assets without a known prototype are left out. `prototype_ids` maps the string numbers of
+    the asset prototype column to prototype ids.
+    """
+    factions, assets, bases = tables["factions"], tables["assets"], tables["bases"]
+    by_id = asset_catalog().by_id
+    prototypes: list[AssetPrototype] = []
+    asset_proto = np.full(len(assets["prototype"]), NONE, dtype=np.int32)
+    for string in np.unique(assets["prototype"]):
+        prototype = by_id.get(prototype_ids.get(int(string)))
+        if prototype is not None:
+            asset_proto[assets["prototype"] == string] = len(prototypes)
+            prototypes.append(prototype)
+    known = asset_proto != NONE
+
+    arrays = {
+        "attributes": np.stack(
+            [factions["cunning"], factions["force"], factions["wealth"]], axis=1
+        ).astype(np.int32),
+        "faction_hp": factions["hp"].astype(np.int32),
+        "treasure": factions["treasure"].astype(np.int32),
+        "owner": np.concatenate([assets["owner"][known], bases["owner"]]).astype(np.int32),
+        "loc": np.concatenate([assets["loc"][known], bases["loc"]]).astype(np.int32),
+        "hp": np.concatenate([assets["hp"][known], bases["hp"]]).astype(np.int32),
+        "proto": np.concatenate(
+            [asset_proto[known], np.full(len(bases["hp"]), NONE, dtype=np.int32)]
+        ),
+        **_prototype_arrays(prototypes),
+    }
+    # Per asset: armed and placed, so it attacks, key of its (owner, type) count, and upkeep
+    unit_proto = asset_proto[known]
+    arrays["asset_armed"] = arrays["proto_armed"][unit_proto] & (assets["loc"][known] != NONE)
+    arrays["asset_key"] = (
+        assets["owner"][known] * len(ASSET_TYPES) + arrays["proto_type"][unit_proto]
+    ).astype(np.int32)
+    arrays["asset_upkeep"] = arrays["proto_upkeep"][unit_proto]
+    attributes = arrays["attributes"]
+    arrays["income"] = np.ceil(
+        attributes[:, 2] / 2 + (attributes[:, 1] + attributes[:, 0]) / 4
+    ).astype(np.int64)
+    # Stealthed assets can't be targeted
+    stealth = (assets["qualities"][known] & np.uint64(QUALITY.Stealth.mask)) != 0
+    arrays["stealth"] = np.concatenate([stealth, np.zeros(len(bases["hp"]), dtype=bool)])
+    # Units sorted by location, and where each location starts, to pick targets in a location
+    placed = np.flatnonzero(arrays["loc"] != NONE)
+    order = placed[np.argsort(arrays["loc"][placed], kind="stable")]
+    locations = len(tables["locations"]["uuid"])
+    arrays["by_loc"] = order.astype(np.int32)
+    arrays["loc_start"] = np.searchsorted(arrays["loc"][order], np.arange(locations + 1)).astype(
+        np.int32
+    )
+    return arrays
+
+
+class SharedWorld:
+    """The arrays of a world in one shared memory block, created or attached to by name."""
+
+    def __init__(
+        self: Self,
+        block: "shared_memory.SharedMemory",
+        layout: dict[str, tuple[str, tuple[int, ...], int]],
+        owner: bool,
+    ) -> None:
+        """Initialize SharedWorld object. Use `create` or `attach` instead."""
+        self.block = block
+        # Array name -> (dtype, shape, offset in the block)
+        self.layout = layout
+        # Only the process that created the block removes it
+        self.owner = owner
+        self.arrays: dict[str, "np.ndarray"] = {}
+        for name, (dtype, shape, offset) in layout.items():
+            array = np.ndarray(shape, dtype=dtype, buffer=block.buf, offset=offset)
+            array.flags.writeable = owner
+            self.arrays[name] = array
+
+    @staticmethod
+    def create(arrays: dict[str, "np.ndarray"]) -> "SharedWorld":
+        """Copy arrays into a new shared memory block."""
+        layout: dict[str, tuple[str, tuple[int, ...], int]] = {}
+        size = 0
+        for name, array in arrays.items():
+            layout[name] = (array.dtype.str, array.shape, size)
+            # Keep every array 8-byte aligned
+            size += -(-array.nbytes // 8) * 8
+        block = shared_memory.SharedMemory(create=True, size=max(1, size))
+        world = SharedWorld(block, layout, owner=True)
+        for name, array in arrays.items():
+            world.arrays[name][...] = array
+        return world
+
+    @staticmethod
+    def from_model(factions: list[Faction], locations: list[Location]) -> "SharedWorld":
+        tables, strings = world_arrays(factions, locations)
+        prototype_ids = {
+            int(number): strings[number]
+            for number in np.unique(tables["assets"]["prototype"])
+            if number != NONE
+        }
+        return SharedWorld.create(_layout_arrays(tables, prototype_ids))
+
+    @staticmethod
+    def from_snapshot(snapshot: WorldSnapshot) -> "SharedWorld":
+        tables = {name: table.columns for name, table in snapshot.tables.items()}
+        prototype_ids = {
+            int(number): snapshot.string(number)
+            for number in np.unique(tables["assets"]["prototype"])
+            if number != NONE
+        }
+        return SharedWorld.create(_layout_arrays(tables, prototype_ids))
+
+    @staticmethod
+    def attach(name: str, layout: dict[str, tuple[str, tuple[int, ...], int]]) -> "SharedWorld":
+        """Attach to a block created by another process. The arrays are read-only."""
+        return SharedWorld(shared_memory.SharedMemory(name=name), layout, owner=False)
+
+    def __getitem__(self: Self, name: str) -> "np.ndarray":
+        return self.arrays[name]
+
+    @property
+    def factions(self: Self) -> int:
+        return len(self.arrays["faction_hp"])
+
+    @property
+    def assets(self: Self) -> int:
+        """Number of assets. They come first in the unit arrays, followed by the bases."""
+        return len(self.arrays["asset_upkeep"])
+
+    def close(self: Self) -> None:
+        """Detach from the block, and remove it if this process created it."""
+        # The views must go before the block can be closed
+        self.arrays.clear()
+        self.block.close()
+        if self.owner:
+            self.block.unlink()
+
+    def __enter__(self: Self) -> Self:
+        return self
+
+    def __exit__(self: Self, *_: object) -> None:
+        self.close()
+
+
+def _roll(rng: "np.random.Generator", dice: "np.ndarray") -> "np.ndarray":
+    """Roll one row of (count, sides, bonus) dice each. Results are never negative."""
+    if len(dice) == 0:
+        return np.zeros(0, dtype=np.int64)
+    most = max(1, int(dice[:, 0].max()))
+    # Scaled uniform floats, as `integers` is slow with a different range per row
+    rolls = (rng.random((len(dice), most)) * dice[:, 1:2]).astype(np.int64) + 1
+    rolls[np.arange(most) >= dice[:, 0:1]] = 0
+    return np.maximum(0, rolls.sum(axis=1) + dice[:, 2])
+
+
+def _play(world: SharedWorld, rounds: int, rng: "np.random.Generator") -> "np.ndarray":
+    """Play out one trial, and return the outcomes of each faction as [faction, OUTCOMES]."""
+    attributes, owner, proto = world["attributes"], world["owner"], world["proto"]
+    by_loc, loc_start, loc = world["by_loc"], world["loc_start"], world["loc"]
+    factions, assets = world.factions, world.assets
+    asset_owner, base_owner = owner[:assets], owner[assets:]
+    # The private overlay: the only columns a trial changes
+    hp = world["hp"].astype(np.int64)
+    faction_hp = world["faction_hp"].astype(np.int64)
+    treasure = world["treasure"].astype(np.int64)
+
+    for _ in range(rounds):
+        alive = hp > 0
+        live_assets = alive[:assets]
+        # Treasure and upkeep, with a point per asset of a type beyond the faction's attribute
+        treasure += world["income"]
+        counts = np.bincount(
+            world["asset_key"][live_assets], minlength=factions * len(ASSET_TYPES)
+        ).reshape(factions, len(ASSET_TYPES))
+        upkeep = np.bincount(
+            asset_owner[live_assets],
+            weights=world["asset_upkeep"][live_assets],
+            minlength=factions,
+        ).astype(np.int64)
+        upkeep += np.maximum(0, counts - attributes).sum(axis=1)
+        treasure -= np.minimum(treasure, upkeep)
+
+        # Every armed asset attacks a random unit in its location, if it's a visible rival
+        attackers = np.flatnonzero(
+            live_assets & world["asset_armed"] & (faction_hp[asset_owner] > 0)
+        )
+        if len(attackers) == 0:
+            continue
+        start = loc_start[loc[attackers]]
+        count = loc_start[loc[attackers] + 1] - start
+        targets = by_loc[start + (rng.random(len(attackers)) * count).astype(np.int64)]
+        valid = alive[targets] & (owner[targets] != owner[attackers]) & ~world["stealth"][targets]
+        attackers, targets = attackers[valid], targets[valid]
+        atk_proto = proto[attackers]
+        attack = (
+            rng.integers(1, ROLL_SIDES + 1, len(attackers))
+            + attributes[owner[attackers], world["proto_atk"][atk_proto]]
+        )
+        defense = (
+            rng.integers(1, ROLL_SIDES + 1, len(attackers))
+            + attributes[owner[targets], world["proto_def"][atk_proto]]
+        )
+        hit = attack > defense
+        # Only assets counterattack
+        countered = targets[~hit]
+        countered_by = countered < assets
+        damage = np.bincount(
+            np.concatenate([targets[hit], attackers[~hit][countered_by]]),
+            weights=np.concatenate(
+                [
+                    _roll(rng, world["proto_damage"][atk_proto[hit]]),
+                    _roll(rng, world["proto_counter"][proto[countered[countered_by]]]),
+                ]
+            ),
+            minlength=len(hp),
+        ).astype(np.int64)
+        # Damage to a base also comes off its faction's hit points, up to the base's own
+        base_damage = np.minimum(damage[assets:], np.maximum(hp[assets:], 0))
+        faction_hp -= np.bincount(base_owner, weights=base_damage, minlength=factions).astype(
+            np.int64
+        )
+        hp -= damage
+
+    alive = hp > 0
+    live_assets = alive[:assets]
+    return np.stack(
+        [
+            faction_hp,
+            treasure,
+            np.bincount(asset_owner[live_assets], minlength=factions),
+            np.bincount(base_owner[alive[assets:]], minlength=factions),
+            np.bincount(
+                asset_owner[live_assets], weights=hp[:assets][live_assets], minlength=factions
+            ),
+            faction_hp > 0,
+        ],
+        axis=1,
+    ).astype(np.float64)
+
+
+# Worker processes
+
+
+_worker_world: SharedWorld = None
+
+
+def _init_worker(settings: dict, name: str, layout: dict) -> None:
+    global _worker_world
+    configure_catalog(**settings)
+    _worker_world = SharedWorld.attach(name, layout)
+
+
+def _run_trials(
+    world: SharedWorld | None, rounds: int, trials: int, seed: int
+) -> tuple["np.ndarray", "np.ndarray"]:
+    """Return the sums and sums of squares of the outcomes of `trials` trials."""
+    world = world or _worker_world
+    rng = np.random.default_rng(seed)
+    total = np.zeros((world.factions, len(OUTCOMES)))
+    squares = np.zeros_like(total)
+    for _ in range(trials):
+        outcome = _play(world, rounds, rng)
+        total += outcome
+        squares += outcome * outcome
+    return total, squares
+
+
+@dataclass(frozen=True, slots=True)
+class Forecast:
+    """Mean and standard deviation of the outcomes of each faction, as [faction, OUTCOMES]."""
+
+    rounds: int
+    trials: int
+    mean: "np.ndarray"
+    std: "np.ndarray"
+
+
+class MonteCarlo:
+    """Plays out trials on a shared world, spread over a process pool."""
+
+    def __init__(self: Self, world: SharedWorld, workers: int = 0) -> None:
+        """Initialize MonteCarlo object. `workers` as in AISettings: 0 for one per CPU."""
+        self.world = world
+        self.workers = workers or os.cpu_count() or 1
+
+    def run(self: Self, rounds: int, trials: int, seed: int = None) -> Forecast:
+        start_time = time.perf_counter()
+        seeds = np.random.SeedSequence(seed)
+        tasks = [
+            (min(TRIALS_PER_TASK, trials - start), child.generate_state(1)[0])
+            for start, child in zip(
+                range(0, trials, TRIALS_PER_TASK),
+                seeds.spawn(ceil(trials / TRIALS_PER_TASK)),
+                strict=True,
+            )
+        ]
+        total = np.zeros((self.world.factions, len(OUTCOMES)))
+        squares = np.zeros_like(total)
+        if self.workers <= 1:
+            results = [
+                _run_trials(self.world, rounds, count, task_seed) for count, task_seed in tasks
+            ]
+        else:
+            with futures.ProcessPoolExecutor(
+                max_workers=self.workers,
+                initializer=_init_worker,
+                initargs=(catalog_settings(), self.world.block.name, self.world.layout),
+            ) as pool:
+                # The workers play on the block they attached to
+                pending = [
+                    pool.submit(_run_trials, None, rounds, count, task_seed)
+                    for count, task_seed in tasks
+                ]
+                results = [future.result() for future in pending]
+        for task_total, task_squares in results:
+            total += task_total
+            squares += task_squares
+        trials = max(1, trials)
+        mean = total / trials
+        std = np.sqrt(np.maximum(0.0, squares / trials - mean * mean))
+        logger.info(
+            f"Played {trials} trials of {rounds} rounds in {time.perf_counter() - start_time:.2f}s"
+        )
+        return Forecast(rounds, trials, mean, std)
@@ -0,0 +1,280 @@
+"""
+Project files.
+
+A project file is a YAML document with the factions, locations and turn state. In the file,
+objects refer to each other by uuid (and catalog entries by id), and `restore_links` replaces
+those references with the objects after loading, using tables of the objects by uuid. Files
+are read with the streaming loader in `src.stream_loader`, which never holds the whole document
+tree, so large campaigns load in about the memory of the final model. Used by both the GUI and
+the command line tools in `cli.py`, so nothing here may import a GUI library.
+"""
+
+import json
+import logging
+import threading
+from collections.abc import Callable, Iterator
+from dataclasses import dataclass, field
+from enum import Enum
+from typing import Self
+
+import yaml
+from yamlable import YamlAble
+
+from config import write_yaml
+from src.asset import Asset
+from src.base_of_influence import BaseOfInfluence
+from src.faction import Faction
+from src.location import Location
+from src.stream_loader import load_yaml_stream
+from src.system import rules_index, tags_list
+from src.turn import FactionTurn
+
+logger = logging.getLogger(__name__)
+
+# Values that `plain` returns as they are
+_LEAF_TYPES = frozenset((str, int, float, bool, type(None)))
+
+
+@dataclass
+class Project:
+    """The contents of a project file."""
+
+    factions: list[Faction] = field(default_factory=list)
+    locations: list[Location] = field(default_factory=list)
+    turn: FactionTurn = field(default_factory=FactionTurn)
+    # References that couldn't be resolved when loading, see restore_links
+    problems: list[str] = field(default_factory=list)
+
+    def to_yaml_data(self: Self) -> dict:
+        return {
+            "factions": self.factions,
+            "locations": self.locations,
+            "turn": self.turn,
+        }
+
+    def records(self: Self) -> Iterator[dict]:
+        """
+        Yield the project as flat records, for export and diffs.
+
+        There is one record per location, faction, asset and base of influence, and a last one
+        for the turn state. Each has a "kind" and the object's saved fields, with references to
+        other objects as uuids.
+        """
+        for location in self.locations:
+            yield {"kind": "location", **plain(location)}
+        for faction in self.factions:
+            record = plain(faction)
+            record["assets"] = [asset.uuid for asset in faction.assets]
+            record["bases"] = [base.uuid for base in faction.bases]
+            yield {"kind": "faction", **record}
+            for asset in faction.assets:
+                yield {"kind": "asset", **plain(asset)}
+            for base in faction.bases:
+                yield {"kind": "base", **plain(base)}
+        yield {"kind": "turn", **plain(self.turn)}
+
+
+def plain(obj: object) -> object:
+    """Convert a model object to plain dicts, lists and values, as saved in the project."""
+    # Most values are leaves, and the YamlAble check is slow
+    if type(obj) in _LEAF_TYPES:
+        return obj
+    if isinstance(obj, YamlAble):
+        return {key: plain(value) for key, value in obj.__to_yaml_dict__().items()}
+    if isinstance(obj, list | tuple):
+        return [plain(value) for value in obj]
+    if isinstance(obj, dict):
+        return {key: plain(value) for key, value in obj.items()}
+    if isinstance(obj, Enum):
+        return obj.value
+    return obj
+
+
+def load_project(filename: str, progress: Callable[[float], None] = None) -> Project | None:
+    """
+    Load and link a project file. Returns None if the file is missing, empty or broken.
+
+    The file is read with the streaming loader, which calls `progress` with the fraction of the
+    file read so far.
+    """
+    try:
+        project_data = load_yaml_stream(filename, progress)
+    except FileNotFoundError:
+        logger.info(f"Didn't find file {filename}, using default values.")
+        return None
+    except (OSError, yaml.YAMLError, TypeError, ValueError):
+        logger.exception(f"Error: Failed to parse file {filename}")
+        return None
+    if not project_data:
+        return None
+    project = Project(
+        factions=project_data.get("factions", []),
+        locations=project_data.get("locations", []),
+        turn=project_data.get("turn") or FactionTurn(),
+    )
+    project.problems = restore_links(project)
+    for problem in project.problems:
+        logger.warning(f"{filename}: {problem}")
+    return project
+
+
+class ProjectLoad:
+    """Loads a project file in a background thread, for the GUI to poll."""
+
+    def __init__(self: Self, filename: str) -> None:
+        """Initialize ProjectLoad object and start loading."""
+        self.filename = filename
+        # Fraction of the file read so far, and the result once done (None on errors)
+        self.progress = 0.0
+        self.project: Project | None = None
+        self._thread = threading.Thread(target=self._run, name="ProjectLoad", daemon=True)
+        self._thread.start()
+
+    @property
+    def done(self: Self) -> bool:
+        return not self._thread.is_alive()
+
+    def _run(self: Self) -> None:
+        self.project = load_project(self.filename, progress=self._set_progress)
+        # Along with the catalog, so the rules search is ready on the first frame
+        rules_index()
+
+    def _set_progress(self: Self, progress: float) -> None:
+        self.progress = progress
+
+
+def save_project(filename: str, project: Project) -> None:
+    write_yaml(filename=filename, data=project.to_yaml_data())
+
+
+def restore_links(project: Project) -> list[str]:
+    """
+    Restore links to objects from uuid and ident strings, after loading.
+
+    References that can't be resolved are left as strings (or dropped, for the turn order and
+    the location lists), and are returned as a list of problems.
+    """
+    problems: list[str] = []
+    locations = {location.uuid: location for location in project.locations}
+    tags = {prototype.id: prototype for prototype in tags_list()}
+    assets: dict[str, Asset] = {}
+    bases: dict[str, BaseOfInfluence] = {}
+    for faction in project.factions:
+        # BoI locations
+        for base in faction.bases:
+            bases[base.uuid] = base
+            if isinstance(base.location, str):
+                if base.location in locations:
+                    base.location = locations[base.location]
+                else:
+                    problems.append(f"{faction.name}: base {base.uuid} in unknown location")
+        # Tags (from prototype)
+        for tag in faction.tags:
+            if isinstance(tag.prototype, str):  # Note, can be None
+                if tag.prototype in tags:
+                    tag.prototype = tags[tag.prototype]
+                else:
+                    problems.append(f"{faction.name}: unknown tag {tag.prototype}")
+        # Assets (from prototype)
+        for asset in faction.assets:
+            assets[asset.uuid] = asset
+            # Note: qualities are restored from ids by Asset itself
+            # Asset location
+            if isinstance(asset.loc, str):
+                if asset.loc in locations:
+                    asset.loc = locations[asset.loc]
+                else:
+                    problems.append(f"{faction.name}: asset {asset.uuid} in unknown location")
+
+    # Faction turn order
+    turn = project.turn
+    if turn.turn_order:
+        factions = {faction.uuid: faction for faction in project.factions}
+        turn_order: list[Faction] = []
+        for faction_id in turn.turn_order:
+            faction = faction_id if isinstance(faction_id, Faction) else factions.get(faction_id)
+            if faction is None:
+                problems.append(f"Turn order: unknown faction {faction_id}")
+            else:
+                turn_order.append(faction)
+        turn.turn_order = turn_order
+    # Location references
+    for location in project.locations:
+        location_assets: list[Asset] = []
+        for asset_id in location.assets:
+            asset = asset_id if isinstance(asset_id, Asset) else assets.get(asset_id)
+            if asset is None:
+                problems.append(f"{location.name}: unknown asset {asset_id}")
+            else:
+                location_assets.append(asset)
+        location.assets = location_assets
+        location_bases: list[BaseOfInfluence] = []
+        for base_id in location.bases:
+            base = base_id if isinstance(base_id, BaseOfInfluence) else bases.get(base_id)
+            if base is None:
+                problems.append(f"{location.name}: unknown base {base_id}")
+            else:
+                location_bases.append(base)
+        location.bases = location_bases
+    return problems
+
+
+def validate_project(project: Project) -> list[str]:
+    """Check a linked project for inconsistencies. Returns a list of problems."""
+    problems: list[str] = []
+    seen: set[str] = set()
+    # Identities of the assets and bases listed by each location
+    location_assets = {id(loc): {id(asset) for asset in loc.assets} for loc in project.locations}
+    location_bases = {id(loc): {id(base) for base in loc.bases} for loc in project.locations}
+
+    def check_uuid(uuid: str, what: str) -> None:
+        if not uuid:
+            problems.append(f"{what}: missing uuid")
+        elif uuid in seen:
+            problems.append(f"{what}: duplicate uuid {uuid}")
+        seen.add(uuid)
+
+    for location in project.locations:
+        check_uuid(location.uuid, f"Location {location.name}")
+    for faction in project.factions:
+        check_uuid(faction.uuid, f"Faction {faction.name}")
+        if not 0 <= faction.hp <= faction.max_hp():
+            problems.append(f"{faction.name}: hp {faction.hp} out of range 0-{faction.max_hp()}")
+        if faction.treasure < 0:
+            problems.append(f"{faction.name}: negative Treasure {faction.treasure}")
+        for asset in faction.assets:
+            what = f"{faction.name}: asset {asset.uuid}"
+            check_uuid(asset.uuid, what)
+            if asset.owner != faction.uuid:
+                problems.append(f"{what}: owned by {asset.owner}")
+            if not asset.is_initialized():
+                problems.append(f"{what}: no asset prototype ({asset.prototype})")
+            elif not 0 < asset.hp <= asset.max_hp():
+                problems.append(f"{what}: hp {asset.hp} out of range 1-{asset.max_hp()}")
+            if isinstance(asset.loc, Location) and id(asset) not in location_assets.get(
+                id(asset.loc), ()
+            ):
+                problems.append(f"{what}: missing from the assets of {asset.loc.name}")
+        for base in faction.bases:
+            what = f"{faction.name}: base {base.uuid}"
+            check_uuid(base.uuid, what)
+            if base.owner != faction.uuid:
+                problems.append(f"{what}: owned by {base.owner}")
+            if isinstance(base.location, Location) and id(base) not in location_bases.get(
+                id(base.location), ()
+            ):
+                problems.append(f"{what}: missing from the bases of {base.location.name}")
+    for location in project.locations:
+        for asset in location.assets:
+            if asset.loc is not location:
+                problems.append(f"{location.name}: lists asset {asset.uuid} located elsewhere")
+        for base in location.bases:
+            if base.location is not location:
+                problems.append(f"{location.name}: lists base {base.uuid} located elsewhere")
+    return problems
+
+
+def export_json(project: Project) -> Iterator[str]:
+    """Yield the project records as lines of newline-delimited JSON."""
+    for record in project.records():
+        yield json.dumps(record, separators=(",", ":")) + "\n"
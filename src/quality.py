@@ -7,6 +7,7 @@ class Quality:
         name: str,
         ident: str,
         rules: str,
+        bit: int,
         persistent: bool = True,
     ) -> None:
         """Instantiate Quality object."""
@@ -14,3 +15,5 @@ class Quality:
         self.id = ident
         self.rules = rules
         self.persistent = persistent
+        # Each quality owns one bit of an asset's quality mask
+        self.mask: int = 1 << bit
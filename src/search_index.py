@@ -0,0 +1,325 @@
+"""
+Search index of factions, assets and locations.
+
+An inverted index from words to the entities they appear in, over names, descriptions, notes,
+prototype idents, asset types, qualities, tags, goals, locations and owners. Queries are
+words, all of which must match; a word can be limited to one field with `field:word`. The
+last word matches as a prefix, so results follow the query as it is typed:
+
+```py
+search = SearchIndex()
+search.rebuild(project.factions, project.locations)
+index.subscribe(search.on_change)       # Keep it up to date with the SpatialIndex
+
+search.search("kind:asset quality:stealth type:force loc:harbor tag:martial")
+search.search("inform")                 # Informers, Informant Network, ...
+```
+
+Assets also carry the location, name and tags of their owner, so they can be filtered on them.
+
+The index is updated one entity at a time, through `on_change`. For type-ahead on large
+worlds, a search never looks at more entities than it needs: candidates come from the rarest
+of the complete words and the prefix, the other words are checked against them, and the search
+stops once `limit` results are found.
+"""
+
+import re
+from bisect import bisect_left, insort
+from collections.abc import Iterable, Iterator
+from functools import lru_cache
+from typing import Self
+
+from src.asset import Asset
+from src.faction import Faction
+from src.location import Location
+from src.system import qualities_from_mask
+
+# Results returned by default, enough to fill the search window
+DEFAULT_LIMIT = 100
+
+FIELDS = (
+    "kind",
+    "name",
+    "desc",
+    "notes",
+    "proto",
+    "type",
+    "quality",
+    "tag",
+    "goal",
+    "loc",
+    "owner",
+)
+# Fields that assets take from other entities, and that change when those do
+LOCATION_FIELDS = ("loc",)
+OWNER_FIELDS = ("owner", "tag")
+FACTION_KIND = frozenset(("faction",))
+ASSET_KIND = frozenset(("asset",))
+LOCATION_KIND = frozenset(("location",))
+
+_WORD = re.compile(r"\w+")
+# A word of a query, maybe limited to a field
+_QUERY_WORD = re.compile(r"(?:(\w+):)?(\w*)")
+
+Entity = Faction | Asset | Location
+Document = dict[str, frozenset[str]]
+
+
+@lru_cache(maxsize=4096)
+def tokenize(text: str) -> frozenset[str]:
+    """Return the lowercase words of a text."""
+    return frozenset(_WORD.findall(text.lower())) if text else frozenset()
+
+
+@lru_cache(maxsize=256)
+def _quality_words(mask: int) -> frozenset[str]:
+    return tokenize(" ".join(quality.name for quality in qualities_from_mask(mask)))
+
+
+def _tag_names(faction: Faction) -> str:
+    names = []
+    for tag in faction.tags:
+        prototype = tag.prototype
+        if prototype is None:
+            continue
+        names.append(
+            prototype if isinstance(prototype, str) else f"{prototype.name} {prototype.id}"
+        )
+    return " ".join(names)
+
+
+class SearchIndex:
+    """Inverted index of words -> factions, assets and locations."""
+
+    def __init__(self: Self) -> None:
+        """Initialize an empty SearchIndex."""
+        self.clear()
+
+    def clear(self: Self) -> None:
+        """Drop all indexed entities."""
+        self._postings: dict[str, set[Entity]] = {}
+        # All indexed words, sorted, to find the words that start with a prefix
+        self._words: list[str] = []
+        # The document each entity is currently filed under, so it can be unfiled after a change
+        self._docs: dict[Entity, Document] = {}
+        # Factions by uuid, the owners of the indexed assets
+        self.factions: dict[str, Faction] = {}
+        # Counts changes, so that results can be kept until the index changes
+        self.version: int = 0
+
+    def __len__(self: Self) -> int:
+        return len(self._docs)
+
+    def rebuild(self: Self, factions: list[Faction], locations: list[Location]) -> None:
+        """Index all factions, their assets and all locations from scratch."""
+        self.clear()
+        # Assets take words from the documents of their location and owner, so those go first
+        for loc in locations:
+            self._file(loc, self._location_doc(loc))
+        for faction in factions:
+            self.factions[faction.uuid] = faction
+            self._file(faction, self._faction_doc(faction))
+            for asset in faction.assets:
+                self._file(asset, self._asset_doc(asset))
+
+    # Documents
+
+    @staticmethod
+    def _faction_doc(faction: Faction) -> Document:
+        return {
+            "kind": FACTION_KIND,
+            "name": tokenize(faction.name),
+            "desc": tokenize(faction.desc),
+            "notes": tokenize(faction.notes),
+            "tag": tokenize(_tag_names(faction)),
+            "goal": tokenize(faction.goal.name if faction.goal else ""),
+        }
+
+    def _asset_doc(self: Self, asset: Asset) -> Document:
+        owner = self._docs.get(self.factions.get(asset.owner), {})
+        loc = self._docs.get(asset.loc)
+        if asset.is_initialized():
+            proto, asset_type = asset.prototype.strings.id, asset.prototype.type.name
+        else:
+            proto, asset_type = "", getattr(asset.prototype, "name", "")
+        return {
+            "kind": ASSET_KIND,
+            "name": tokenize(str(asset)),
+            "desc": tokenize(asset.desc),
+            "proto": tokenize(proto),
+            "type": tokenize(asset_type),
+            "quality": _quality_words(asset.quality_mask),
+            "loc": loc["name"] if loc else tokenize(asset.loc.name if asset.loc else ""),
+            "owner": owner.get("name", frozenset()),
+            "tag": owner.get("tag", frozenset()),
+        }
+
+    @staticmethod
+    def _location_doc(loc: Location) -> Document:
+        return {
+            "kind": LOCATION_KIND,
+            "name": tokenize(loc.name),
+            "desc": tokenize(loc.desc),
+        }
+
+    # Filing
+
+    def _file(self: Self, entity: Entity, doc: Document) -> None:
+        self._docs[entity] = doc
+        for words in doc.values():
+            for word in words:
+                posting = self._postings.get(word)
+                if posting is None:
+                    posting = self._postings[word] = set()
+                    insort(self._words, word)
+                posting.add(entity)
+        self.version += 1
+
+    def _unfile(self: Self, entity: Entity) -> Document | None:
+        doc = self._docs.pop(entity, None)
+        if doc is None:
+            return None
+        for words in doc.values():
+            for word in words:
+                posting = self._postings.get(word)
+                if posting is None:
+                    # Already unfiled, the word is in more than one field
+                    continue
+                posting.discard(entity)
+                if not posting:
+                    del self._postings[word]
+                    del self._words[bisect_left(self._words, word)]
+        self.version += 1
+        return doc
+
+    def _refile(self: Self, entity: Entity, doc: Document) -> Document | None:
+        old = self._unfile(entity)
+        self._file(entity, doc)
+        return old
+
+    def on_change(self: Self, entity: object, removed: bool = False) -> None:
+        """Update the index after an entity changed, see `SpatialIndex.subscribe`."""
+        if isinstance(entity, Asset):
+            if removed:
+                self._unfile(entity)
+            else:
+                self._refile(entity, self._asset_doc(entity))
+        elif isinstance(entity, Faction):
+            if removed:
+                self.factions.pop(entity.uuid, None)
+                self._unfile(entity)
+                return
+            self.factions[entity.uuid] = entity
+            doc = self._faction_doc(entity)
+            old = self._refile(entity, doc)
+            # Assets show the name and tags of their owner
+            if old is None or old["name"] != doc["name"] or old["tag"] != doc["tag"]:
+                self._refile_assets(entity.assets, OWNER_FIELDS)
+        elif isinstance(entity, Location):
+            if removed:
+                self._unfile(entity)
+                return
+            doc = self._location_doc(entity)
+            old = self._refile(entity, doc)
+            if old is not None and old["name"] != doc["name"]:
+                self._refile_assets(entity.assets, LOCATION_FIELDS)
+
+    def _refile_assets(self: Self, assets: Iterable[Asset], fields: tuple[str, ...]) -> None:
+        for asset in assets:
+            if asset not in self._docs:
+                continue
+            doc = self._asset_doc(asset)
+            if any(self._docs[asset][field] != doc[field] for field in fields):
+                self._refile(asset, doc)
+
+    # Queries
+
+    @staticmethod
+    def parse(query: str) -> list[tuple[str | None, str]]:
+        """Split a query into (field, word) pairs. The field is None when not given."""
+        words = []
+        for match in _QUERY_WORD.finditer(query.lower()):
+            field, word = match.groups()
+            if field is not None and field not in FIELDS:
+                # Not a field, so both are plain words
+                words.append((None, field))
+                field = None
+            if word or field:
+                words.append((field, word))
+        return words
+
+    @staticmethod
+    def _has(doc: Document, field: str | None, word: str) -> bool:
+        if field is None:
+            return any(word in words for words in doc.values())
+        return word in doc.get(field, ())
+
+    @staticmethod
+    def _has_prefix(doc: Document, field: str | None, prefix: str) -> bool:
+        fields = doc.values() if field is None else (doc.get(field, ()),)
+        return any(word.startswith(prefix) for words in fields for word in words)
+
+    def _prefixed(self: Self, prefix: str) -> Iterator[Entity]:
+        """Yield the entities with a word starting with `prefix`, maybe more than once."""
+        words = self._words
+        for idx in range(bisect_left(words, prefix), len(words)):
+            if not words[idx].startswith(prefix):
+                return
+            yield from self._postings[words[idx]]
+
+    def _prefix_size(self: Self, prefix: str, limit: int) -> int | None:
+        """Return how many entities have a word starting with `prefix`, or None if over `limit`."""
+        words = self._words
+        size = 0
+        for idx in range(bisect_left(words, prefix), len(words)):
+            if not words[idx].startswith(prefix):
+                break
+            size += len(self._postings[words[idx]])
+            if size >= limit:
+                return None
+        return size
+
+    def search(self: Self, query: str, limit: int = DEFAULT_LIMIT) -> list[Entity]:
+        """
+        Return up to `limit` entities that match all words of a query.
+
+        The last word matches as a prefix, unless the query ends with a space.
+        """
+        words = self.parse(query)
+        if not words:
+            return []
+        prefix_field, prefix = None, None
+        if not query[-1].isspace():
+            prefix_field, prefix = words.pop()
+        words = [(field, word) for field, word in words if word]
+        postings = []
+        for _, word in words:
+            posting = self._postings.get(word)
+            if posting is None:
+                return []
+            postings.append(posting)
+        postings.sort(key=len)
+        # The rarest of the complete words and the prefix gives the candidates
+        if prefix and (not postings or self._prefix_size(prefix, len(postings[0])) is not None):
+            candidates: Iterable[Entity] = self._prefixed(prefix)
+            checked = postings
+        elif postings:
+            candidates, checked = postings[0], postings[1:]
+        else:
+            candidates, checked = self._docs, postings
+        docs = self._docs
+        results: list[Entity] = []
+        seen: set[Entity] = set()
+        for entity in candidates:
+            if entity in seen or any(entity not in posting for posting in checked):
+                continue
+            seen.add(entity)
+            doc = docs[entity]
+            if not all(field is None or self._has(doc, field, word) for field, word in words):
+                continue
+            if prefix is not None and not self._has_prefix(doc, prefix_field, prefix):
+                continue
+            results.append(entity)
+            if len(results) >= limit:
+                break
+        return results
@@ -0,0 +1,650 @@
+"""
+Local HTTP/JSON API server.
+
+Serves the project state read-only over HTTP, so that players can follow their faction from
+a phone or browser on the local network:
+
+```
+GET /api/turn               Turn counter, FSM state and turn order
+GET /api/factions           All factions
+GET /api/factions/<uuid>    One faction, with its assets and bases
+GET /api/locations          All locations
+GET /api/views/<uuid>       What one player faction can see, see below
+GET /api/events             Server-sent events, see below
+```
+
+A view holds the faction itself and the locations it can see (where it has assets or bases),
+with the bases and assets visible there: rival assets with Stealth are left out. Visibility
+comes from the `SpatialIndex`, so a view is as cheap to build as it is small. With
+`full_state` turned off, only the turn and the views are served, and players can't look up
+hidden assets in the full state.
+
+Every response has an ETag built from the revision counter of the document, which only
+changes when the document's contents do. A request with a matching If-None-Match header gets
+an empty 304 response, so clients can poll cheaply.
+
+The event stream sends a "turn" event with the turn document whenever the turn state
+changes, a "change" event listing the changed documents, and each turn event from the
+`EventLog`, named by its type (e.g. "asset_created"). Turn events are only sent along with
+the full state, as they can reveal hidden assets.
+
+The server runs an asyncio event loop in a background thread, and never touches the model
+itself: the GUI thread serializes the model with `update`, and the server only swaps in the
+latest documents. Only the documents that changed are serialized again. Changes are reported
+by the `SpatialIndex` subscription (`on_change`) and the turn events (`on_event`), so edits
+must go through the index's mutation methods or be reported with `SpatialIndex.changed`.
+Slow event stream clients are dropped rather than buffered without limit. There is no access
+control, so only enable the server on a trusted network.
+"""
+
+import json
+import logging
+import threading
+from collections import defaultdict
+from collections.abc import Iterable
+from dataclasses import dataclass
+from http import HTTPStatus
+from typing import TYPE_CHECKING, Self
+from urllib.parse import urlsplit
+from uuid import uuid4
+
+from src.base_of_influence import BaseOfInfluence
+from src.faction import Faction
+from src.lazy_import import lazy_import
+from src.location import Location
+from src.project import plain
+from src.spatial_index import SpatialIndex
+from src.turn import FactionTurn
+
+if TYPE_CHECKING:
+    from src.asset import Asset
+    from src.events import Event
+
+# asyncio is only needed once the server is started, and the event types once it gets events
+asyncio = lazy_import("asyncio")
+events = lazy_import("src.events")
+
+logger = logging.getLogger(__name__)
+
+# Seconds between keep-alive comments on idle event streams
+HEARTBEAT_INTERVAL = 15.0
+# Seconds to wait for a client to send its request
+REQUEST_TIMEOUT = 10.0
+# Messages buffered per event stream client before it is dropped
+CLIENT_QUEUE_SIZE = 256
+
+
+@dataclass(frozen=True, slots=True)
+class ServerSettings:
+    enabled: bool = False
+    # Use "0.0.0.0" to accept connections from other devices
+    host: str = "127.0.0.1"
+    port: int = 8765
+    # Max number of open event streams
+    max_clients: int = 64
+    # Also serve the unfiltered factions and locations, and forward turn events
+    full_state: bool = True
+
+    @staticmethod
+    def from_config(config_data: dict) -> "ServerSettings":
+        config_server: dict = config_data.get("server", {})
+        defaults = ServerSettings()
+        return ServerSettings(
+            enabled=config_server.get("enabled", defaults.enabled),
+            host=config_server.get("host", defaults.host),
+            port=config_server.get("port", defaults.port),
+            max_clients=config_server.get("max_clients", defaults.max_clients),
+            full_state=config_server.get("full_state", defaults.full_state),
+        )
+
+
+class Document:
+    """
+    A serialized JSON response.
+
+    Large documents share most of their parts with other documents, e.g. the locations of the
+    views. They are only joined into one body on the server thread, once they are requested.
+    """
+
+    __slots__ = ("etag", "_parts", "_body")
+
+    def __init__(self: Self, etag: str, parts: tuple[bytes, ...]) -> None:
+        """Initialize Document object."""
+        self.etag = etag
+        self._parts = parts
+        self._body: bytes = None
+
+    @property
+    def body(self: Self) -> bytes:
+        if self._body is None:
+            self._body = b"".join(self._parts)
+            self._parts = None
+        return self._body
+
+
+def _json(data: object) -> bytes:
+    return json.dumps(data, separators=(",", ":")).encode()
+
+
+def _array(items: Iterable[bytes]) -> tuple[bytes, ...]:
+    """Parts of a JSON array of serialized items, see `Document`."""
+    parts = []
+    for item in items:
+        parts += (b",", item)
+    # Replace the first comma, or add the opening bracket of an empty array
+    parts[:1] = [b"["]
+    parts.append(b"]")
+    return tuple(parts)
+
+
+def _sse(event: str, data: bytes) -> bytes:
+    return b"event: " + event.encode() + b"\ndata: " + data + b"\n\n"
+
+
+def _turn_document(turn: FactionTurn) -> dict:
+    turn_order = turn.turn_order or []
+    current = turn_order[turn.cur_faction] if turn.cur_faction < len(turn_order) else None
+    return {
+        "turn_idx": turn.turn_idx,
+        "state": turn.state.name,
+        "current": current.uuid if current else None,
+        "turn_order": [
+            {
+                "uuid": faction.uuid,
+                "name": faction.name,
+                "initiative": faction.initiative,
+                "npc": faction.npc,
+            }
+            for faction in turn_order
+        ],
+    }
+
+
+def _where(entity: "Asset | BaseOfInfluence") -> Location | None:
+    loc = entity.location if isinstance(entity, BaseOfInfluence) else entity.loc
+    return loc if isinstance(loc, Location) else None
+
+
+class ApiServer:
+    """Serves snapshots of the model over HTTP from a background thread."""
+
+    def __init__(self: Self, settings: ServerSettings = None) -> None:
+        """Initialize ApiServer object."""
+        self.settings = settings or ServerSettings()
+        # Makes ETags from different server runs differ
+        self._instance = uuid4().hex[:8]
+        # GUI thread state: parts of the last serialized bodies and revision counters, by path
+        self._bodies: dict[str, tuple[bytes, ...]] = {}
+        self._revisions: dict[str, int] = {}
+        self._turn_key: tuple = None
+        # The model lists last published. New lists, i.e. another project, are published in full
+        self._factions: list[Faction] = None
+        self._locations: list[Location] = None
+        # Changes since the last publish, see `on_change` and `on_event`
+        self._dirty_factions: set[str] = set()
+        self._dirty_views: set[str] = set()
+        self._dirty_locations: set[Location] = set()
+        # (owner, uuid) of the damaged assets and bases, only reported by the turn events
+        self._damaged: list[tuple[str, str]] = []
+        # Serialized factions and locations, and the parts of the locations of each view, by uuid
+        self._faction_json: dict[str, bytes] = {}
+        self._location_json: dict[str, bytes] = {}
+        self._view_parts: dict[str, tuple[bytes, ...]] = {}
+        # Assets and bases converted with `plain`, and each location of each view, by viewer and
+        # location. Most of the world shows up in many documents, which are put together from these.
+        self._records: dict[object, dict] = {}
+        self._entries: dict[str, dict[Location, bytes]] = {}
+        # Initiative of each faction as serialized, as rolling initiative emits no event
+        self._initiatives: dict[str, int] = {}
+        # The views of each location, and the location of each asset and base as last seen, to
+        # find the views that a change shows up in
+        self._viewers: dict[Location, set[str]] = defaultdict(set)
+        self._placed: dict[object, Location] = {}
+        # Shared with the server thread; replaced as a whole, never modified
+        self._documents: dict[str, Document] = {}
+        # Server thread state
+        self._loop: asyncio.AbstractEventLoop = None
+        self._thread: threading.Thread = None
+        self._server: asyncio.Server = None
+        self._clients: set[asyncio.Queue] = set()
+
+    @property
+    def running(self: Self) -> bool:
+        return self._thread is not None
+
+    @property
+    def address(self: Self) -> str:
+        """Base URL of the server. The port is only known once the server has started."""
+        port = self.settings.port
+        if self._server and self._server.sockets:
+            port = self._server.sockets[0].getsockname()[1]
+        return f"http://{self.settings.host}:{port}"
+
+    # GUI thread
+
+    def start(self: Self) -> None:
+        """Start serving in a background thread."""
+        if self.running:
+            return
+        self._loop = asyncio.new_event_loop()
+        started = threading.Event()
+        self._thread = threading.Thread(
+            target=self._run, args=(started,), name="ApiServer", daemon=True
+        )
+        self._thread.start()
+        started.wait()
+        if self._server is None:
+            self._thread.join()
+            self._thread = None
+            return
+        # Changes aren't tracked while stopped, so start over
+        self._factions = None
+        logger.info(f"API server listening on {self.address}")
+
+    def stop(self: Self) -> None:
+        """Close all connections and stop the server thread."""
+        if not self.running:
+            return
+        self._loop.call_soon_threadsafe(self._loop.stop)
+        self._thread.join()
+        self._thread = None
+        self._server = None
+        logger.info("API server stopped")
+
+    def on_change(self: Self, entity: object, removed: bool = False) -> None:
+        """SpatialIndex subscriber: note the documents that a change shows up in."""
+        if not self.running:
+            return
+        if isinstance(entity, Faction):
+            self._dirty_factions.add(entity.uuid)
+            self._dirty_views.add(entity.uuid)
+        elif isinstance(entity, Location):
+            self._dirty_locations.add(entity)
+        else:
+            # An asset or base, shown by its owner and at its old and new location
+            self._records.pop(entity, None)
+            old = self._placed.pop(entity, None)
+            if old:
+                self._dirty_locations.add(old)
+            loc = _where(entity)
+            if loc and not removed:
+                self._placed[entity] = loc
+                self._dirty_locations.add(loc)
+            self._dirty_factions.add(entity.owner)
+            self._dirty_views.add(entity.owner)
+
+    def on_event(self: Self, event: "Event") -> None:
+        """EventLog subscriber: note the changed factions, and forward turn events to the event streams."""  # noqa: E501
+        if not self.running:
+            return
+        # Treasure, hit points and goal progress change without going through the index
+        self._dirty_factions.add(event.faction)
+        if isinstance(event, events.AssetDamaged | events.AssetDestroyed):
+            self._dirty_factions.update((event.owner, event.source))
+        if isinstance(event, events.AssetDamaged):
+            self._damaged.append((event.owner, event.asset))
+        if self.settings.full_state:
+            self._broadcast(_sse(event.kind, _json(event.to_dict())))
+
+    def update(
+        self: Self,
+        factions: list[Faction],
+        locations: list[Location],
+        turn: FactionTurn,
+        index: SpatialIndex,
+    ) -> None:
+        """Publish the model, if it has changed. Call once per frame."""
+        if not self.running:
+            return
+        turn_key = (turn.turn_idx, turn.state, turn.cur_faction, turn.turn_order is None)
+        if turn_key != self._turn_key:
+            self._turn_key = turn_key
+            # A new round rolls initiative for all factions
+            for faction in factions:
+                if faction.initiative != self._initiatives.get(faction.uuid):
+                    self._dirty_factions.add(faction.uuid)
+        elif (
+            factions is self._factions
+            and locations is self._locations
+            and not self._dirty_factions
+            and not self._dirty_views
+            and not self._dirty_locations
+            and not self._damaged
+        ):
+            return
+        self.publish(factions, locations, turn, index)
+
+    def _reset(self: Self, factions: list[Faction], locations: list[Location]) -> None:
+        """Forget what was serialized, to publish new model lists in full."""
+        self._factions = factions
+        self._locations = locations
+        self._faction_json.clear()
+        self._location_json.clear()
+        self._view_parts.clear()
+        self._records.clear()
+        self._entries.clear()
+        self._initiatives.clear()
+        self._viewers.clear()
+        self._placed = {
+            entity: loc
+            for faction in factions
+            for entity in (*faction.assets, *faction.bases)
+            if (loc := _where(entity))
+        }
+
+    def publish(
+        self: Self,
+        factions: list[Faction],
+        locations: list[Location],
+        turn: FactionTurn,
+        index: SpatialIndex,
+    ) -> None:
+        """Serialize the documents that may have changed, and hand the changed ones to the server."""  # noqa: E501
+        full = factions is not self._factions or locations is not self._locations
+        if full:
+            self._reset(factions, locations)
+        dirty_factions, self._dirty_factions = self._dirty_factions, set()
+        dirty_views, self._dirty_views = self._dirty_views, set()
+        dirty_locations, self._dirty_locations = self._dirty_locations, set()
+        damaged, self._damaged = self._damaged, []
+        by_uuid = {faction.uuid: faction for faction in factions}
+        # Damage shows up at the location of the asset or base, unless it was destroyed
+        for owner, uuid in damaged:
+            faction = by_uuid.get(owner)
+            for entity in (*faction.assets, *faction.bases) if faction else ():
+                if entity.uuid == uuid:
+                    self._records.pop(entity, None)
+                    if loc := _where(entity):
+                        dirty_locations.add(loc)
+                    break
+        # Anything not serialized yet, e.g. everything after a reset
+        for faction in factions:
+            if faction.uuid not in self._faction_json:
+                dirty_factions.add(faction.uuid)
+            if not faction.npc and faction.uuid not in self._entries:
+                dirty_views.add(faction.uuid)
+        for location in locations:
+            if location.uuid not in self._location_json:
+                dirty_locations.add(location)
+
+        # Every document serialized again, and the ones that may be gone
+        bodies = {"/api/turn": (_json(_turn_document(turn)),)}
+        gone: set[str] = set()
+        for uuid in dirty_factions:
+            faction = by_uuid.get(uuid)
+            if faction is None:
+                self._faction_json.pop(uuid, None)
+                self._initiatives.pop(uuid, None)
+                gone.add(f"/api/factions/{uuid}")
+                continue
+            self._faction_json[uuid] = _json(self._faction_record(faction))
+            self._initiatives[uuid] = faction.initiative
+            if self.settings.full_state:
+                bodies[f"/api/factions/{uuid}"] = (self._faction_json[uuid],)
+        if dirty_locations:
+            present = set(locations)
+            for location in dirty_locations:
+                if location in present:
+                    self._location_json[location.uuid] = _json(plain(location))
+                else:
+                    self._location_json.pop(location.uuid, None)
+        if self.settings.full_state:
+            if dirty_factions or full:
+                bodies["/api/factions"] = _array(self._faction_json[f.uuid] for f in factions)
+            if dirty_locations or full:
+                bodies["/api/locations"] = _array(
+                    self._location_json[location.uuid] for location in locations
+                )
+
+        # A view shows its faction, and the locations it sees with what is visible there
+        rebuilt: set[str] = set()
+        shared: dict[tuple[Location, frozenset], bytes] = {}
+        for uuid in dirty_views:
+            faction = by_uuid.get(uuid)
+            if faction is None or faction.npc:
+                for location in self._entries.pop(uuid, {}):
+                    self._viewers[location].discard(uuid)
+                self._view_parts.pop(uuid, None)
+                gone.add(f"/api/views/{uuid}")
+                continue
+            entries = self._entries.setdefault(uuid, {})
+            shown = index.visible_locations(uuid)
+            for location in entries.keys() - shown:
+                del entries[location]
+                self._viewers[location].discard(uuid)
+            for location in shown - entries.keys():
+                entries[location] = self._entry(uuid, location, index, shared)
+                self._viewers[location].add(uuid)
+            rebuilt.add(uuid)
+        for location in dirty_locations:
+            for uuid in self._viewers.get(location, ()):
+                self._entries[uuid][location] = self._entry(uuid, location, index, shared)
+                rebuilt.add(uuid)
+        for uuid in rebuilt:
+            entries = self._entries[uuid]
+            self._view_parts[uuid] = _array(
+                entries[location] for location in sorted(entries, key=lambda loc: loc.name)
+            )
+        for uuid in rebuilt | dirty_factions:
+            if uuid in self._view_parts:
+                bodies[f"/api/views/{uuid}"] = (
+                    b'{"faction":',
+                    self._faction_json[uuid],
+                    b',"locations":',
+                    *self._view_parts[uuid],
+                    b"}",
+                )
+
+        if full:
+            gone |= self._bodies.keys()
+        removed = [path for path in gone if path in self._bodies and path not in bodies]
+        changed = [path for path, body in bodies.items() if self._bodies.get(path) != body]
+        if not changed and not removed:
+            return
+        documents = dict(self._documents)
+        for path in removed:
+            del self._bodies[path]
+            del documents[path]
+        for path in changed:
+            self._revisions[path] = self._revisions.get(path, 0) + 1
+            self._bodies[path] = bodies[path]
+            documents[path] = Document(f'"{self._instance}-{self._revisions[path]}"', bodies[path])
+        self._documents = documents
+        if "/api/turn" in changed:
+            self._broadcast(_sse("turn", bodies["/api/turn"][0]))
+        self._broadcast(_sse("change", _json({"changed": changed, "removed": removed})))
+
+    def _record(self: Self, entity: "Asset | BaseOfInfluence") -> dict:
+        record = self._records.get(entity)
+        if record is None:
+            record = self._records[entity] = plain(entity)
+        return record
+
+    def _faction_record(self: Self, faction: Faction) -> dict:
+        """Convert a faction like `plain`, with the cached records of its assets and bases."""
+        record = {}
+        for key, value in faction.__to_yaml_dict__().items():
+            if key in ("assets", "bases"):
+                record[key] = [self._record(entity) for entity in value]
+            else:
+                record[key] = plain(value)
+        return record
+
+    def _entry(
+        self: Self,
+        viewer: str,
+        location: Location,
+        index: SpatialIndex,
+        shared: dict[tuple[Location, frozenset], bytes],
+    ) -> bytes:
+        """
+        Serialize a location as seen by the faction `viewer`.
+
+        Most factions in a location see the same assets, so `shared` caches the entries by what
+        they show.
+        """
+        visible = frozenset(index.visible_assets(viewer, location))
+        entry = shared.get((location, visible))
+        if entry is None:
+            assets = sorted(visible, key=lambda a: a.uuid)
+            bases = sorted(index.visible_bases(viewer, location), key=lambda b: b.uuid)
+            entry = shared[location, visible] = _json(
+                {
+                    "uuid": location.uuid,
+                    "name": location.name,
+                    "assets": [self._record(asset) for asset in assets],
+                    "bases": [self._record(base) for base in bases],
+                }
+            )
+        return entry
+
+    def _broadcast(self: Self, message: bytes) -> None:
+        self._loop.call_soon_threadsafe(self._fan_out, message)
+
+    # Server thread
+
+    def _run(self: Self, started: threading.Event) -> None:
+        asyncio.set_event_loop(self._loop)
+        try:
+            self._server = self._loop.run_until_complete(
+                asyncio.start_server(self._handle, self.settings.host, self.settings.port)
+            )
+        except OSError:
+            logger.exception(f"Error: Failed to start API server on port {self.settings.port}")
+            started.set()
+            self._loop.close()
+            return
+        started.set()
+        try:
+            self._loop.run_forever()
+        finally:
+            self._server.close()
+            for queue in list(self._clients):
+                self._drop(queue)
+            # Let the handlers see the end of their streams and close their connections
+            tasks = asyncio.all_tasks(self._loop)
+            if tasks:
+                _, pending = self._loop.run_until_complete(asyncio.wait(tasks, timeout=1.0))
+                for task in pending:
+                    task.cancel()
+                self._loop.run_until_complete(asyncio.gather(*pending, return_exceptions=True))
+            self._loop.close()
+
+    def _fan_out(self: Self, message: bytes) -> None:
+        for queue in list(self._clients):
+            try:
+                queue.put_nowait(message)
+            except asyncio.QueueFull:
+                logger.warning("Dropping a slow API event stream client")
+                self._drop(queue)
+
+    def _drop(self: Self, queue: "asyncio.Queue") -> None:
+        """End an event stream, by replacing whatever is queued with the end marker."""
+        self._clients.discard(queue)
+        while not queue.empty():
+            queue.get_nowait()
+        queue.put_nowait(None)
+
+    async def _handle(
+        self: Self, reader: "asyncio.StreamReader", writer: "asyncio.StreamWriter"
+    ) -> None:
+        try:
+            request_line = await asyncio.wait_for(reader.readline(), REQUEST_TIMEOUT)
+            headers: dict[str, str] = {}
+            while True:
+                line = await asyncio.wait_for(reader.readline(), REQUEST_TIMEOUT)
+                if line in (b"\r\n", b"\n", b""):
+                    break
+                name, _, value = line.decode("latin-1").partition(":")
+                headers[name.strip().lower()] = value.strip()
+            try:
+                method, target, _ = request_line.decode("latin-1").split(" ", 2)
+            except ValueError:
+                self._respond(writer, HTTPStatus.BAD_REQUEST)
+                return
+            path = urlsplit(target).path.rstrip("/")
+            if method not in ("GET", "HEAD"):
+                self._respond(writer, HTTPStatus.METHOD_NOT_ALLOWED)
+            elif path == "/api/events":
+                await self._stream(writer)
+            else:
+                self._get(writer, path, headers, head=method == "HEAD")
+            await writer.drain()
+        except (ConnectionError, TimeoutError):
+            pass
+        finally:
+            writer.close()
+
+    def _respond(
+        self: Self,
+        writer: "asyncio.StreamWriter",
+        status: HTTPStatus,
+        body: bytes = b"",
+        headers: dict[str, str] = None,
+    ) -> None:
+        lines = [
+            f"HTTP/1.1 {status.value} {status.phrase}",
+            "Connection: close",
+            "Access-Control-Allow-Origin: *",
+            *(f"{name}: {value}" for name, value in (headers or {}).items()),
+        ]
+        if status != HTTPStatus.NOT_MODIFIED:
+            lines.append(f"Content-Length: {len(body)}")
+        writer.write(("\r\n".join(lines) + "\r\n\r\n").encode("latin-1") + body)
+
+    def _get(
+        self: Self, writer: "asyncio.StreamWriter", path: str, headers: dict[str, str], head: bool
+    ) -> None:
+        document = self._documents.get(path)
+        if document is None:
+            self._respond(writer, HTTPStatus.NOT_FOUND, _json({"error": f"Not found: {path}"}))
+            return
+        etags = [etag.strip() for etag in headers.get("if-none-match", "").split(",")]
+        if document.etag in etags or "*" in etags:
+            self._respond(writer, HTTPStatus.NOT_MODIFIED, headers={"ETag": document.etag})
+            return
+        self._respond(
+            writer,
+            HTTPStatus.OK,
+            b"" if head else document.body,
+            {
+                "Content-Type": "application/json",
+                "ETag": document.etag,
+                "Cache-Control": "no-cache",
+            },
+        )
+
+    async def _stream(self: Self, writer: "asyncio.StreamWriter") -> None:
+        """Send server-sent events until the client goes away or falls behind."""
+        if len(self._clients) >= self.settings.max_clients:
+            self._respond(
+                writer,
+                HTTPStatus.SERVICE_UNAVAILABLE,
+                _json({"error": "Too many event stream clients"}),
+            )
+            return
+        queue: asyncio.Queue = asyncio.Queue(maxsize=CLIENT_QUEUE_SIZE)
+        self._clients.add(queue)
+        try:
+            writer.write(
+                b"HTTP/1.1 200 OK\r\n"
+                b"Content-Type: text/event-stream\r\n"
+                b"Cache-Control: no-cache\r\n"
+                b"Connection: close\r\n"
+                b"Access-Control-Allow-Origin: *\r\n\r\n"
+            )
+            turn = self._documents.get("/api/turn")
+            if turn:
+                writer.write(_sse("turn", turn.body))
+            await writer.drain()
+            while True:
+                try:
+                    message = await asyncio.wait_for(queue.get(), HEARTBEAT_INTERVAL)
+                except TimeoutError:
+                    message = b": keep-alive\n\n"
+                if message is None:
+                    break
+                writer.write(message)
+                await writer.drain()
+        finally:
+            self._clients.discard(queue)
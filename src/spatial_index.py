@@ -0,0 +1,336 @@
+"""
+Spatial index of assets and bases.
+
+Answers "who is where" queries, such as all rival bases in a location or all assets
+of a faction in a location, with set lookups instead of walking `Location.assets`
+and `Location.bases` and comparing owner strings.
+
+The index must be kept up to date through its mutation methods (`add_asset`,
+`move_asset`, `remove_asset`, `update_asset` and the base equivalents), which also
+keep the `Location.assets`/`Location.bases` lists in sync. To add, remove or move many assets
+at once, use `add_assets`, `remove_assets` and `move_assets`: they update each location list
+in one pass, rather than one `list.remove` per asset.
+
+The index also keeps what each faction can see: a faction sees the locations where it has
+assets or bases of influence, and in those, all bases and all assets except rival assets with
+the Stealth quality. This is kept per (viewer, location) as entries are filed, so per-faction
+views cost as much as what they show, not as much as the whole world.
+
+Other indexes, the API server and the label cache `subscribe` to the changes that go through the
+mutation methods. Edits that don't move anything, such as renaming a faction or a location or
+repairing an asset, are reported with `changed`.
+"""
+
+from collections import Counter, defaultdict
+from collections.abc import Callable, Iterable
+from typing import TYPE_CHECKING, Self
+
+from src.base_of_influence import BaseOfInfluence
+from src.location import Location
+from src.quality import Quality
+from src.system import QUALITY, AssetType, qualities_from_mask
+
+if TYPE_CHECKING:
+    # Assets and factions render through this index, so they can't be imported at runtime
+    from src.asset import Asset
+    from src.faction import Faction
+
+
+def _asset_type(asset: "Asset") -> AssetType:
+    if asset.is_initialized():
+        return asset.prototype.type
+    return asset.prototype
+
+
+class SpatialIndex:
+    """Multi-key index of (location, owner, asset type, quality) -> assets and bases."""
+
+    def __init__(self: Self) -> None:
+        """Initialize an empty SpatialIndex."""
+        self._subscribers: list[Callable[[object, bool], None]] = []
+        self.clear()
+
+    def clear(self: Self) -> None:
+        """Drop all indexed assets and bases."""
+        # Asset buckets, one dict per key dimension, plus the common (location, owner) pair
+        self._assets_by_loc: dict[Location, set["Asset"]] = defaultdict(set)
+        self._assets_by_owner: dict[str, set["Asset"]] = defaultdict(set)
+        self._assets_by_type: dict[AssetType, set["Asset"]] = defaultdict(set)
+        self._assets_by_quality: dict[Quality, set["Asset"]] = defaultdict(set)
+        self._assets_by_loc_owner: dict[tuple[Location, str], set["Asset"]] = defaultdict(set)
+        # Base buckets
+        self._bases_by_loc: dict[Location, set[BaseOfInfluence]] = defaultdict(set)
+        self._bases_by_owner: dict[str, set[BaseOfInfluence]] = defaultdict(set)
+        self._bases_by_loc_owner: dict[tuple[Location, str], set[BaseOfInfluence]] = defaultdict(
+            set
+        )
+        # Visibility: number of assets and bases each faction has per location, and the assets
+        # without Stealth, which are visible to all factions present in their location
+        self._presence: dict[str, Counter[Location]] = defaultdict(Counter)
+        self._unhidden_by_loc: dict[Location, set["Asset"]] = defaultdict(set)
+        # The keys each entry is currently filed under, so it can be unfiled after a change
+        self._asset_keys: dict["Asset", tuple] = {}
+        self._base_keys: dict[BaseOfInfluence, tuple] = {}
+
+    def rebuild(self: Self, factions: list["Faction"]) -> None:
+        """Index all assets and bases of the given factions from scratch."""
+        self.clear()
+        for faction in factions:
+            for asset in faction.assets:
+                self._file_asset(asset)
+            for base in faction.bases:
+                self._file_base(base)
+
+    # Subscribers
+
+    def subscribe(self: Self, callback: Callable[[object, bool], None]) -> None:
+        """Call `callback(entity, removed)` whenever a faction, location, asset or base changes."""
+        self._subscribers.append(callback)
+
+    def changed(self: Self, entity: object, removed: bool = False) -> None:
+        """Tell the subscribers about a change the index doesn't make itself, e.g. a rename."""
+        for callback in self._subscribers:
+            callback(entity, removed)
+
+    # Assets
+
+    def _file_asset(self: Self, asset: "Asset") -> None:
+        loc = asset.loc if isinstance(asset.loc, Location) else None
+        keys = (loc, asset.owner, _asset_type(asset), asset.quality_mask)
+        self._asset_keys[asset] = keys
+        if loc:
+            self._assets_by_loc[loc].add(asset)
+            self._assets_by_loc_owner[(loc, asset.owner)].add(asset)
+            self._presence[asset.owner][loc] += 1
+            if not keys[3] & QUALITY.Stealth.mask:
+                self._unhidden_by_loc[loc].add(asset)
+        self._assets_by_owner[asset.owner].add(asset)
+        self._assets_by_type[keys[2]].add(asset)
+        for quality in qualities_from_mask(keys[3]):
+            self._assets_by_quality[quality].add(asset)
+
+    def _unfile_asset(self: Self, asset: "Asset") -> None:
+        keys = self._asset_keys.pop(asset, None)
+        if keys is None:
+            return
+        loc, owner, asset_type, mask = keys
+        if loc:
+            self._assets_by_loc[loc].discard(asset)
+            self._assets_by_loc_owner[(loc, owner)].discard(asset)
+            self._unhidden_by_loc[loc].discard(asset)
+            self._leave(owner, loc)
+        self._assets_by_owner[owner].discard(asset)
+        self._assets_by_type[asset_type].discard(asset)
+        for quality in qualities_from_mask(mask):
+            self._assets_by_quality[quality].discard(asset)
+
+    def add_asset(self: Self, asset: "Asset") -> None:
+        """Index a new asset, adding it to its location's asset list."""
+        if asset.loc and asset not in asset.loc.assets:
+            asset.loc.assets.append(asset)
+        self._file_asset(asset)
+        self.changed(asset)
+
+    def remove_asset(self: Self, asset: "Asset") -> None:
+        """Remove a sold or destroyed asset from the index and from its location."""
+        if asset.loc and asset in asset.loc.assets:
+            asset.loc.assets.remove(asset)
+        self._unfile_asset(asset)
+        self.changed(asset, removed=True)
+
+    def move_asset(self: Self, asset: "Asset", loc: Location) -> None:
+        """Move an asset to a new location."""
+        if asset.loc:
+            asset.loc.assets.remove(asset)
+        asset.loc = loc
+        if loc:
+            loc.assets.append(asset)
+        self.update_asset(asset)
+
+    @staticmethod
+    def _leave_locations(assets: Iterable["Asset"]) -> None:
+        """Remove assets from the asset lists of their locations, one pass per location."""
+        leaving: dict[Location, set["Asset"]] = defaultdict(set)
+        for asset in assets:
+            if asset.loc:
+                leaving[asset.loc].add(asset)
+        for loc, gone in leaving.items():
+            loc.assets[:] = [asset for asset in loc.assets if asset not in gone]
+
+    def add_assets(self: Self, assets: Iterable["Asset"]) -> None:
+        """Index new assets, adding them to their locations' asset lists."""
+        assets = list(assets)
+        present: dict[Location, set["Asset"]] = {}
+        for asset in assets:
+            loc = asset.loc
+            if not loc:
+                continue
+            if loc not in present:
+                present[loc] = set(loc.assets)
+            if asset not in present[loc]:
+                present[loc].add(asset)
+                loc.assets.append(asset)
+        for asset in assets:
+            self._file_asset(asset)
+            self.changed(asset)
+
+    def remove_assets(self: Self, assets: Iterable["Asset"]) -> None:
+        """Remove sold or destroyed assets from the index and from their locations."""
+        assets = set(assets)
+        self._leave_locations(assets)
+        for asset in assets:
+            self._unfile_asset(asset)
+            self.changed(asset, removed=True)
+
+    def move_assets(self: Self, moves: dict["Asset", Location]) -> None:
+        """Move assets to new locations, given as {asset: location}."""
+        self._leave_locations(moves)
+        for asset, loc in moves.items():
+            asset.loc = loc
+            if loc:
+                loc.assets.append(asset)
+            self.update_asset(asset)
+
+    def update_asset(self: Self, asset: "Asset") -> None:
+        """Refile an asset after its prototype or qualities have changed."""
+        self._unfile_asset(asset)
+        self._file_asset(asset)
+        self.changed(asset)
+
+    def assets(
+        self: Self,
+        location: Location = None,
+        owner: str = None,
+        asset_type: AssetType = None,
+        quality: Quality = None,
+    ) -> set["Asset"]:
+        """
+        Return the set of assets matching all of the given keys.
+
+        Keys left as None are not filtered on. The returned set is a copy and may be modified.
+        """
+        buckets: list[set["Asset"]] = []
+        if location is not None and owner is not None:
+            buckets.append(self._assets_by_loc_owner.get((location, owner), set()))
+        elif location is not None:
+            buckets.append(self._assets_by_loc.get(location, set()))
+        elif owner is not None:
+            buckets.append(self._assets_by_owner.get(owner, set()))
+        if asset_type is not None:
+            buckets.append(self._assets_by_type.get(asset_type, set()))
+        if quality is not None:
+            buckets.append(self._assets_by_quality.get(quality, set()))
+        if not buckets:
+            return set(self._asset_keys)
+        buckets.sort(key=len)
+        return buckets[0].intersection(*buckets[1:])
+
+    def rival_assets(self: Self, location: Location, owner: str) -> set["Asset"]:
+        """Return all assets in a location not owned by `owner`."""
+        return self._assets_by_loc.get(location, set()) - self._assets_by_loc_owner.get(
+            (location, owner), set()
+        )
+
+    def asset_locations(self: Self, owner: str) -> set[Location]:
+        """Return all locations where `owner` has at least one asset."""
+        return {asset.loc for asset in self._assets_by_owner.get(owner, ()) if asset.loc}
+
+    # Bases of influence
+
+    def _file_base(self: Self, base: BaseOfInfluence) -> None:
+        loc = base.location if isinstance(base.location, Location) else None
+        keys = (loc, base.owner)
+        self._base_keys[base] = keys
+        if loc:
+            self._bases_by_loc[loc].add(base)
+            self._bases_by_loc_owner[keys].add(base)
+            self._presence[base.owner][loc] += 1
+        self._bases_by_owner[base.owner].add(base)
+
+    def _unfile_base(self: Self, base: BaseOfInfluence) -> None:
+        keys = self._base_keys.pop(base, None)
+        if keys is None:
+            return
+        loc, owner = keys
+        if loc:
+            self._bases_by_loc[loc].discard(base)
+            self._bases_by_loc_owner[keys].discard(base)
+            self._leave(owner, loc)
+        self._bases_by_owner[owner].discard(base)
+
+    def add_base(self: Self, base: BaseOfInfluence) -> None:
+        """Index a new base of influence, adding it to its location's base list."""
+        if base.location and base not in base.location.bases:
+            base.location.bases.append(base)
+        self._file_base(base)
+        self.changed(base)
+
+    def remove_base(self: Self, base: BaseOfInfluence) -> None:
+        """Remove a destroyed base of influence from the index and from its location."""
+        if base.location and base in base.location.bases:
+            base.location.bases.remove(base)
+        self._unfile_base(base)
+        self.changed(base, removed=True)
+
+    def move_base(self: Self, base: BaseOfInfluence, loc: Location) -> None:
+        """Move a base of influence to a new location."""
+        if base.location:
+            base.location.bases.remove(base)
+        base.location = loc
+        if loc:
+            loc.bases.append(base)
+        self._unfile_base(base)
+        self._file_base(base)
+        self.changed(base)
+
+    def bases(self: Self, location: Location = None, owner: str = None) -> set[BaseOfInfluence]:
+        """Return the set of bases matching all of the given keys."""
+        if location is not None and owner is not None:
+            return set(self._bases_by_loc_owner.get((location, owner), set()))
+        if location is not None:
+            return set(self._bases_by_loc.get(location, set()))
+        if owner is not None:
+            return set(self._bases_by_owner.get(owner, set()))
+        return set(self._base_keys)
+
+    def rival_bases(self: Self, location: Location, owner: str) -> set[BaseOfInfluence]:
+        """Return all bases in a location not owned by `owner`."""
+        return self._bases_by_loc.get(location, set()) - self._bases_by_loc_owner.get(
+            (location, owner), set()
+        )
+
+    # Visibility
+
+    def _leave(self: Self, owner: str, loc: Location) -> None:
+        """Count one asset or base of `owner` less in a location."""
+        presence = self._presence[owner]
+        presence[loc] -= 1
+        if presence[loc] <= 0:
+            del presence[loc]
+
+    def visible_locations(self: Self, viewer: str) -> set[Location]:
+        """Return the locations the faction `viewer` can see, where it has assets or bases."""
+        return set(self._presence.get(viewer, ()))
+
+    def visible_assets(self: Self, viewer: str, location: Location) -> set["Asset"]:
+        """Return the assets in a location that the faction `viewer` can see."""
+        if location not in self._presence.get(viewer, ()):
+            return set()
+        return self._unhidden_by_loc.get(location, set()) | self._assets_by_loc_owner.get(
+            (location, viewer), set()
+        )
+
+    def visible_bases(self: Self, viewer: str, location: Location) -> set[BaseOfInfluence]:
+        """Return the bases in a location that the faction `viewer` can see."""
+        if location not in self._presence.get(viewer, ()):
+            return set()
+        return set(self._bases_by_loc.get(location, set()))
+
+    # Factions
+
+    def remove_faction(self: Self, faction: "Faction") -> None:
+        """Remove all assets and bases of a deleted faction."""
+        self.remove_assets(faction.assets)
+        for base in faction.bases:
+            self.remove_base(base)
+        self.changed(faction, removed=True)
@@ -0,0 +1,155 @@
+"""
+Streaming YAML loader for project files.
+
+`yaml.safe_load` composes the whole document into a tree of nodes before it constructs any
+objects, so loading a project takes about twice the memory of the final model. This loader
+builds the objects straight from the parser's event stream instead: lists and dicts are built
+as soon as they end, and YamlAble objects (`Faction`, `Asset`, ...) as soon as their mapping
+ends. Only the finished objects and the containers still open are ever held, and links between
+the objects are resolved afterwards, see `restore_links` in `src.project`.
+
+It understands what `yaml.safe_dump` writes for a project: plain YAML types, anchors and
+aliases, and `!yamlable/...` tags. The C parser of libyaml is used when available.
+"""
+
+import os
+from collections.abc import Callable
+from typing import BinaryIO, Self
+
+import yaml
+from yamlable import YamlAble
+
+# Parser events between progress reports
+PROGRESS_EVENTS = 20000
+
+_YAMLABLE_PREFIX = "!yamlable/"
+_STR_TAG = "tag:yaml.org,2002:str"
+_MAP_TAGS = (None, "!", "tag:yaml.org,2002:map")
+_SEQ_TAGS = (None, "!", "tag:yaml.org,2002:seq")
+
+_Loader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+
+def _yamlable_classes() -> dict[str, type[YamlAble]]:
+    """All YamlAble classes by their tag, e.g. "wwn.Faction"."""
+    classes: dict[str, type[YamlAble]] = {}
+    pending = [YamlAble]
+    while pending:
+        cls = pending.pop()
+        pending.extend(cls.__subclasses__())
+        tag = getattr(cls, "__yaml_tag_suffix__", None)
+        if tag:
+            classes[tag] = cls
+    return classes
+
+
+class _Frame:
+    """A mapping or sequence that has started but not yet ended."""
+
+    __slots__ = ("is_mapping", "tag", "anchor", "items")
+
+    def __init__(self: Self, is_mapping: bool, tag: str | None, anchor: str | None) -> None:
+        """Initialize _Frame object."""
+        self.is_mapping = is_mapping
+        self.tag = tag
+        self.anchor = anchor
+        # Values of a sequence, or alternating keys and values of a mapping
+        self.items: list = []
+
+
+class StreamLoader:
+    """Builds the objects of one YAML document from parser events."""
+
+    def __init__(self: Self, progress: Callable[[float], None] = None) -> None:
+        """Initialize StreamLoader object. `progress` is called with the fraction of the file read."""  # noqa: E501
+        self.progress = progress
+        self.classes = _yamlable_classes()
+        # Resolves plain scalars to their types, and constructs them
+        self._scalars = yaml.SafeLoader("")
+        self._anchors: dict[str, object] = {}
+
+    def load(self: Self, stream: BinaryIO) -> object:
+        """Load the first document of a binary stream. Returns None if it is empty."""
+        size = _stream_size(stream)
+        stack: list[_Frame] = []
+        root = None
+        for count, event in enumerate(yaml.parse(stream, Loader=_Loader)):
+            if self.progress and size and count % PROGRESS_EVENTS == 0:
+                self.progress(min(1.0, stream.tell() / size))
+            event_type = type(event)
+            if event_type is yaml.ScalarEvent:
+                value = self._scalar(event)
+            elif event_type is yaml.MappingStartEvent or event_type is yaml.SequenceStartEvent:
+                stack.append(_Frame(event_type is yaml.MappingStartEvent, event.tag, event.anchor))
+                continue
+            elif event_type is yaml.MappingEndEvent or event_type is yaml.SequenceEndEvent:
+                value = self._finish(stack.pop())
+            elif event_type is yaml.AliasEvent:
+                if event.anchor not in self._anchors:
+                    raise yaml.YAMLError(f"Unknown or recursive alias *{event.anchor}")
+                value = self._anchors[event.anchor]
+            elif event_type is yaml.DocumentEndEvent:
+                break
+            else:
+                # Stream and document start
+                continue
+            if event_type is yaml.ScalarEvent and event.anchor:
+                self._anchors[event.anchor] = value
+            if stack:
+                stack[-1].items.append(value)
+            else:
+                root = value
+        if self.progress:
+            self.progress(1.0)
+        return root
+
+    def _scalar(self: Self, event: yaml.ScalarEvent) -> object:
+        tag = event.tag
+        if tag is None or tag == "!":
+            tag = self._scalars.resolve(yaml.ScalarNode, event.value, event.implicit)
+        # By far the most common case
+        if tag == _STR_TAG:
+            return event.value
+        if tag.startswith(_YAMLABLE_PREFIX):
+            cls = self._yamlable_class(tag)
+            return cls.__from_yaml_scalar__(event.value, yaml_tag=tag[len(_YAMLABLE_PREFIX) :])
+        constructor = self._scalars.yaml_constructors.get(tag)
+        if constructor is None:
+            raise yaml.YAMLError(f"Unsupported tag {tag} {event.start_mark}")
+        return constructor(self._scalars, yaml.ScalarNode(tag, event.value, style=event.style))
+
+    def _finish(self: Self, frame: _Frame) -> object:
+        if frame.is_mapping:
+            value = dict(zip(frame.items[0::2], frame.items[1::2], strict=True))
+            if frame.tag not in _MAP_TAGS:
+                cls = self._yamlable_class(frame.tag)
+                value = cls.__from_yaml_dict__(value, yaml_tag=frame.tag[len(_YAMLABLE_PREFIX) :])
+        else:
+            value = frame.items
+            if frame.tag not in _SEQ_TAGS:
+                cls = self._yamlable_class(frame.tag)
+                value = cls.__from_yaml_list__(value, yaml_tag=frame.tag[len(_YAMLABLE_PREFIX) :])
+        if frame.anchor:
+            self._anchors[frame.anchor] = value
+        return value
+
+    def _yamlable_class(self: Self, tag: str) -> type[YamlAble]:
+        cls = None
+        if tag.startswith(_YAMLABLE_PREFIX):
+            cls = self.classes.get(tag[len(_YAMLABLE_PREFIX) :])
+        if cls is None:
+            raise yaml.YAMLError(f"Unsupported tag {tag}")
+        return cls
+
+
+def _stream_size(stream: BinaryIO) -> int:
+    try:
+        return os.fstat(stream.fileno()).st_size
+    except (AttributeError, OSError, ValueError):
+        return 0
+
+
+def load_yaml_stream(filename: str, progress: Callable[[float], None] = None) -> object:
+    """Load a YAML file with `StreamLoader`. Raises OSError and yaml.YAMLError."""
+    with open(filename, mode="rb") as yaml_file:
+        return StreamLoader(progress).load(yaml_file)
@@ -1,15 +1,22 @@
-from imgui_bundle import imgui
+from src.lazy_import import lazy_import
+
+imgui = lazy_import("imgui_bundle.imgui")
 
 
 class STYLE:
     """Static namespace for styling."""
 
-    COL_RED = imgui.ImVec4(0.9, 0.2, 0.1, 1.0)
-    COL_GREEN = imgui.ImVec4(0.1, 0.9, 0.2, 1.0)
+    # Plain (r, g, b, a) tuples, so that imgui isn't imported until something is drawn
+    COL_RED = (0.9, 0.2, 0.1, 1.0)
+    COL_GREEN = (0.1, 0.9, 0.2, 1.0)
+
+    @staticmethod
+    def button_color(col: tuple[float, float, float, float]) -> None:
+        imgui.push_style_color(imgui.Col_.button, imgui.ImVec4(*col))
 
     @staticmethod
-    def button_color(col: imgui.ImVec4) -> None:
-        imgui.push_style_color(imgui.Col_.button, col)
+    def text_color(col: tuple[float, float, float, float]) -> None:
+        imgui.push_style_color(imgui.Col_.text, imgui.ImVec4(*col))
 
     @staticmethod
     def pop_color(num: int = 1) -> None:
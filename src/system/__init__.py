@@ -1,3 +1,17 @@
+"""
+Worlds Without Number game system catalog.
+
+The asset, tag and goal catalogs are only instantiated on first use, through the list
+functions or the CUNNING/FORCE/WEALTH/TAGS/GOALS namespaces. This keeps importing the
+model classes cheap for headless tools. Assets are loaded from data files, see
+`src.system.catalog`.
+"""
+
+import importlib
+from types import ModuleType
+from typing import TYPE_CHECKING
+
+from src.goal import Goal
 from src.system.asset_proto import (
     AssetPrototype,
     AssetRequirement,
@@ -6,12 +20,13 @@ from src.system.asset_proto import (
     AssetType,
     MagicLevel,
 )
-from src.system.cunning import CUNNING, cunning_list
-from src.system.force import FORCE, force_list
-from src.system.goals import GOALS, goals_list
-from src.system.qualities import QUALITY, quality_list
-from src.system.tags import TAGS, tags_list
-from src.system.wealth import WEALTH, wealth_list
+from src.system.catalog import asset_catalog, catalog_settings, configure_catalog
+from src.system.dice import Dice
+from src.system.qualities import QUALITY, qualities_from_mask, quality_list, quality_mask
+from src.system.tag_proto import TagPrototype
+
+if TYPE_CHECKING:
+    from src.system.rules_search import RulesIndex
 
 __all__ = [
     "AssetPrototype",
@@ -20,6 +35,14 @@ __all__ = [
     "AssetStrings",
     "AssetType",
     "MagicLevel",
+    "Dice",
+    "TagPrototype",
+    "asset_catalog",
+    "catalog_settings",
+    "configure_catalog",
+    "RulesEntry",
+    "RulesIndex",
+    "rules_index",
     "CUNNING",
     "FORCE",
     "WEALTH",
@@ -28,8 +51,71 @@ __all__ = [
     "cunning_list",
     "force_list",
     "wealth_list",
+    "prototype_by_id",
     "tags_list",
     "quality_list",
+    "quality_mask",
+    "qualities_from_mask",
     "GOALS",
     "goals_list",
 ]
+
+# Catalog namespaces and other names imported on first access, and the module that defines them
+_LAZY_NAMESPACES = {
+    "CUNNING": "src.system.cunning",
+    "FORCE": "src.system.force",
+    "WEALTH": "src.system.wealth",
+    "TAGS": "src.system.tags",
+    "GOALS": "src.system.goals",
+    # Only needed by the rules search
+    "RulesEntry": "src.system.rules_search",
+    "RulesIndex": "src.system.rules_search",
+}
+
+
+def _load(module_name: str) -> ModuleType:
+    return importlib.import_module(module_name)
+
+
+def __getattr__(name: str) -> object:
+    """Import catalog namespaces and the rules index classes on first access."""
+    if name in _LAZY_NAMESPACES:
+        namespace = getattr(_load(_LAZY_NAMESPACES[name]), name)
+        globals()[name] = namespace
+        return namespace
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def cunning_list() -> list[AssetPrototype]:
+    """Return list of all Cunning Assets."""
+    return _load("src.system.cunning").cunning_list()
+
+
+def force_list() -> list[AssetPrototype]:
+    """Return list of all Force Assets."""
+    return _load("src.system.force").force_list()
+
+
+def wealth_list() -> list[AssetPrototype]:
+    """Return list of all Wealth Assets."""
+    return _load("src.system.wealth").wealth_list()
+
+
+def prototype_by_id(ident: str) -> AssetPrototype | None:
+    """Return the asset prototype with the given id, or None if there is no such asset."""
+    return asset_catalog().by_id.get(ident)
+
+
+def tags_list() -> list[TagPrototype]:
+    """Return list of all Tags."""
+    return _load("src.system.tags").tags_list()
+
+
+def goals_list() -> list[Goal]:
+    """Return list of all Example Goals."""
+    return _load("src.system.goals").goals_list()
+
+
+def rules_index() -> "RulesIndex":
+    """Return the full-text index of the rules, see `src.system.rules_search`."""
+    return _load("src.system.rules_search").rules_index()
@@ -2,6 +2,7 @@ from enum import Enum, auto
 from typing import Self
 
 from src.quality import Quality
+from src.system.dice import Dice
 
 
 class AssetType(Enum):
@@ -42,6 +43,8 @@ class AssetStats:
         atk_type: AssetType = None,
         def_type: AssetType = None,
         qualities: list[Quality] = None,
+        damage: Dice = None,
+        counter: Dice = None,
     ) -> None:
         """Initialize AssetStats object."""
         self.max_hp = max_hp
@@ -52,6 +55,12 @@ class AssetStats:
             self.qualities = qualities
         else:
             self.qualities = []
+        self.quality_mask: int = 0
+        for quality in self.qualities:
+            self.quality_mask |= quality.mask
+        # Attack and counterattack damage dice, None if the asset deals no damage
+        self.damage = damage
+        self.counter = counter
 
 
 class AssetStrings:
@@ -90,12 +99,12 @@ class AssetPrototype:
         self.stats = stats
 
     def roll_damage(self: Self) -> int:
-        """Need to override with asset damage formula."""
-        return 0
+        """Roll the asset's attack damage."""
+        return self.stats.damage.roll() if self.stats.damage else 0
 
     def roll_counter(self: Self) -> int:
-        """Need to override with asset counter formula."""
-        return 0
+        """Roll the asset's counterattack damage."""
+        return self.stats.counter.roll() if self.stats.counter else 0
 
     def upkeep(self: Self) -> int:
         """Calculate upkeep for a given asset."""
@@ -0,0 +1,257 @@
+"""
+Data-driven asset catalog.
+
+Asset prototypes are described in YAML data files (see `data/assets.yaml` for the format),
+which are compiled into a table of plain rows. The compiled table is cached on disk, keyed
+by a hash of the data file contents, so that later startups can skip parsing the YAML. The
+cache is only used once a directory is given to `configure_catalog`, see `config.cache_dir`.
+
+Homebrew assets are added by listing extra data files with `configure_catalog`, before
+the catalog is first used. Entries in later files replace entries with the same id.
+"""
+
+import logging
+import re
+from functools import cache
+from pathlib import Path
+from typing import Self
+
+import yaml
+
+from src.lazy_import import lazy_import
+from src.system.asset_proto import (
+    AssetPrototype,
+    AssetRequirement,
+    AssetStats,
+    AssetStrings,
+    AssetType,
+    MagicLevel,
+)
+from src.system.dice import Dice
+from src.system.qualities import qualities_from_mask, quality_mask
+
+# Only needed to load the compiled table or compile a new one
+hashlib = lazy_import("hashlib")
+pickle = lazy_import("pickle")
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_CATALOG = str(Path(__file__).parent / "data" / "assets.yaml")
+# Bump when the row layout changes, to invalidate old caches
+TABLE_VERSION = 1
+
+_catalog_files: list[str] = [DEFAULT_CATALOG]
+_cache_dir: str | None = None
+
+
+def configure_catalog(homebrew: list[str] = None, cache_dir: str | None = None) -> None:
+    """
+    Set the homebrew data files loaded after the default catalog, and the cache directory.
+
+    The on-disk cache is disabled when `cache_dir` is None. It's made absolute, so that it
+    doesn't depend on the current directory of worker processes.
+    """
+    global _catalog_files, _cache_dir
+    _catalog_files = [DEFAULT_CATALOG, *(homebrew or [])]
+    _cache_dir = str(Path(cache_dir).resolve()) if cache_dir else None
+    asset_catalog.cache_clear()
+
+
+def catalog_settings() -> dict:
+    """Return the current catalog settings, as keyword arguments for `configure_catalog`."""
+    return {"homebrew": _catalog_files[1:], "cache_dir": _cache_dir}
+
+
+def _key_from_name(name: str) -> str:
+    """Derive a namespace key from an asset name, e.g. "Lead or Silver" -> LeadOrSilver."""
+    return "".join(word[:1].upper() + word[1:] for word in re.split(r"[^A-Za-z0-9]+", name))
+
+
+def _dice_row(formula: str | None) -> tuple[int, int, int] | None:
+    if formula is None:
+        return None
+    dice = Dice.parse(str(formula))
+    return (dice.count, dice.sides, dice.bonus)
+
+
+def _compile_entry(entry: dict) -> tuple:
+    """Compile one data file entry into a table row. Raises ValueError on invalid data."""
+    try:
+        attack = entry.get("attack")
+        defense = entry.get("defense")
+        return (
+            entry.get("key") or _key_from_name(entry["name"]),
+            entry["id"],
+            entry["name"],
+            AssetType[entry["type"]].value,
+            int(entry["tier"]),
+            int(entry["cost"]),
+            MagicLevel[entry.get("magic", "NONE")].value,
+            int(entry["max_hp"]),
+            int(entry.get("upkeep", 0)),
+            AssetType[attack].value if attack else None,
+            AssetType[defense].value if defense else None,
+            quality_mask(entry.get("qualities", [])),
+            _dice_row(entry.get("damage")),
+            _dice_row(entry.get("counter")),
+            entry.get("damage_formula", "None"),
+            entry.get("counter_formula", "None"),
+            entry["rules"],
+        )
+    except KeyError as e:
+        raise ValueError(f"asset '{entry.get('id')}': missing or invalid value {e}") from None
+
+
+def _compile_file(filename: str, data: bytes) -> list[tuple]:
+    # Use the C parser when PyYAML was built with libyaml
+    loader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+    entries = yaml.load(data, Loader=loader) or []
+    if not isinstance(entries, list):
+        raise ValueError(f"{filename}: expected a list of assets")
+    rows = []
+    for entry in entries:
+        try:
+            rows.append(_compile_entry(entry))
+        except ValueError as e:
+            raise ValueError(f"{filename}: {e}") from None
+    return rows
+
+
+def _compile_table(files: list[str]) -> tuple[str, list[tuple]]:
+    """Read and compile the data files, or load the compiled table from the cache."""
+    contents: list[tuple[str, bytes]] = []
+    for filename in files:
+        try:
+            contents.append((filename, Path(filename).read_bytes()))
+        except OSError:
+            if filename == DEFAULT_CATALOG:
+                raise
+            logger.exception(f"Error: Failed to read catalog file {filename}")
+
+    digest = hashlib.sha256(str(TABLE_VERSION).encode())
+    for _, data in contents:
+        digest.update(hashlib.sha256(data).digest())
+    catalog_hash = digest.hexdigest()
+
+    cache_file = Path(_cache_dir, f"catalog-{catalog_hash[:16]}.pickle") if _cache_dir else None
+    if cache_file and cache_file.exists():
+        try:
+            with cache_file.open("rb") as f:
+                return catalog_hash, pickle.load(f)
+        except Exception:
+            logger.warning(f"Ignoring unreadable catalog cache {cache_file}")
+
+    rows: list[tuple] = []
+    for filename, data in contents:
+        try:
+            rows.extend(_compile_file(filename, data))
+        except Exception:
+            if filename == DEFAULT_CATALOG:
+                raise
+            logger.exception(f"Error: Failed to compile catalog file {filename}")
+
+    if cache_file:
+        try:
+            cache_file.parent.mkdir(parents=True, exist_ok=True)
+            tmp_file = cache_file.with_suffix(".tmp")
+            with tmp_file.open("wb") as f:
+                pickle.dump(rows, f, protocol=pickle.HIGHEST_PROTOCOL)
+            tmp_file.replace(cache_file)
+        except OSError:
+            logger.warning(f"Could not write catalog cache {cache_file}")
+    return catalog_hash, rows
+
+
+def _prototype_from_row(row: tuple) -> AssetPrototype:
+    (
+        _,
+        ident,
+        name,
+        asset_type,
+        tier,
+        cost,
+        magic,
+        max_hp,
+        upkeep,
+        atk_type,
+        def_type,
+        qualities,
+        damage,
+        counter,
+        damage_formula,
+        counter_formula,
+        rules,
+    ) = row
+    return AssetPrototype(
+        asset_type=AssetType(asset_type),
+        strings=AssetStrings(
+            name=name,
+            ident=ident,
+            rules=rules,
+            damage_formula=damage_formula,
+            counter_formula=counter_formula,
+        ),
+        requirements=AssetRequirement(tier=tier, cost=cost, magic_level=MagicLevel(magic)),
+        stats=AssetStats(
+            max_hp=max_hp,
+            upkeep=upkeep,
+            atk_type=AssetType(atk_type) if atk_type else None,
+            def_type=AssetType(def_type) if def_type else None,
+            qualities=qualities_from_mask(qualities),
+            damage=Dice(*damage) if damage else None,
+            counter=Dice(*counter) if counter else None,
+        ),
+    )
+
+
+class AssetCatalog:
+    """In-memory table of all asset prototypes."""
+
+    def __init__(self: Self, rows: list[tuple], catalog_hash: str) -> None:
+        """Build the prototypes from compiled table rows."""
+        # Content hash of the data files, usable as a key for derived caches
+        self.hash = catalog_hash
+        self.by_id: dict[str, AssetPrototype] = {}
+        keys: dict[str, str] = {}
+        for row in rows:
+            prototype = _prototype_from_row(row)
+            self.by_id[prototype.strings.id] = prototype
+            keys[prototype.strings.id] = row[0]
+        self.prototypes: list[AssetPrototype] = list(self.by_id.values())
+        self._by_type: dict[AssetType, list[AssetPrototype]] = {t: [] for t in AssetType}
+        self._by_key: dict[AssetType, dict[str, AssetPrototype]] = {t: {} for t in AssetType}
+        for ident, prototype in self.by_id.items():
+            self._by_type[prototype.type].append(prototype)
+            self._by_key[prototype.type][keys[ident]] = prototype
+
+    def by_type(self: Self, asset_type: AssetType) -> list[AssetPrototype]:
+        """Return all prototypes of an asset type, in catalog order."""
+        return self._by_type[asset_type]
+
+    def by_key(self: Self, asset_type: AssetType) -> dict[str, AssetPrototype]:
+        """Return the prototypes of an asset type by namespace key."""
+        return self._by_key[asset_type]
+
+
+@cache
+def asset_catalog() -> AssetCatalog:
+    """Return the asset catalog, compiling it on first use."""
+    catalog_hash, rows = _compile_table(_catalog_files)
+    return AssetCatalog(rows, catalog_hash)
+
+
+class CatalogView:
+    """Namespace view over the assets of one type, e.g. `CUNNING.Informers`."""
+
+    def __init__(self: Self, asset_type: AssetType) -> None:
+        """Initialize CatalogView object."""
+        self._asset_type = asset_type
+
+    def __getattr__(self: Self, key: str) -> AssetPrototype:
+        try:
+            return asset_catalog().by_key(self._asset_type)[key]
+        except KeyError:
+            raise AttributeError(f"No {self._asset_type.name} asset named {key!r}") from None
+
+    def __dir__(self: Self) -> list[str]:
+        return list(asset_catalog().by_key(self._asset_type))
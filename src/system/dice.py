@@ -0,0 +1,61 @@
+import re
+from random import Random, randint
+from typing import Self
+
+_DICE_FORMULA = re.compile(r"^\s*(\d+)\s*d\s*(\d+)\s*(?:([+-])\s*(\d+))?\s*$")
+
+
+class Dice:
+    """A dice formula of the form NdS+B, such as 1d6, 2d4+2 or 1d4-1."""
+
+    def __init__(self: Self, count: int, sides: int, bonus: int = 0) -> None:
+        """Initialize Dice object."""
+        self.count = count
+        self.sides = sides
+        self.bonus = bonus
+
+    @staticmethod
+    def parse(formula: str) -> "Dice":
+        """Parse a dice formula. Raises ValueError if the formula is malformed."""
+        match = _DICE_FORMULA.match(formula)
+        if not match:
+            raise ValueError(f"Invalid dice formula '{formula}'")
+        count, sides, sign, bonus = match.groups()
+        bonus = int(bonus) if bonus else 0
+        if sign == "-":
+            bonus = -bonus
+        return Dice(count=int(count), sides=int(sides), bonus=bonus)
+
+    def roll(self: Self, rng: Random = None) -> int:
+        """Roll the dice, optionally with a seeded `rng`. The result is never negative."""
+        roll = rng.randint if rng else randint
+        total = self.bonus
+        for _ in range(self.count):
+            total += roll(1, self.sides)
+        return max(0, total)
+
+    def mean(self: Self) -> float:
+        """Average result of a roll (ignoring the clamp at zero)."""
+        return self.count * (self.sides + 1) / 2 + self.bonus
+
+    def distribution(self: Self) -> list[float]:
+        """Exact probability of each roll result, indexed by result (clamped at zero like `roll`)."""  # noqa: E501
+        # Distribution of the sum of the dice, offset by the minimum roll (count)
+        sums = [1.0]
+        for _ in range(self.count):
+            new_sums = [0.0] * (len(sums) + self.sides - 1)
+            for total, prob in enumerate(sums):
+                for face in range(self.sides):
+                    new_sums[total + face] += prob / self.sides
+            sums = new_sums
+        result = [0.0] * (max(0, self.count + self.bonus + len(sums) - 1) + 1)
+        for total, prob in enumerate(sums):
+            result[max(0, total + self.count + self.bonus)] += prob
+        return result
+
+    def __repr__(self: Self) -> str:
+        if self.bonus > 0:
+            return f"{self.count}d{self.sides}+{self.bonus}"
+        if self.bonus < 0:
+            return f"{self.count}d{self.sides}{self.bonus}"
+        return f"{self.count}d{self.sides}"
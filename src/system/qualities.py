@@ -9,6 +9,7 @@ class Stealth(Quality):
         super().__init__(
             name="Stealth",
             ident="q_stealth",
+            bit=2,
             rules="Assets with the Stealth quality can move freely to any location within reach. Stealthed Assets cannot be Attacked by other Assets until they lose the Stealth quality. This happens when they are discovered by certain special Assets or when the Stealthed Asset Attacks something.",  # noqa: E501
             persistent=False,
         )
@@ -19,6 +20,7 @@ class Subtle(Quality):
         super().__init__(
             name="Subtle",
             ident="q_subtle",
+            bit=3,
             rules="Subtle Assets can move to locations even where they would normally be prohibited by the ruling powers. Dislodging them requires that they be Attacked until destroyed or moved out by their owner.",  # noqa: E501
         )
 
@@ -28,6 +30,7 @@ class Special(Quality):
         super().__init__(
             name="Special",
             ident="q_special",
+            bit=1,
             rules="The Asset posseses some special rules.",
         )
 
@@ -37,6 +40,7 @@ class Action(Quality):
         super().__init__(
             name="Action",
             ident="q_action",
+            bit=0,
             rules="The Asset grants a free Action.",
         )
 
@@ -51,7 +55,24 @@ class QUALITY:
 
 
 _quality = get_class_values(QUALITY)
+_quality_by_id = {quality.id: quality for quality in _quality}
 
 
 def quality_list() -> list[Quality]:
     return _quality
+
+
+def quality_mask(qualities: list[Quality | str]) -> int:
+    """Pack a list of qualities, or quality ids, into a bitmask. Unknown ids are ignored."""
+    mask = 0
+    for quality in qualities:
+        if isinstance(quality, str):
+            mask |= _quality_by_id[quality].mask if quality in _quality_by_id else 0
+        else:
+            mask |= quality.mask
+    return mask
+
+
+def qualities_from_mask(mask: int) -> list[Quality]:
+    """Unpack a quality bitmask into a list of qualities."""
+    return [quality for quality in _quality if mask & quality.mask]
@@ -0,0 +1,238 @@
+"""
+Full-text search over the rules text of the catalog.
+
+Indexes the rules of assets, tags and qualities, and the descriptions of goals, so the rules
+can be looked up at the table instead of hovering over tooltips:
+
+```py
+for entry in rules_index().search("attack twice"):
+    print(entry.title, entry.text)
+```
+
+All words of a query must match, and results are ranked with BM25, names counting more than
+the rules text. Words are folded to lower case and simple plurals ("assets" -> "asset"). The
+last word matches as a prefix, unless the query ends with a space.
+
+The index only depends on the catalog, so it's built once and cached on disk next to the
+compiled asset table, keyed by the catalog hash and the text of the built-in tags, qualities and
+goals. Later startups load the postings, with their scores already computed.
+"""
+
+import hashlib
+import heapq
+import logging
+import math
+import pickle
+import re
+from bisect import bisect_left
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Self
+
+from src.system.catalog import asset_catalog, catalog_settings
+from src.system.qualities import quality_list
+
+logger = logging.getLogger(__name__)
+
+# Bump when the index layout or scoring changes, to invalidate old caches
+INDEX_VERSION = 2
+DEFAULT_LIMIT = 50
+# BM25 term frequency saturation and length normalization
+BM25_K1 = 1.2
+BM25_B = 0.75
+# A word in the name counts as this many in the text
+NAME_WEIGHT = 3
+# Shortest word whose trailing "s" is folded away
+MIN_PLURAL = 4
+
+_WORD = re.compile(r"\w+")
+
+
+@dataclass(frozen=True, slots=True)
+class RulesEntry:
+    """Rules text of one catalog entry, e.g. an asset or a tag."""
+
+    kind: str
+    ident: str
+    name: str
+    text: str
+    # Shown in the rules window, built once rather than every frame
+    title: str = field(init=False, compare=False)
+
+    def __post_init__(self: Self) -> None:
+        object.__setattr__(self, "title", f"{self.name} ({self.kind})")
+
+
+def _fold(word: str) -> str:
+    if len(word) >= MIN_PLURAL and word[-1] == "s" and word[-2] != "s":
+        return word[:-1]
+    return word
+
+
+def words(text: str) -> list[str]:
+    """Split a text into lower case words, with plurals folded."""
+    return [_fold(word) for word in _WORD.findall(text.lower())]
+
+
+def catalog_entries() -> list[RulesEntry]:
+    """List the rules of all assets, tags and qualities, and the descriptions of all goals."""
+    # Imported here, as these build their catalogs on import
+    from src.system.goals import goals_list
+    from src.system.tags import tags_list
+
+    entries = [
+        RulesEntry(
+            f"{prototype.type.name.capitalize()} asset",
+            prototype.strings.id,
+            prototype.strings.name,
+            prototype.strings.rules,
+        )
+        for prototype in asset_catalog().prototypes
+    ]
+    entries.extend(RulesEntry("Tag", tag.id, tag.name, tag.rules) for tag in tags_list())
+    entries.extend(
+        RulesEntry("Quality", quality.id, quality.name, quality.rules) for quality in quality_list()
+    )
+    entries.extend(RulesEntry("Goal", goal.name, goal.name, goal.desc) for goal in goals_list())
+    return entries
+
+
+class RulesIndex:
+    """Inverted index of words -> catalog entries, with BM25 scores."""
+
+    def __init__(self: Self, entries: list[RulesEntry]) -> None:
+        """Build the index of a list of entries."""
+        self.entries = entries
+        # Word -> entry index -> score of the word for the entry
+        self.postings: dict[str, dict[int, float]] = {}
+        frequencies: list[dict[str, int]] = []
+        for entry in entries:
+            counts: dict[str, int] = {}
+            for word in words(entry.text):
+                counts[word] = counts.get(word, 0) + 1
+            for word in words(entry.name):
+                counts[word] = counts.get(word, 0) + NAME_WEIGHT
+            frequencies.append(counts)
+        lengths = [sum(counts.values()) for counts in frequencies]
+        average = sum(lengths) / len(lengths) if lengths else 1.0
+        documents: dict[str, int] = {}
+        for counts in frequencies:
+            for word in counts:
+                documents[word] = documents.get(word, 0) + 1
+        for idx, counts in enumerate(frequencies):
+            norm = BM25_K1 * (1 - BM25_B + BM25_B * lengths[idx] / average)
+            for word, count in counts.items():
+                idf = math.log(1 + (len(entries) - documents[word] + 0.5) / (documents[word] + 0.5))
+                self.postings.setdefault(word, {})[idx] = (
+                    idf * count * (BM25_K1 + 1) / (count + norm)
+                )
+        # All indexed words, sorted, to find the words that start with a prefix
+        self.words: list[str] = sorted(self.postings)
+
+    def _expansions(self: Self, prefix: str) -> list[dict[int, float]]:
+        """Return the postings of all words that start with `prefix`."""
+        expansions = []
+        for idx in range(bisect_left(self.words, prefix), len(self.words)):
+            word = self.words[idx]
+            if not word.startswith(prefix):
+                break
+            expansions.append(self.postings[word])
+        return expansions
+
+    @staticmethod
+    def _best(expansions: list[dict[int, float]]) -> dict[int, float]:
+        """Merge postings, keeping the best score of each entry."""
+        if len(expansions) == 1:
+            return expansions[0]
+        scores: dict[int, float] = {}
+        for posting in expansions:
+            for idx, score in posting.items():
+                if score > scores.get(idx, 0.0):
+                    scores[idx] = score
+        return scores
+
+    def search(self: Self, query: str, limit: int = DEFAULT_LIMIT) -> list[RulesEntry]:
+        """Return up to `limit` entries that have all words of a query, best match first."""
+        query_words = _WORD.findall(query.lower())
+        if not query_words:
+            return []
+        prefix = None if query[-1].isspace() else query_words.pop()
+        postings = [self.postings.get(_fold(word), {}) for word in query_words]
+        postings.sort(key=len)
+        expansions = self._expansions(_fold(prefix)) if prefix is not None else []
+        if prefix is not None and not expansions:
+            return []
+        # Merging the expansions of a short prefix can cost more than looking up the entries of
+        # the complete words in each of them
+        if expansions and (
+            not postings
+            or len(postings[0]) * len(expansions) >= sum(len(posting) for posting in expansions)
+        ):
+            postings.append(self._best(expansions))
+            postings.sort(key=len)
+            expansions = []
+        # Sum the scores over the rarest posting, the others only filter and add
+        totals: list[tuple[float, int]] = []
+        for idx, first_score in postings[0].items():
+            total = first_score
+            for other in postings[1:]:
+                score = other.get(idx)
+                if score is None:
+                    break
+                total += score
+            else:
+                if expansions:
+                    best = max(posting.get(idx, 0.0) for posting in expansions)
+                    if not best:
+                        continue
+                    total += best
+                totals.append((-total, idx))
+        return [self.entries[idx] for _, idx in heapq.nsmallest(limit, totals)]
+
+
+def _index_key(entries: list[RulesEntry]) -> str:
+    digest = hashlib.sha256(f"{INDEX_VERSION}:{asset_catalog().hash}".encode())
+    # Asset rules are covered by the catalog hash, the rest is defined in code
+    for entry in entries:
+        if not entry.kind.endswith("asset"):
+            digest.update(f"{entry.kind}\0{entry.ident}\0{entry.name}\0{entry.text}\0".encode())
+    return digest.hexdigest()
+
+
+def load_rules_index() -> RulesIndex:
+    """Build the rules index of the current catalog, or load it from the cache."""
+    entries = catalog_entries()
+    cache_dir = catalog_settings()["cache_dir"]
+    cache_file = Path(cache_dir, f"rules-{_index_key(entries)[:16]}.pickle") if cache_dir else None
+    if cache_file and cache_file.exists():
+        try:
+            with cache_file.open("rb") as f:
+                return pickle.load(f)
+        except Exception:
+            logger.warning(f"Ignoring unreadable rules index cache {cache_file}")
+
+    index = RulesIndex(entries)
+    if cache_file:
+        try:
+            cache_file.parent.mkdir(parents=True, exist_ok=True)
+            tmp_file = cache_file.with_suffix(".tmp")
+            with tmp_file.open("wb") as f:
+                pickle.dump(index, f, protocol=pickle.HIGHEST_PROTOCOL)
+            tmp_file.replace(cache_file)
+        except OSError:
+            logger.warning(f"Could not write rules index cache {cache_file}")
+    return index
+
+
+# The index of the last catalog it was loaded for
+_index: tuple[object, RulesIndex] | None = None
+
+
+def rules_index() -> RulesIndex:
+    """Return the rules index of the current catalog, loading it on first use."""
+    global _index
+    catalog = asset_catalog()
+    # configure_catalog makes a new catalog, which needs a new index
+    if _index is None or _index[0] is not catalog:
+        _index = (catalog, load_rules_index())
+    return _index[1]
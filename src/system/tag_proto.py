@@ -0,0 +1,9 @@
+from typing import Self
+
+
+class TagPrototype:
+    def __init__(self: Self, ident: str, name: str, rules: str) -> None:
+        """Initialize TagPrototype object."""
+        self.id = ident
+        self.name = name
+        self.rules = rules
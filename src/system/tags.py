@@ -1,14 +1,7 @@
 from typing import Self
 
 from src.mapper import get_class_values
-
-
-class TagPrototype:
-    def __init__(self: Self, ident: str, name: str, rules: str) -> None:
-        """Initialize TagPrototype object."""
-        self.id = ident
-        self.name = name
-        self.rules = rules
+from src.system.tag_proto import TagPrototype
 
 
 class Antimagical(TagPrototype):
@@ -1,10 +1,12 @@
 from typing import Self
 
-from imgui_bundle import imgui
 from yamlable import YamlAble, yaml_info
 
 from src.layout_helper import LayoutHelper
-from src.system.tags import TagPrototype, tags_list
+from src.lazy_import import lazy_import
+from src.system import TagPrototype, tags_list
+
+imgui = lazy_import("imgui_bundle.imgui")
 
 
 @yaml_info(yaml_tag_ns="wwn")
@@ -17,13 +19,14 @@ class Tag(YamlAble):
         self.prototype = prototype
 
     def __to_yaml_dict__(self: Self) -> dict:
-        prototype: str = self.prototype.ident if self.prototype else None
+        prototype: str = self.prototype.id if self.prototype else None
         return {
             "prototype": prototype,  # Note: needs to be restored
         }
 
-    def render(self: Self, idx: str) -> None:
-        """Render Tag in GUI."""
+    def render(self: Self, idx: str) -> bool:
+        """Render Tag in GUI. Returns True if a tag type was picked."""
+        picked = False
         if self.prototype is None:
             if imgui.begin_combo(label=f"Select tag type##{idx}", preview_value="Tag type"):
                 for tag_prototype in tags_list():
@@ -34,8 +37,10 @@ class Tag(YamlAble):
                     LayoutHelper.add_tooltip(tag_prototype.rules)
                     if selected:
                         self.prototype = tag_prototype
+                        picked = True
                 imgui.end_combo()
             imgui.same_line()  # For Remove button
         else:
             imgui.text(self.prototype.name)
             imgui.text_wrapped(self.prototype.rules)
+        return picked
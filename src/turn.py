@@ -1,23 +1,45 @@
 import logging
+from collections.abc import Callable, Iterable
 from copy import copy
 from enum import Enum, auto
 from math import ceil, floor
-from typing import Self
+from typing import TYPE_CHECKING, Self
 from uuid import uuid4
 
-from imgui_bundle import imgui
 from yamlable import YamlAble, yaml_info
 
 from src.asset import Asset, AssetPrototype, AssetType
 from src.base_of_influence import BaseOfInfluence
 from src.faction import Faction
+from src.goal_tracker import BRIBES, SPHERES, GoalTracker
+from src.labels import LABELS
 from src.layout_helper import LayoutHelper
+from src.lazy_import import lazy_import
 from src.location import Location
+from src.spatial_index import SpatialIndex
 from src.style import STYLE
-from src.system import QUALITY, MagicLevel, cunning_list, force_list, goals_list, wealth_list
+from src.system import (
+    GOALS,
+    QUALITY,
+    MagicLevel,
+    cunning_list,
+    force_list,
+    goals_list,
+    wealth_list,
+)
+
+if TYPE_CHECKING:
+    from src.events import Event, EventLog
+
+# The event types are only needed once a turn is played
+events = lazy_import("src.events")
+imgui = lazy_import("imgui_bundle.imgui")
 
 logger = logging.getLogger(__name__)
 
+# Label cache fields of the upkeep lines, one per asset type
+UPKEEP_FIELDS = {asset_type: f"upkeep_{asset_type.name}" for asset_type in AssetType}
+
 
 @yaml_info(yaml_tag_ns="wwn")
 class FactionTurn(YamlAble):
@@ -25,6 +47,7 @@ class FactionTurn(YamlAble):
 
     HIDE_ACTION_CUNNING_REQUIREMENT = 3
     HIDE_ACTION_COST = 2
+    FACTION_REPAIR_COST = 1
 
     class TurnFSM(Enum):
         IDLE = auto()
@@ -66,9 +89,20 @@ class FactionTurn(YamlAble):
         # Temp choice variables (note, not saved)
         self.asset_to_buy: AssetPrototype = None
         self.asset_to_buy_loc: Location = None
+        # More than one asset per turn is against the rules, only allowed as a GM override
+        self.asset_to_buy_count: int = 1
+        self.asset_to_buy_override: bool = False
+        self.assets_to_sell: set[Asset] = set()
         self.boi_loc: Location = None
         self.boi_hp: int = 0
+        self.bribe: int = 0
         self.repaired_faction: bool = False
+        # Structured event log, set by the app (note, not saved)
+        self.event_log: "EventLog" = None
+        # Goal progress tracker, set by the app (note, not saved)
+        self.goal_tracker: GoalTracker = None
+        # Main action taken this turn, None if none (note, not saved)
+        self.action: FactionTurn.TurnFSM = None
 
     def __to_yaml_dict__(self: Self) -> dict:
         turn_order: list[str] = None
@@ -81,6 +115,12 @@ class FactionTurn(YamlAble):
             "state": self.state.value,
         }
 
+    def _emit(self: Self, event_type: "type[Event]", **fields) -> None:
+        """Record a turn event for the current faction, if an event log is attached."""
+        if self.event_log:
+            faction = self.turn_order[self.cur_faction]
+            self.event_log.emit(event_type(turn_idx=self.turn_idx, faction=faction.uuid, **fields))
+
     def _turn_active(self: Self) -> bool:
         return self.turn_order is not None
 
@@ -90,8 +130,12 @@ class FactionTurn(YamlAble):
         self.repaired_faction = False
         self.asset_to_buy = None
         self.asset_to_buy_loc = None
+        self.asset_to_buy_count = 1
+        self.asset_to_buy_override = False
+        self.assets_to_sell = set()
         self.boi_loc = None
         self.boi_hp = 0
+        self.action = None
         # Reset asset repair cost
         if self.cur_faction < len(self.turn_order):
             faction = self.turn_order[self.cur_faction]
@@ -100,12 +144,372 @@ class FactionTurn(YamlAble):
                 asset.move_target = None
             logger.info(f"  --- TURN {self.turn_idx} for {faction.name} ---")
 
-    def turn_logic(self: Self, locations: list[Location]) -> None:
+    # Rules, shared by the GUI and the AI controller
+
+    @staticmethod
+    def asset_repair_amount(faction: Faction, asset: Asset) -> int:
+        """Hit points fixed by one repair: half the relevant attribute, rounded up."""
+        return ceil(faction.get_attribute(asset.prototype.type) / 2)
+
+    @staticmethod
+    def faction_repair_amount(faction: Faction) -> int:
+        """Hit points fixed by repairing the faction: (highest + lowest attribute) / 2, rounded up."""  # noqa: E501
+        high_attr = max(faction.cunning, faction.force, faction.wealth)
+        low_attr = min(faction.cunning, faction.force, faction.wealth)
+        return ceil((high_attr + low_attr) / 2)
+
+    @staticmethod
+    def sell_price(asset: Asset) -> int:
+        """Half the purchase cost rounded down, or nothing if the asset is damaged."""
+        if asset.hp < asset.max_hp():
+            return 0
+        return floor(asset.prototype.requirements.cost / 2)
+
+    def move_asset(self: Self, asset: Asset, loc: Location, index: SpatialIndex) -> None:
+        """Move an asset to a new location."""
+        self._emit(
+            events.AssetMoved,
+            asset=asset.uuid,
+            source=asset.loc.uuid if asset.loc else None,
+            target=loc.uuid,
+        )
+        index.move_asset(asset, loc)
+
+    def move_assets(self: Self, moves: dict[Asset, Location], index: SpatialIndex) -> None:
+        """Move many assets at once, given as {asset: location}."""
+        for asset, loc in moves.items():
+            self._emit(
+                events.AssetMoved,
+                asset=asset.uuid,
+                source=asset.loc.uuid if asset.loc else None,
+                target=loc.uuid,
+            )
+        index.move_assets(moves)
+
+    def repair_asset(self: Self, faction: Faction, asset: Asset, index: SpatialIndex) -> bool:
+        """Repair an asset once. Returns False if the faction can't afford the repair."""
+        repair_cost = asset.repair_cost
+        if faction.treasure < repair_cost:
+            return False
+        faction.treasure -= repair_cost
+        asset.hp = min(asset.max_hp(), asset.hp + FactionTurn.asset_repair_amount(faction, asset))
+        # Multiple repairs cost more during same turn!
+        asset.repair_cost += 1
+        # Repairs emit no events, so report them to the index subscribers, e.g. the API server
+        index.changed(asset)
+        return True
+
+    def repair_faction(self: Self, faction: Faction, index: SpatialIndex) -> bool:
+        """Repair the faction, once per turn. Returns False if not possible."""
+        if self.repaired_faction or faction.treasure < FactionTurn.FACTION_REPAIR_COST:
+            return False
+        faction.treasure -= FactionTurn.FACTION_REPAIR_COST
+        faction.hp = min(faction.max_hp(), faction.hp + FactionTurn.faction_repair_amount(faction))
+        self.repaired_faction = True
+        index.changed(faction)
+        return True
+
+    def build_base(
+        self: Self, faction: Faction, loc: Location, hp: int, index: SpatialIndex
+    ) -> BaseOfInfluence | None:
+        """Build a base of influence for 1 Treasure per hit point. Returns None if not affordable."""  # noqa: E501
+        if hp <= 0 or faction.treasure < hp:
+            return None
+        faction.treasure -= hp
+        base = BaseOfInfluence(uuid=uuid4().hex, owner=faction.uuid, location=loc, max_hp=hp)
+        faction.bases.append(base)
+        index.add_base(base)
+        self._emit(events.BaseBuilt, base=base.uuid, location=loc.uuid, max_hp=base.max_hp)
+        # TODO(orkaboy): Cunning v Cunning, Attacks, Defend
+        return base
+
+    def create_asset(
+        self: Self,
+        faction: Faction,
+        prototype: AssetPrototype,
+        loc: Location,
+        index: SpatialIndex,
+    ) -> Asset | None:
+        """Buy a new asset at a location. Returns None if not affordable."""
+        cost = prototype.requirements.cost
+        if faction.treasure < cost:
+            return None
+        faction.treasure -= cost
+        asset = Asset(prototype=prototype, owner=faction.uuid, uuid=uuid4().hex, loc=loc)
+        faction.assets.append(asset)
+        index.add_asset(asset)
+        self._emit(
+            events.AssetCreated,
+            asset=asset.uuid,
+            prototype=prototype.strings.id,
+            location=loc.uuid,
+            cost=cost,
+        )
+        return asset
+
+    def create_assets(
+        self: Self,
+        faction: Faction,
+        prototypes: Iterable[AssetPrototype],
+        loc: Location,
+        index: SpatialIndex,
+    ) -> list[Asset]:
+        """Buy new assets at a location, all or none. Returns an empty list if not affordable."""
+        prototypes = list(prototypes)
+        cost = sum(prototype.requirements.cost for prototype in prototypes)
+        if not prototypes or faction.treasure < cost:
+            return []
+        faction.treasure -= cost
+        assets = [
+            Asset(prototype=prototype, owner=faction.uuid, uuid=uuid4().hex, loc=loc)
+            for prototype in prototypes
+        ]
+        faction.assets.extend(assets)
+        index.add_assets(assets)
+        for asset in assets:
+            self._emit(
+                events.AssetCreated,
+                asset=asset.uuid,
+                prototype=asset.prototype.strings.id,
+                location=loc.uuid,
+                cost=asset.prototype.requirements.cost,
+            )
+        return assets
+
+    def hide_asset(self: Self, faction: Faction, asset: Asset, index: SpatialIndex) -> bool:
+        """Give an asset the Stealth quality. Returns False if the faction can't afford it."""
+        if faction.treasure < FactionTurn.HIDE_ACTION_COST:
+            return False
+        faction.treasure -= FactionTurn.HIDE_ACTION_COST
+        asset.add_quality(QUALITY.Stealth)
+        index.update_asset(asset)
+        return True
+
+    def sell_asset(self: Self, faction: Faction, asset: Asset, index: SpatialIndex) -> int:
+        """Sell an asset, returning the Treasure gained."""
+        sell_price = FactionTurn.sell_price(asset)
+        faction.treasure += sell_price
+        self._emit(
+            events.AssetSold,
+            asset=asset.uuid,
+            prototype=asset.prototype.strings.id,
+            price=sell_price,
+        )
+        faction.assets.remove(asset)
+        index.remove_asset(asset)
+        return sell_price
+
+    def sell_assets(
+        self: Self, faction: Faction, assets: Iterable[Asset], index: SpatialIndex
+    ) -> int:
+        """Sell many assets of a faction at once, returning the Treasure gained."""
+        selling = set(assets)
+        kept: list[Asset] = []
+        sold: list[Asset] = []
+        total = 0
+        for asset in faction.assets:
+            if asset not in selling:
+                kept.append(asset)
+                continue
+            sell_price = FactionTurn.sell_price(asset)
+            total += sell_price
+            self._emit(
+                events.AssetSold,
+                asset=asset.uuid,
+                prototype=asset.prototype.strings.id,
+                price=sell_price,
+            )
+            sold.append(asset)
+        faction.treasure += total
+        # In place, like the location lists, so that other references see the sale
+        faction.assets[:] = kept
+        index.remove_assets(sold)
+        return total
+
+    def attack(
+        self: Self,
+        faction: Faction,
+        attacker: Asset,
+        target: Asset | BaseOfInfluence,
+        owners: dict[str, Faction],
+        index: SpatialIndex,
+    ) -> bool:
+        """
+        Resolve an attack by one asset against a rival asset or base of influence.
+
+        The attacker rolls its attack attribute against the defending faction's defense
+        attribute. On a success, the target takes the attacker's damage, otherwise the attacker
+        takes the target's counterattack damage. Returns True if the attack succeeded.
+        """
+        stats = attacker.prototype.stats
+        defender = owners[target.owner]
+        success = faction.roll_attribute(stats.atk_type) > defender.roll_attribute(stats.def_type)
+        if success:
+            self._damage(target, attacker.prototype.roll_damage(), defender, faction, index)
+        elif isinstance(target, Asset):
+            self._damage(attacker, target.prototype.roll_counter(), faction, defender, index)
+        return success
+
+    def _damage(
+        self: Self,
+        target: Asset | BaseOfInfluence,
+        damage: int,
+        owner: Faction,
+        source: Faction,
+        index: SpatialIndex,
+    ) -> None:
+        """Damage an asset or base of `owner`, dealt by `source`. Destroyed at zero hit points."""
+        if damage <= 0:
+            return
+        is_base = isinstance(target, BaseOfInfluence)
+        if is_base:
+            # Damage to a base is also done to the faction, but overflow damage is not
+            damage = min(damage, target.hp)
+            owner.hp -= damage
+        target.hp = max(0, target.hp - damage)
+        prototype = None if is_base else target.prototype.strings.id
+        self._emit(
+            events.AssetDamaged,
+            asset=target.uuid,
+            owner=owner.uuid,
+            source=source.uuid,
+            prototype=prototype,
+            damage=damage,
+            hp=target.hp,
+        )
+        if target.hp > 0:
+            return
+        if is_base:
+            owner.bases.remove(target)
+            index.remove_base(target)
+        else:
+            owner.assets.remove(target)
+            index.remove_asset(target)
+        self._emit(
+            events.AssetDestroyed,
+            asset=target.uuid,
+            owner=owner.uuid,
+            source=source.uuid,
+            prototype=prototype,
+        )
+        logger.info(f"    {owner.name} lost {'base at ' if is_base else ''}{target}.")
+
+    # Turn steps, shared by the GUI and the NPC auto-run
+
+    def start_round(self: Self, factions: list[Faction]) -> None:
+        """Roll initiative and start a new round of faction turns."""
+        for faction in factions:
+            faction.roll_initiative()
+        self.turn_order = sorted(
+            factions.copy(), key=lambda faction: faction.initiative, reverse=True
+        )
+        self.state = FactionTurn.TurnFSM.IDLE
+        self.cur_faction = 0
+        self.turn_idx += 1
+        logger.info(f"=== TURN {self.turn_idx} START ===")
+
+    def _end_round(self: Self) -> None:
+        self.turn_order = None
+        self.state = FactionTurn.TurnFSM.IDLE
+        self.cur_faction = 0
+        if self.event_log:
+            self.event_log.flush()
+
+    def gain_treasure(self: Self, faction: Faction) -> None:
+        """Step 1, gain treasure."""
+        treasure_gain = faction.treasure_gain()
+        faction.treasure += treasure_gain
+        self.state = FactionTurn.TurnFSM.PAY_UPKEEP
+        self._emit(events.TreasureGained, amount=treasure_gain, total=faction.treasure)
+        logger.debug(f"    Gained {treasure_gain} Treasure. New total is {faction.treasure}.")
+
+    def pay_upkeep(self: Self, faction: Faction) -> None:
+        """Step 2, pay upkeep for assets and excess assets, as far as the faction can."""
+        total_upkeep = faction.upkeep_due()
+        paid = min(faction.treasure, total_upkeep)
+        faction.treasure -= paid
+        self.state = FactionTurn.TurnFSM.SPECIAL_ABILITIES
+        self._emit(events.UpkeepPaid, amount=paid, total=faction.treasure)
+        if total_upkeep > 0:
+            logger.debug(f"    Paid {total_upkeep} Treasure in upkeep/excess assets.")
+
+    def _commit_action(self: Self) -> None:
+        """Record the open main action panel as the action taken, once the GM confirms it."""
+        self.action = self.state
+        self.state = FactionTurn.TurnFSM.POST_ACTION
+        logger.info(f"    Main action: {self.action.name}")
+
+    def post_action(self: Self, faction: Faction) -> None:
+        """Record the main action taken and clear the goal change paralysis."""
+        self._emit(events.MainActionTaken, action=self.action.name if self.action else None)
+        faction.goal_change_paralysis = False
+        self.state = FactionTurn.TurnFSM.CHECK_GOAL
+
+    def complete_goal(self: Self, faction: Faction) -> None:
+        """Collect the experience points for the faction's goal."""
+        faction.exp += faction.goal.difficulty
+        self._emit(events.GoalCompleted, goal=faction.goal.name, difficulty=faction.goal.difficulty)
+        faction.goal = None
+        logger.info("    Completed faction goal.")
+
+    def spend_treasure(self: Self, faction: Faction, amount: int, purpose: str) -> bool:
+        """Spend Treasure on something other than assets, such as bribes."""
+        if amount <= 0 or faction.treasure < amount:
+            return False
+        faction.treasure -= amount
+        self._emit(events.TreasureSpent, amount=amount, purpose=purpose, total=faction.treasure)
+        return True
+
+    def run_npc_turns(
+        self: Self, main_action: Callable[[Faction], None], include_players: bool = False
+    ) -> int:
+        """
+        Resolve turns in a loop without drawing, until a player faction's turn or the end of the round.
+
+        The main action of each NPC faction is taken by calling `main_action`, and special
+        abilities and goals are left alone. A faction that is in the middle of a main action
+        is left to the GM. With `include_players`, player factions are resolved the same way,
+        for headless simulation. Returns the number of faction turns completed.
+        """  # noqa: E501
+        completed = 0
+        while self._turn_active():
+            if self.state == FactionTurn.TurnFSM.NEXT_FACTION:
+                self.cur_faction += 1
+                self._new_turn()
+                completed += 1
+            if self.cur_faction >= len(self.turn_order):
+                self._end_round()
+                break
+            faction = self.turn_order[self.cur_faction]
+            if not (faction.npc or include_players):
+                break
+            match self.state:
+                case FactionTurn.TurnFSM.IDLE:
+                    self._new_turn()
+                case FactionTurn.TurnFSM.GAIN_TREASURE:
+                    self.gain_treasure(faction)
+                case FactionTurn.TurnFSM.PAY_UPKEEP:
+                    self.pay_upkeep(faction)
+                case FactionTurn.TurnFSM.SPECIAL_ABILITIES:
+                    self.state = FactionTurn.TurnFSM.MAIN_ACTION
+                case FactionTurn.TurnFSM.MAIN_ACTION:
+                    if not faction.goal_change_paralysis:
+                        main_action(faction)
+                    self.state = FactionTurn.TurnFSM.POST_ACTION
+                case FactionTurn.TurnFSM.POST_ACTION:
+                    self.post_action(faction)
+                case FactionTurn.TurnFSM.CHECK_GOAL:
+                    if self.goal_tracker and self.goal_tracker.is_complete(faction):
+                        self.complete_goal(faction)
+                    self.state = FactionTurn.TurnFSM.NEXT_FACTION
+                case _:
+                    break
+        return completed
+
+    def turn_logic(self: Self, locations: list[Location], index: SpatialIndex) -> None:
         """Execute turn logic according to the TurnFSM."""
         if self.cur_faction >= len(self.turn_order):
-            self.turn_order = None
-            self.state = FactionTurn.TurnFSM.IDLE
-            self.cur_faction = 0
+            self._end_round()
             return
         faction = self.turn_order[self.cur_faction]
 
@@ -130,13 +534,17 @@ class FactionTurn(YamlAble):
                     "1. The faction earns Treasure equal to half their Wealth plus a quarter of their combined Force and Cunning, the total being rounded up."  # noqa: E501
                 )
                 treasure_gain = faction.treasure_gain()
-                imgui.text_wrapped(f"{faction.name} will gain {treasure_gain} Treasure.")
-                if imgui.button("Apply treasure gain"):
-                    faction.treasure += treasure_gain
-                    self.state = FactionTurn.TurnFSM.PAY_UPKEEP
-                    logger.debug(
-                        f"    Gained {treasure_gain} Treasure. New total is {faction.treasure}."
+                imgui.text_wrapped(
+                    LABELS.format(
+                        faction.uuid,
+                        "gain",
+                        "{} will gain {} Treasure.",
+                        faction.name,
+                        treasure_gain,
                     )
+                )
+                if imgui.button("Apply treasure gain"):
+                    self.gain_treasure(faction)
 
             case FactionTurn.TurnFSM.PAY_UPKEEP:
                 imgui.text_wrapped(
@@ -148,7 +556,15 @@ class FactionTurn(YamlAble):
                     assets = faction.assets_by_type(asset_type)
                     asset_excess = faction.asset_excess(asset_type)
                     imgui.text(
-                        f"{asset_type.name} ASSETS ({len(assets)}/{faction.get_attribute(asset_type)}, excess cost: {asset_excess}):"  # noqa: E501
+                        LABELS.format(
+                            faction.uuid,
+                            UPKEEP_FIELDS[asset_type],
+                            "{} ASSETS ({}/{}, excess cost: {}):",
+                            asset_type.name,
+                            len(assets),
+                            faction.get_attribute(asset_type),
+                            asset_excess,
+                        )
                     )
                     asset_total_excess += asset_excess
                     for asset in assets:
@@ -156,21 +572,29 @@ class FactionTurn(YamlAble):
                             asset.is_initialized()
                         ):  # Avoid crashing if asset.prototype isn't defined
                             imgui.text(
-                                f"{asset} (upkeep: {asset.prototype.upkeep()}), location: {asset.loc}"  # noqa: E501
-                            )
-                            LayoutHelper.add_tooltip(
-                                f"{asset.desc}\n\n{asset.prototype.strings.rules}"
+                                LABELS.text(
+                                    asset.uuid,
+                                    "upkeep",
+                                    "{0} (upkeep: {0.prototype.stats.upkeep}), location: {0.loc}",
+                                    asset,
+                                )
                             )
+                            LayoutHelper.add_tooltip(FactionTurn._rules_tooltip(asset))
                 LayoutHelper.add_spacer()
                 total_upkeep = asset_upkeep + asset_total_excess
                 imgui.text(
-                    f"Total upkeep for {faction.name} to pay is {asset_upkeep} + {asset_excess} = {total_upkeep}. Remove excess assets if unable to pay."  # noqa: E501
+                    LABELS.format(
+                        faction.uuid,
+                        "upkeep",
+                        "Total upkeep for {} to pay is {} + {} = {}. Remove excess assets if unable to pay.",  # noqa: E501
+                        faction.name,
+                        asset_upkeep,
+                        asset_excess,
+                        total_upkeep,
+                    )
                 )
                 if imgui.button("Pay upkeep"):
-                    faction.treasure = max(0, faction.treasure - total_upkeep)
-                    self.state = FactionTurn.TurnFSM.SPECIAL_ABILITIES
-                    if total_upkeep > 0:
-                        logger.debug(f"    Paid {total_upkeep} Treasure in upkeep/excess assets.")
+                    self.pay_upkeep(faction)
 
             case FactionTurn.TurnFSM.SPECIAL_ABILITIES:
                 imgui.text_wrapped(
@@ -178,12 +602,14 @@ class FactionTurn(YamlAble):
                 )
                 for asset in faction.assets:
                     if asset.is_initialized():  # Avoid crashing if asset.prototype isn't defined
-                        imgui.text(f"{asset}, location: {asset.loc}")
-                        LayoutHelper.add_tooltip(f"{asset.desc}\n\n{asset.prototype.strings.rules}")
-                        if QUALITY.Action in asset.qualities:
+                        imgui.text(
+                            LABELS.text(asset.uuid, "special", "{0}, location: {0.loc}", asset)
+                        )
+                        LayoutHelper.add_tooltip(FactionTurn._rules_tooltip(asset))
+                        if asset.has_quality(QUALITY.Action):
                             imgui.same_line()
                             imgui.text("ACTION")
-                        if QUALITY.Special in asset.qualities:
+                        if asset.has_quality(QUALITY.Special):
                             imgui.same_line()
                             imgui.text("SPECIAL")
                 LayoutHelper.add_spacer()
@@ -244,6 +670,7 @@ class FactionTurn(YamlAble):
                     imgui.end_disabled()
 
                 if imgui.button("Skip Main Action"):
+                    self.action = None
                     self.state = FactionTurn.TurnFSM.POST_ACTION
                 LayoutHelper.add_tooltip("Skip the faction's main action this turn.")
 
@@ -256,19 +683,18 @@ class FactionTurn(YamlAble):
                 | FactionTurn.TurnFSM.ACTION_HIDE_ASSET
                 | FactionTurn.TurnFSM.ACTION_SELL_ASSET
             ):
-                self.main_action(locations)
+                self.main_action(locations, index)
 
                 LayoutHelper.add_spacer()
 
                 if imgui.button(label="Back##Action"):
+                    self.action = None
                     self.state = FactionTurn.TurnFSM.MAIN_ACTION
                 if imgui.button(label="Done##Action"):
-                    self.state = FactionTurn.TurnFSM.POST_ACTION
-                    logger.info(f"    Main action: {self.state.name}")
+                    self._commit_action()
 
             case FactionTurn.TurnFSM.POST_ACTION:
-                faction.goal_change_paralysis = False
-                self.state = FactionTurn.TurnFSM.CHECK_GOAL
+                self.post_action(faction)
 
             case FactionTurn.TurnFSM.CHECK_GOAL:
                 imgui.text_wrapped(
@@ -279,11 +705,12 @@ class FactionTurn(YamlAble):
                 # Goals
                 imgui.text("CURRENT GOAL:")
                 if faction.goal:
-                    faction.goal.render(f"Turn_{faction.uuid}")
+                    if faction.goal.render(faction.uuid):
+                        index.changed(faction)
+                    self._goal_progress_section(faction, index)
                     if imgui.button("Complete goal"):
-                        faction.exp += faction.goal.difficulty
-                        faction.goal = None
-                        logger.info("    Completed faction goal.")
+                        self.complete_goal(faction)
+                        index.changed(faction)
                 elif imgui.begin_combo(label="Set Goal##Turn", preview_value="Set faction goal"):
                     for goal in goals_list():
                         _, selected = imgui.selectable(
@@ -293,12 +720,14 @@ class FactionTurn(YamlAble):
                         LayoutHelper.add_tooltip(goal.desc)
                         if selected:
                             faction.goal = copy(goal)
+                            index.changed(faction)
                     imgui.end_combo()
                 STYLE.button_color(STYLE.COL_RED)
                 if faction.goal and imgui.button("Abort goal"):
                     # Mark as paralyzed next turn
                     faction.goal_change_paralysis = True
                     faction.goal = None
+                    index.changed(faction)
                     logger.info("    Aborted faction goal (no main action next turn).")
                 STYLE.pop_color()
 
@@ -309,6 +738,41 @@ class FactionTurn(YamlAble):
                 if imgui.button("COMPLETE TURN##Turn"):
                     self.state = FactionTurn.TurnFSM.NEXT_FACTION
 
+    def _goal_progress_section(self: Self, faction: Faction, index: SpatialIndex) -> None:
+        """Show the tracked goal progress, the sphere of Sphere Dominance, and bribes for Wealth of Kingdoms."""  # noqa: E501
+        if self.goal_tracker and faction.goal and faction.goal.name == GOALS.SphereDominance.name:
+            sphere = self.goal_tracker.sphere(faction)
+            if imgui.begin_combo(
+                label="Sphere##Turn", preview_value=sphere.name if sphere else "Choose"
+            ):
+                for asset_type in SPHERES:
+                    _, selected = imgui.selectable(
+                        label=f"{asset_type.name}##Turn_sphere", p_selected=asset_type == sphere
+                    )
+                    if selected:
+                        self.goal_tracker.set_sphere(faction, asset_type)
+                        index.changed(faction)
+                imgui.end_combo()
+        status = self.goal_tracker.status(faction) if self.goal_tracker else None
+        if status is None:
+            return
+        progress, target = status
+        if progress >= target:
+            STYLE.text_color(STYLE.COL_GREEN)
+            imgui.text(f"Goal accomplished ({progress}/{target})!")
+            STYLE.pop_color()
+        else:
+            imgui.text(f"Progress: {progress}/{target}")
+        if faction.goal.name == GOALS.WealthOfKingdoms.name:
+            _, self.bribe = imgui.input_int(label="Bribes##Turn", v=self.bribe)
+            disabled = self.bribe <= 0 or faction.treasure < self.bribe
+            if disabled:
+                imgui.begin_disabled()
+            if imgui.button("Spend on bribes##Turn"):
+                self.spend_treasure(faction, self.bribe, BRIBES)
+            if disabled:
+                imgui.end_disabled()
+
     def _level_up_section(self: Self, faction: Faction) -> None:
         """Upgrade stats with exp."""
         imgui.text(f"Faction experience points: {faction.exp}")
@@ -321,6 +785,9 @@ class FactionTurn(YamlAble):
             if imgui.button(label=f"Level up ({exp_cost})##Turn_buy_cunning"):
                 faction.exp -= exp_cost
                 faction.cunning += 1
+                self._emit(
+                    events.LevelUp, attribute="CUNNING", level=faction.cunning, exp_cost=exp_cost
+                )
             if disabled:
                 imgui.end_disabled()
         imgui.text(f"FORCE: {faction.force}")
@@ -332,6 +799,9 @@ class FactionTurn(YamlAble):
             if imgui.button(label=f"Level up ({exp_cost})##Turn_buy_force"):
                 faction.exp -= exp_cost
                 faction.force += 1
+                self._emit(
+                    events.LevelUp, attribute="FORCE", level=faction.force, exp_cost=exp_cost
+                )
             if disabled:
                 imgui.end_disabled()
         imgui.text(f"WEALTH: {faction.wealth}")
@@ -343,10 +813,13 @@ class FactionTurn(YamlAble):
             if imgui.button(label=f"Level up ({exp_cost})##Turn_buy_wealth"):
                 faction.exp -= exp_cost
                 faction.wealth += 1
+                self._emit(
+                    events.LevelUp, attribute="WEALTH", level=faction.wealth, exp_cost=exp_cost
+                )
             if disabled:
                 imgui.end_disabled()
 
-    def main_action(self: Self, locations: list[Location]) -> None:
+    def main_action(self: Self, locations: list[Location], index: SpatialIndex) -> None:
         """Display main action part of statemachine."""
         faction = self.turn_order[self.cur_faction]
 
@@ -361,17 +834,27 @@ If the damage done to an Asset reduces it to zero hit points, it is destroyed. T
 Damage done to a Base of Influence is also done directly to the faction's hit points. Overflow damage is not transmitted, however; if the Base of Influence only has 5 hit points and 7 hit points are inflicted, the faction loses the Base of Influence and 5 hit points from its total."""  # noqa: E501
                 )
 
-                imgui.text(f"{faction} can attack with the following assets:")
+                imgui.text(
+                    LABELS.text(
+                        faction.uuid, "attack", "{0} can attack with the following assets:", faction
+                    )
+                )
                 for asset in faction.assets:
                     if asset.is_initialized() and asset.prototype.stats.atk_type:
-                        imgui.text(f"{asset} ({asset.loc})")
+                        imgui.text(FactionTurn._asset_at(asset))
                         LayoutHelper.add_tooltip(
-                            f"{asset.desc}\n\n{asset.prototype.strings.rules}\n\n{asset.prototype.strings.damage_formula}"
+                            LABELS.text(
+                                asset.uuid,
+                                "attack_tip",
+                                "{0.desc}\n\n{1.rules}\n\n{1.damage_formula}",
+                                asset,
+                                asset.prototype.strings,
+                            )
                         )
                         # TODO(orkaboy): Automate attack/damage/counter
 
                 if imgui.button("Done attacking##Turn"):
-                    self.state = FactionTurn.TurnFSM.POST_ACTION
+                    self._commit_action()
 
             case FactionTurn.TurnFSM.ACTION_MOVE_ASSET:
                 imgui.text("MOVE ASSET:")
@@ -382,16 +865,18 @@ If an asset loses the Subtle or Stealth qualities while in a hostile location, t
 
                 # TODO(orkaboy): Account for the losing Stealth/Subtle rule?
 
-                imgui.text(f"{faction} can move the following assets:")
+                imgui.text(
+                    LABELS.text(faction.uuid, "move", "{0} can move the following assets:", faction)
+                )
                 for asset in faction.assets:
                     if asset.is_initialized():
-                        imgui.text(f"{asset} ({asset.loc})")
-                        LayoutHelper.add_tooltip(f"{asset.desc}\n\n{asset.prototype.strings.rules}")
+                        imgui.text(FactionTurn._asset_at(asset))
+                        LayoutHelper.add_tooltip(FactionTurn._rules_tooltip(asset))
                         imgui.same_line()
                         # Dropdown list and move button for each asset
                         if imgui.begin_combo(
-                            label=f"Target Location##Turn_{asset.uuid}",
-                            preview_value=f"{asset.move_target}",
+                            label=LABELS.label(asset.uuid, "target", "Target Location"),
+                            preview_value=str(asset.move_target),
                         ):
                             for loc in locations:
                                 _, selected = imgui.selectable(
@@ -404,14 +889,15 @@ If an asset loses the Subtle or Stealth qualities while in a hostile location, t
                             imgui.end_combo()
 
                 if imgui.button("Confirm move##Turn"):
-                    self.state = FactionTurn.TurnFSM.POST_ACTION
-                    for asset in faction.assets:
-                        if asset.is_initialized() and asset.move_target:
-                            if asset.loc:
-                                asset.loc.assets.remove(asset)
-                            asset.loc = asset.move_target
-                            asset.move_target.assets.append(asset)
-                            asset.move_target = None
+                    self._commit_action()
+                    moves = {
+                        asset: asset.move_target
+                        for asset in faction.assets
+                        if asset.is_initialized() and asset.move_target
+                    }
+                    self.move_assets(moves, index)
+                    for asset in moves:
+                        asset.move_target = None
 
             case FactionTurn.TurnFSM.ACTION_REPAIR_ASSET:
                 imgui.text("REPAIR ASSET:")
@@ -420,7 +906,9 @@ If an asset loses the Subtle or Stealth qualities while in a hostile location, t
 This ability can at the same time also be used to repair damage done to the faction, spending 1 Treasure to heal a total equal to the faction's highest and lowest Force, Wealth, or Cunning attribute divided by two, rounded up. Thus, a faction with a Force of 5, Wealth of 2, and Cunning of 4 would heal 4 points of damage. Only one such application of healing is possible for a faction each turn."""  # noqa: E501
                 )
 
-                imgui.text(f"Current Treasure: {faction.treasure}")
+                imgui.text(
+                    LABELS.text(faction.uuid, "treasure", "Current Treasure: {0.treasure}", faction)
+                )
 
                 for asset in faction.assets:
                     if not asset.is_initialized():
@@ -430,50 +918,66 @@ This ability can at the same time also be used to repair damage done to the fact
                     if not full_hp:
                         asset.render_brief()
                         imgui.same_line()
-                        imgui.text(f"HP: {asset.hp}/{asset.max_hp()}")
+                        imgui.text(
+                            LABELS.text(
+                                asset.uuid,
+                                "hp",
+                                "HP: {0.hp}/{1.max_hp}",
+                                asset,
+                                asset.prototype.stats,
+                            )
+                        )
                         imgui.same_line()
-                        attribute = faction.get_attribute(asset.prototype.type)
-                        repair_amount = ceil(attribute / 2)
+                        repair_amount = FactionTurn.asset_repair_amount(faction, asset)
                         repair_cost = asset.repair_cost
                         disabled = faction.treasure < repair_cost
                         if disabled:
                             imgui.begin_disabled()
-                        if imgui.button(label=f"Repair##{asset.uuid}"):
-                            faction.treasure -= repair_cost
-                            asset.hp = min(asset.max_hp(), asset.hp + repair_amount)
-                            # Multiple repairs cost more during same turn!
-                            asset.repair_cost += 1
+                        if imgui.button(label=LABELS.label(asset.uuid, "repair", "Repair")):
+                            self.repair_asset(faction, asset, index)
                         LayoutHelper.add_tooltip(
-                            f"Repair up to {repair_amount} HP on Asset for {repair_cost} Treasure"
+                            LABELS.format(
+                                asset.uuid,
+                                "repair_tip",
+                                "Repair up to {} HP on Asset for {} Treasure",
+                                repair_amount,
+                                repair_cost,
+                            )
                         )
                         if disabled:
                             imgui.end_disabled()
 
                 # Repair faction button
-                high_attr = max(faction.cunning, faction.force, faction.wealth)
-                low_attr = min(faction.cunning, faction.force, faction.wealth)
-                repair_amount = ceil((high_attr + low_attr) / 2)
-                repair_cost = 1
+                repair_amount = FactionTurn.faction_repair_amount(faction)
+                repair_cost = FactionTurn.FACTION_REPAIR_COST
                 # Only available once per turn
                 disabled = faction.treasure < repair_cost
-                imgui.text(f"Faction HP: {faction.hp}/{faction.max_hp()}")
+                imgui.text(
+                    LABELS.format(
+                        faction.uuid, "hp", "Faction HP: {}/{}", faction.hp, faction.max_hp()
+                    )
+                )
                 if self.repaired_faction:
                     imgui.text("(Repairing faction is only available once per turn)")
                     disabled = True
                 if disabled:
                     imgui.begin_disabled()
                 if imgui.button("Repair faction"):
-                    faction.treasure -= repair_cost
-                    faction.hp = min(faction.max_hp(), faction.hp + repair_amount)
-                    self.repaired_faction = True
+                    self.repair_faction(faction, index)
                 LayoutHelper.add_tooltip(
-                    f"Repair faction for up to {repair_amount} HP, for {repair_cost} Treasure"
+                    LABELS.format(
+                        faction.uuid,
+                        "repair",
+                        "Repair faction for up to {} HP, for {} Treasure",
+                        repair_amount,
+                        repair_cost,
+                    )
                 )
                 if disabled:
                     imgui.end_disabled()
 
                 if imgui.button("Done repairing##Turn"):
-                    self.state = FactionTurn.TurnFSM.POST_ACTION
+                    self._commit_action()
 
             case FactionTurn.TurnFSM.ACTION_EXPAND_INFLUENCE:
                 imgui.text("EXPAND INFLUENCE:")
@@ -483,10 +987,7 @@ Once the Base of Influence is created, the owner makes a Cunning versus Cunning
 If the Base of Influence survives this onslaught, it operates as normal and allows the faction to purchase new Assets there with the Create Asset action."""  # noqa: E501
                 )
 
-                locs: set[Location] = {}
-                for asset in faction.assets:
-                    if asset.loc:
-                        locs.add(asset.loc)
+                locs: set[Location] = index.asset_locations(faction.uuid)
 
                 if imgui.begin_combo(label="Base Location##Turn", preview_value=f"{self.boi_loc}"):
                     for loc in locs:
@@ -507,60 +1008,61 @@ If the Base of Influence survives this onslaught, it operates as normal and allo
                         f"Build a new base of influence at '{self.boi_loc}' with '{self.boi_hp}' HP (costing {self.boi_hp} Treasure)"  # noqa: E501
                     )
 
-                    # rival_factions: list[str] = []
-                    rival_assets: list[Asset] = []
-                    faction_assets: list[Asset] = []
-                    for asset_cast in self.boi_loc.assets:
-                        asset: Asset = asset_cast
-                        if asset.is_initialized():
-                            if asset.owner != faction.uuid:
-                                if asset.prototype.stats.atk_type:
-                                    rival_assets.append(asset)
-                            else:
-                                faction_assets.append(asset)
+                    rival_assets: list[Asset] = [
+                        asset
+                        for asset in index.rival_assets(self.boi_loc, faction.uuid)
+                        if asset.is_initialized() and asset.prototype.stats.atk_type
+                    ]
+                    faction_assets: list[Asset] = [
+                        asset
+                        for asset in index.assets(location=self.boi_loc, owner=faction.uuid)
+                        if asset.is_initialized()
+                    ]
 
                     if len(rival_assets) > 0:
                         imgui.text(
                             "The following assets will be able to make a free Attack against the new base if the owning faction succeeds at a Cunning v. Cunning roll:"  # noqa: E501
                         )
+                        owners = {rival.uuid: rival for rival in self.turn_order}
                         for asset in rival_assets:
-                            owner: Faction = None
-                            for faction in self.turn_order:
-                                if faction.uuid == asset.owner:
-                                    owner = faction
-                                    break
-                            imgui.text(f"{asset} ({owner})")
+                            owner = owners.get(asset.owner)
+                            imgui.text(LABELS.text(asset.uuid, "owner", "{0} ({1})", asset, owner))
                             LayoutHelper.add_tooltip(
-                                f"{asset.desc}\n\nDamage formula: {asset.prototype.strings.damage_formula}"  # noqa: E501
+                                LABELS.text(
+                                    asset.uuid,
+                                    "damage_tip",
+                                    "{0.desc}\n\nDamage formula: {1.damage_formula}",
+                                    asset,
+                                    asset.prototype.strings,
+                                )
                             )
                         imgui.text(
                             "The faction building the new base may defend with any assets present:"
                         )
                         for asset in faction_assets:
-                            imgui.text(f"{asset}, HP {asset.hp}/{asset.max_hp()}")
-                            LayoutHelper.add_tooltip(f"{asset.desc}")
+                            imgui.text(
+                                LABELS.text(
+                                    asset.uuid,
+                                    "defend",
+                                    "{0}, HP {0.hp}/{1.max_hp}",
+                                    asset,
+                                    asset.prototype.stats,
+                                )
+                            )
+                            LayoutHelper.add_tooltip(asset.desc)
 
                     disabled = faction.treasure < self.boi_hp
                     if disabled:
                         imgui.begin_disabled()
                     if imgui.button("Build##Turn_buy_boi"):
-                        faction.treasure -= self.boi_hp
-                        base = BaseOfInfluence(
-                            uuid=uuid4().hex,
-                            owner=faction.uuid,
-                            location=self.boi_loc,
-                            max_hp=self.boi_hp,
-                        )
-                        faction.bases.append(base)
-                        self.boi_loc.bases.append(base)
-                        # TODO(orkaboy): Cunning v Cunning, Attacks, Defend
+                        self.build_base(faction, self.boi_loc, self.boi_hp, index)
                     if disabled:
                         imgui.end_disabled()
 
                 LayoutHelper.add_spacer()
 
                 if imgui.button("Done building bases##Turn"):
-                    self.state = FactionTurn.TurnFSM.POST_ACTION
+                    self._commit_action()
 
             case FactionTurn.TurnFSM.ACTION_CREATE_ASSET:
                 imgui.text("CREATE ASSET:")
@@ -595,26 +1097,33 @@ A faction can have no more Assets of a particular attribute than their attribute
                         if selected:
                             self.asset_to_buy_loc = base.location
                     imgui.end_combo()
+                _, self.asset_to_buy_override = imgui.checkbox(
+                    label="GM override##Turn_buy", v=self.asset_to_buy_override
+                )
+                LayoutHelper.add_tooltip("Let the faction create more than one asset this turn.")
+                if self.asset_to_buy_override:
+                    imgui.same_line()
+                    _, self.asset_to_buy_count = imgui.input_int(
+                        label="Count##Turn_buy", v=self.asset_to_buy_count
+                    )
+                    self.asset_to_buy_count = max(1, self.asset_to_buy_count)
+                else:
+                    self.asset_to_buy_count = 1
                 LayoutHelper.add_spacer()
                 if self.asset_to_buy and self.asset_to_buy_loc:
-                    cost = self.asset_to_buy.requirements.cost
+                    count = self.asset_to_buy_count
+                    cost = self.asset_to_buy.requirements.cost * count
                     imgui.text(
-                        f"Selected asset of type '{self.asset_to_buy}' at location '{self.asset_to_buy_loc}' for {cost} Treasure."  # noqa: E501
+                        f"Selected {count} asset(s) of type '{self.asset_to_buy}' at location '{self.asset_to_buy_loc}' for {cost} Treasure."  # noqa: E501
                     )
                     can_buy = faction.treasure >= cost
                     if not can_buy:
                         imgui.begin_disabled()
                     if imgui.button(label="Buy Asset##Turn"):
-                        faction.treasure -= cost
-                        new_asset = Asset(
-                            prototype=self.asset_to_buy,
-                            owner=faction.uuid,
-                            uuid=uuid4().hex,
-                            loc=self.asset_to_buy_loc,
+                        self.create_assets(
+                            faction, [self.asset_to_buy] * count, self.asset_to_buy_loc, index
                         )
-                        faction.assets.append(new_asset)
-                        self.asset_to_buy_loc.assets.append(new_asset)
-                        self.state = FactionTurn.TurnFSM.POST_ACTION
+                        self._commit_action()
                     if not can_buy:
                         imgui.end_disabled()
 
@@ -628,53 +1137,93 @@ A faction can have no more Assets of a particular attribute than their attribute
                     if not asset.is_initialized() or asset.loc is None:
                         continue
 
-                    if QUALITY.Stealth not in asset.qualities:
+                    if not asset.has_quality(QUALITY.Stealth):
                         asset.render_brief()
                         imgui.same_line()
                         # Disable if rival faction has Base of Influence in location
-                        rival_at_loc = False
-                        for base_cast in asset.loc.bases:
-                            base: BaseOfInfluence = base_cast
-                            if base.owner != faction.uuid:
-                                rival_at_loc = True
-                                break
+                        rival_at_loc = bool(index.rival_bases(asset.loc, faction.uuid))
 
                         disabled = faction.treasure < FactionTurn.HIDE_ACTION_COST or rival_at_loc
                         if disabled:
                             imgui.begin_disabled()
-                        if imgui.button(label=f"Add Stealth for 2 Treasure##{asset.uuid}"):
-                            faction.treasure -= FactionTurn.HIDE_ACTION_COST
-                            asset.qualities.append(QUALITY.Stealth)
+                        if imgui.button(
+                            label=LABELS.label(asset.uuid, "hide", "Add Stealth for 2 Treasure")
+                        ):
+                            self.hide_asset(faction, asset, index)
                         if disabled:
                             LayoutHelper.add_tooltip("Cannot afford to add Stealth to asset.")
                             imgui.end_disabled()
                 if imgui.button("Done hiding##Turn"):
-                    self.state = FactionTurn.TurnFSM.POST_ACTION
+                    self._commit_action()
 
             case FactionTurn.TurnFSM.ACTION_SELL_ASSET:
                 imgui.text("SELL ASSET:")
                 imgui.text_wrapped(
                     "The faction voluntarily decommissions an Asset, salvaging it for what it's worth. The Asset is lost and the faction gains half its purchase cost in Treasure, rounded down. If the Asset is damaged when it is sold, however, no Treasure is gained."  # noqa: E501
                 )
-                rm_asset = -1
-                for idx, asset in enumerate(faction.assets):
+                # Assets are picked first, and sold together
+                total = 0
+                count = 0
+                for asset in faction.assets:
                     if not asset.is_initialized():
                         continue
 
                     asset.render_brief()
-                    full_hp: bool = asset.hp == asset.max_hp()
-                    sell_price: int = floor(asset.prototype.requirements.cost / 2) if full_hp else 0
+                    sell_price = FactionTurn.sell_price(asset)
                     imgui.same_line()
-                    if imgui.button(f"Sell Asset for {sell_price} Treasure##{asset.uuid}"):
-                        faction.treasure += sell_price
-                        rm_asset = idx
-                if rm_asset != -1:
-                    faction.assets.pop(rm_asset)
+                    picked = asset in self.assets_to_sell
+                    clicked, picked = imgui.checkbox(
+                        LABELS.format(
+                            asset.uuid,
+                            "sell",
+                            "Sell Asset for {} Treasure##{}_sell",
+                            sell_price,
+                            asset.uuid,
+                        ),
+                        picked,
+                    )
+                    if clicked:
+                        if picked:
+                            self.assets_to_sell.add(asset)
+                        else:
+                            self.assets_to_sell.discard(asset)
+                    if picked:
+                        total += sell_price
+                        count += 1
+                if count != len(self.assets_to_sell):
+                    # Some picked assets were destroyed or removed elsewhere
+                    self.assets_to_sell.intersection_update(faction.assets)
+                disabled = not self.assets_to_sell
+                if disabled:
+                    imgui.begin_disabled()
+                if imgui.button(
+                    LABELS.format(
+                        faction.uuid,
+                        "sell_picked",
+                        "Sell {} assets for {} Treasure###Turn_sell",
+                        count,
+                        total,
+                    )
+                ):
+                    self.sell_assets(faction, self.assets_to_sell, index)
+                    self.assets_to_sell = set()
+                if disabled:
+                    imgui.end_disabled()
                 if imgui.button("Done selling##Turn"):
-                    self.state = FactionTurn.TurnFSM.POST_ACTION
+                    self._commit_action()
             case _:
                 imgui.text("ERROR STATE")
 
+    @staticmethod
+    def _asset_at(asset: Asset) -> str:
+        return LABELS.text(asset.uuid, "at", "{0} ({0.loc})", asset)
+
+    @staticmethod
+    def _rules_tooltip(asset: Asset) -> str:
+        return LABELS.text(
+            asset.uuid, "rules_tip", "{0.desc}\n\n{1.rules}", asset, asset.prototype.strings
+        )
+
     def _create_asset_combo_prototypes(
         self: Self, proto_list: list[AssetPrototype], magic: MagicLevel, tier: int
     ) -> None:
@@ -692,7 +1241,9 @@ A faction can have no more Assets of a particular attribute than their attribute
             if selected:
                 self.asset_to_buy = prototype
 
-    def execute(self: Self, factions: list[Faction], locations: list[Location]) -> None:
+    def execute(
+        self: Self, factions: list[Faction], locations: list[Location], index: SpatialIndex
+    ) -> None:
         """Draw turn logic GUI."""
         imgui.begin("Turn")
 
@@ -705,18 +1256,30 @@ A faction can have no more Assets of a particular attribute than their attribute
                 # Print out the turn order and progress
                 imgui.text("TURN ORDER:")
                 for idx, faction in enumerate(self.turn_order):
-                    if idx == self.cur_faction:
-                        imgui.text(f"{faction.initiative}: {faction.name} (CURRENT)")
-                    else:
-                        imgui.text(f"{faction.initiative}: {faction.name}")
+                    npc = " [NPC]" if faction.npc else ""
+                    current = " (CURRENT)" if idx == self.cur_faction else ""
+                    imgui.text(
+                        LABELS.format(
+                            faction.uuid,
+                            "order",
+                            "{}: {}{}{}",
+                            faction.initiative,
+                            faction.name,
+                            npc,
+                            current,
+                        )
+                    )
 
                 # Execute main turn logic
                 LayoutHelper.add_spacer()
-                self.turn_logic(locations)
+                self.turn_logic(locations, index)
                 LayoutHelper.add_spacer()
-                _, faction.notes = imgui.input_text_multiline(
-                    label=f"Faction Notes##Turn_{faction.uuid}", str=faction.notes
+                changed, faction.notes = imgui.input_text_multiline(
+                    label=LABELS.label(faction.uuid, "turn_notes", "Faction Notes"),
+                    str=faction.notes,
                 )
+                if changed:
+                    index.changed(faction)
 
                 # End turn, next faction etc.
                 STYLE.button_color(STYLE.COL_RED)
@@ -724,18 +1287,10 @@ A faction can have no more Assets of a particular attribute than their attribute
                     self.state = FactionTurn.TurnFSM.NEXT_FACTION
                 if imgui.button("Abort Turn"):
                     # TODO(orkaboy): Currently doesn't rollback changes made
-                    self.turn_order = None
-                    self.state = FactionTurn.TurnFSM.IDLE
+                    self._end_round()
                 STYLE.pop_color()
             elif imgui.button("New Turn"):
-                for faction in factions:
-                    faction.roll_initiative()
-                self.turn_order = sorted(
-                    factions.copy(), key=lambda faction: faction.initiative, reverse=True
-                )
-                self.state = FactionTurn.TurnFSM.IDLE
-                self.turn_idx += 1
-                logger.info(f"=== TURN {self.turn_idx} START ===")
+                self.start_round(factions)
         else:
             imgui.text("Create factions to start a turn.")
 
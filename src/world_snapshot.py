@@ -0,0 +1,319 @@
+"""
+Memory-mapped world snapshots, for analysis workers.
+
+A snapshot file holds the factions, locations, assets and bases of a project as columns of
+fixed-width numbers, one array per field, plus a table of the strings they refer to (uuids,
+names and prototype ids). References between objects are row numbers, e.g. the `owner` of an
+asset is the row of its faction and `loc` the row of its location, -1 for none.
+
+```py
+write_snapshot("world.snap", project.factions, project.locations, project.turn.turn_idx)
+
+world = WorldSnapshot("world.snap")
+hp = world.assets["hp"]                     # Read-only numpy array, straight from the file
+owners = world.factions["uuid"][world.assets["owner"]]
+world.strings(owners[:10])                  # The uuids of the owners of the first assets
+```
+
+The file is opened with `numpy.memmap`, so the columns are views of the OS page cache: nothing
+is parsed, no model objects are built, and any number of processes that open the same file
+share one copy of it in RAM. Pickling a `WorldSnapshot` only sends the filename, so it can be
+passed to `multiprocessing` workers, which map the file again on their side.
+
+File layout, with each section aligned to `ALIGN` bytes:
+
+    MAGIC | header length (uint64) | JSON header | columns ... | string offsets | string data
+
+The header has the turn, the number of rows of each table, and the dtype and file offset of
+each column. Strings are numbered in the order they were first seen; string `i` is the UTF-8
+data from `offsets[i]` to `offsets[i + 1]`.
+"""
+
+import json
+import os
+import struct
+from collections.abc import Iterable
+from typing import Self
+
+from src.faction import Faction
+from src.lazy_import import lazy_import
+from src.location import Location
+from src.system import AssetType
+
+# numpy is only needed once a snapshot is written or read
+np = lazy_import("numpy")
+
+MAGIC = b"WWNSNAP1"
+ALIGN = 64
+# Row number or string of a missing reference
+NONE = -1
+
+ASSET_TYPES = tuple(AssetType)
+
+# Columns of each table, and their dtypes. "str" columns hold string numbers.
+FACTION_COLUMNS = {
+    "uuid": "<i4",  # str
+    "name": "<i4",  # str
+    "cunning": "<i1",
+    "force": "<i1",
+    "wealth": "<i1",
+    "magic": "<i1",
+    "hp": "<i4",
+    "max_hp": "<i4",
+    "treasure": "<i4",
+    "exp": "<i4",
+    "npc": "|b1",
+    "paralyzed": "|b1",
+}
+LOCATION_COLUMNS = {
+    "uuid": "<i4",  # str
+    "name": "<i4",  # str
+}
+ASSET_COLUMNS = {
+    "uuid": "<i4",  # str
+    "owner": "<i4",  # faction row
+    "prototype": "<i4",  # str, prototype id, NONE if uninitialized
+    "type": "<i1",  # index in ASSET_TYPES
+    "hp": "<i4",
+    "max_hp": "<i4",
+    "loc": "<i4",  # location row
+    "qualities": "<u8",  # quality bitmask
+    "repair_cost": "<i4",
+}
+BASE_COLUMNS = {
+    "uuid": "<i4",  # str
+    "owner": "<i4",  # faction row
+    "loc": "<i4",  # location row
+    "hp": "<i4",
+    "max_hp": "<i4",
+}
+TABLES = {
+    "factions": FACTION_COLUMNS,
+    "locations": LOCATION_COLUMNS,
+    "assets": ASSET_COLUMNS,
+    "bases": BASE_COLUMNS,
+}
+
+
+def _aligned(offset: int) -> int:
+    return -(-offset // ALIGN) * ALIGN
+
+
+class _StringTable:
+    """Numbers each distinct string once, in the order they are added."""
+
+    def __init__(self: Self) -> None:
+        """Initialize _StringTable object."""
+        self.numbers: dict[str, int] = {}
+
+    def add(self: Self, string: str | None) -> int:
+        if string is None:
+            return NONE
+        number = self.numbers.get(string)
+        if number is None:
+            number = self.numbers[string] = len(self.numbers)
+        return number
+
+
+def world_arrays(
+    factions: list[Faction], locations: list[Location]
+) -> tuple[dict[str, dict[str, "np.ndarray"]], list[str]]:
+    """
+    Return the columns of each table as numpy arrays, and the strings they refer to.
+
+    The same columns as a snapshot file, for code that wants them without going through one.
+    """
+    strings = _StringTable()
+    columns = {table: {name: [] for name in spec} for table, spec in TABLES.items()}
+    loc_rows = {loc.uuid: row for row, loc in enumerate(locations)}
+    loc_cols = columns["locations"]
+    for loc in locations:
+        loc_cols["uuid"].append(strings.add(loc.uuid))
+        loc_cols["name"].append(strings.add(loc.name))
+    faction_cols, asset_cols, base_cols = columns["factions"], columns["assets"], columns["bases"]
+    for row, faction in enumerate(factions):
+        faction_cols["uuid"].append(strings.add(faction.uuid))
+        faction_cols["name"].append(strings.add(faction.name))
+        faction_cols["cunning"].append(faction.cunning)
+        faction_cols["force"].append(faction.force)
+        faction_cols["wealth"].append(faction.wealth)
+        faction_cols["magic"].append(faction.magic.value)
+        faction_cols["hp"].append(faction.hp)
+        faction_cols["max_hp"].append(faction.max_hp())
+        faction_cols["treasure"].append(faction.treasure)
+        faction_cols["exp"].append(faction.exp)
+        faction_cols["npc"].append(faction.npc)
+        faction_cols["paralyzed"].append(faction.goal_change_paralysis)
+        for asset in faction.assets:
+            initialized = asset.is_initialized()
+            asset_type = asset.prototype.type if initialized else asset.prototype
+            asset_cols["uuid"].append(strings.add(asset.uuid))
+            asset_cols["owner"].append(row)
+            asset_cols["prototype"].append(
+                strings.add(asset.prototype.strings.id) if initialized else NONE
+            )
+            asset_cols["type"].append(
+                ASSET_TYPES.index(asset_type) if isinstance(asset_type, AssetType) else NONE
+            )
+            asset_cols["hp"].append(asset.hp)
+            asset_cols["max_hp"].append(asset.max_hp())
+            asset_cols["loc"].append(loc_rows.get(asset.loc.uuid, NONE) if asset.loc else NONE)
+            asset_cols["qualities"].append(asset.quality_mask)
+            asset_cols["repair_cost"].append(asset.repair_cost)
+        for base in faction.bases:
+            base_cols["uuid"].append(strings.add(base.uuid))
+            base_cols["owner"].append(row)
+            base_cols["loc"].append(
+                loc_rows.get(base.location.uuid, NONE) if base.location else NONE
+            )
+            base_cols["hp"].append(base.hp)
+            base_cols["max_hp"].append(base.max_hp)
+    arrays = {
+        table: {name: np.array(columns[table][name], dtype=dtype) for name, dtype in spec.items()}
+        for table, spec in TABLES.items()
+    }
+    return arrays, list(strings.numbers)
+
+
+def write_snapshot(
+    filename: str, factions: list[Faction], locations: list[Location], turn_idx: int = 0
+) -> int:
+    """
+    Write a snapshot of the model to a file, and return its size in bytes.
+
+    The file is written next to the target and then renamed over it, so processes that have
+    the old snapshot mapped keep reading the old contents.
+    """
+    tables, strings = world_arrays(factions, locations)
+    arrays: list[tuple["np.ndarray", int]] = []
+    header: dict = {"version": 1, "turn": turn_idx, "tables": {}}
+    # Column offsets are relative to the end of the header, which isn't known yet
+    offset = 0
+    for table, spec in TABLES.items():
+        header["tables"][table] = {"rows": len(tables[table]["uuid"]), "columns": {}}
+        for name, dtype in spec.items():
+            array = tables[table][name]
+            header["tables"][table]["columns"][name] = [dtype, offset]
+            arrays.append((array, offset))
+            offset = _aligned(offset + array.nbytes)
+    encoded = [string.encode("utf-8") for string in strings]
+    string_offsets = np.zeros(len(encoded) + 1, dtype="<i8")
+    np.cumsum([len(data) for data in encoded], out=string_offsets[1:])
+    header["strings"] = {"count": len(encoded), "offsets": offset}
+    arrays.append((string_offsets, offset))
+    offset = _aligned(offset + string_offsets.nbytes)
+    header["strings"]["data"] = offset
+
+    header_data = json.dumps(header, separators=(",", ":")).encode("utf-8")
+    base = _aligned(len(MAGIC) + 8 + len(header_data))
+    tmp_filename = f"{filename}.tmp"
+    with open(tmp_filename, mode="wb") as snapshot_file:
+        snapshot_file.write(MAGIC + struct.pack("<Q", len(header_data)) + header_data)
+        for array, array_offset in arrays:
+            snapshot_file.seek(base + array_offset)
+            snapshot_file.write(array.tobytes())
+        snapshot_file.seek(base + offset)
+        for data in encoded:
+            snapshot_file.write(data)
+        size = snapshot_file.tell()
+    os.replace(tmp_filename, filename)
+    return size
+
+
+class Table:
+    """The read-only columns of one table of a snapshot."""
+
+    def __init__(self: Self, rows: int, columns: dict[str, "np.ndarray"]) -> None:
+        """Initialize Table object."""
+        self.rows = rows
+        self.columns = columns
+
+    def __len__(self: Self) -> int:
+        return self.rows
+
+    def __getitem__(self: Self, column: str) -> "np.ndarray":
+        return self.columns[column]
+
+
+class WorldSnapshot:
+    """A snapshot file, mapped into memory. Raises OSError and ValueError when opened."""
+
+    def __init__(self: Self, filename: str) -> None:
+        """Initialize WorldSnapshot object."""
+        self.filename = filename
+        with open(filename, mode="rb") as snapshot_file:
+            magic = snapshot_file.read(len(MAGIC))
+            if magic != MAGIC:
+                raise ValueError(f"{filename} is not a world snapshot")
+            (header_len,) = struct.unpack("<Q", snapshot_file.read(8))
+            header = json.loads(snapshot_file.read(header_len))
+        base = _aligned(len(MAGIC) + 8 + header_len)
+        self._data = np.memmap(filename, dtype=np.uint8, mode="r")
+        self.turn_idx: int = header["turn"]
+        self.tables: dict[str, Table] = {}
+        for table, table_header in header["tables"].items():
+            rows = table_header["rows"]
+            columns = {
+                name: self._array(base + offset, dtype, rows)
+                for name, (dtype, offset) in table_header["columns"].items()
+            }
+            self.tables[table] = Table(rows, columns)
+        string_header = header["strings"]
+        self._string_offsets = self._array(
+            base + string_header["offsets"], "<i8", string_header["count"] + 1
+        )
+        self._string_base = base + string_header["data"]
+
+    def _array(self: Self, offset: int, dtype: str, count: int) -> "np.ndarray":
+        nbytes = np.dtype(dtype).itemsize * count
+        return self._data[offset : offset + nbytes].view(dtype)
+
+    def __reduce__(self: Self) -> tuple:
+        # Workers map the file themselves instead of receiving a copy of it
+        return (WorldSnapshot, (self.filename,))
+
+    @property
+    def factions(self: Self) -> Table:
+        return self.tables["factions"]
+
+    @property
+    def locations(self: Self) -> Table:
+        return self.tables["locations"]
+
+    @property
+    def assets(self: Self) -> Table:
+        return self.tables["assets"]
+
+    @property
+    def bases(self: Self) -> Table:
+        return self.tables["bases"]
+
+    def string(self: Self, number: int) -> str | None:
+        """Return a string by its number, None for NONE."""
+        if number < 0:
+            return None
+        start = self._string_base + int(self._string_offsets[number])
+        end = self._string_base + int(self._string_offsets[number + 1])
+        return self._data[start:end].tobytes().decode("utf-8")
+
+    def strings(self: Self, numbers: Iterable[int]) -> list[str | None]:
+        return [self.string(number) for number in numbers]
+
+    def row_of(self: Self, table: str, uuid: str) -> int | None:
+        """Return the row of an object by uuid, None if it isn't in the table. Takes O(rows)."""
+        encoded = uuid.encode("utf-8")
+        column = self.tables[table]["uuid"]
+        # Compare lengths first, and only decode the strings of the same length
+        lengths = np.diff(self._string_offsets)[column]
+        for row in np.flatnonzero(lengths == len(encoded)):
+            if self.string(column[row]) == uuid:
+                return int(row)
+        return None
+
+    def assets_per_faction(self: Self) -> "np.ndarray":
+        """Count the assets of each faction by type, as an array of [faction row, type]."""
+        assets = self.assets
+        counts = np.zeros((self.factions.rows, len(ASSET_TYPES)), dtype=np.int64)
+        known = assets["type"] >= 0
+        np.add.at(counts, (assets["owner"][known], assets["type"][known]), 1)
+        return counts
@@ -1,24 +1,48 @@
 import logging
-from typing import Self
+import time
+from collections.abc import Callable
+from typing import TYPE_CHECKING, Self
 from uuid import uuid4
 
-from imgui_bundle import imgui
-
-from config import open_yaml, write_yaml
+from config import DEFAULT_PROJECT
 from src.app import App
 from src.asset import Asset
 from src.base_of_influence import BaseOfInfluence
 from src.faction import Faction
+from src.goal_tracker import GoalTracker
+from src.history import DEFAULT_HISTORYFILE, HistoryStore
+from src.labels import LABELS
 from src.layout_helper import LayoutHelper
+from src.lazy_import import lazy_import
 from src.location import Location
-from src.quality import Quality
-from src.system import QUALITY, quality_list, tags_list
+from src.metrics import DEFAULT_CAPACITY, METRICS, FactionMetrics
+from src.project import Project, ProjectLoad, load_project, save_project
+from src.spatial_index import SpatialIndex
+from src.style import STYLE
+from src.system import QUALITY, rules_index
 from src.turn import FactionTurn
 
-logger = logging.getLogger(__name__)
+if TYPE_CHECKING:
+    from src.ai import RoundPlan
+    from src.diff import Change, Snapshot
+    from src.system import RulesEntry
 
+imgui = lazy_import("imgui_bundle.imgui")
+implot = lazy_import("imgui_bundle.implot")
+# Only used while profiling allocations, see `window_allocations`
+tracemalloc = lazy_import("tracemalloc")
+# Only needed once the app is created, not to import it
+ai = lazy_import("src.ai")
+diff = lazy_import("src.diff")
+events = lazy_import("src.events")
+economy = lazy_import("src.economy")
+search_index = lazy_import("src.search_index")
+server = lazy_import("src.server")
 
-DEFAULT_PROJECT = "Project/wwn.yaml"
+logger = logging.getLogger(__name__)
+
+# Risks shown in red in the economy forecast
+HIGH_RISK = 0.25
 
 
 class WwnApp(App):
@@ -30,99 +54,171 @@ class WwnApp(App):
         self.factions: list[Faction] = []
         self.locations: list[Location] = []
         self.turn: FactionTurn = FactionTurn()
+        self.index: SpatialIndex = SpatialIndex()
+        # Text search, kept up to date with the changes that go through the spatial index
+        self.search = search_index.SearchIndex()
+        self.index.subscribe(self.search.on_change)
+        self.search_query: str = ""
+        # Results of the last query, and the (query, index version) they were found for
+        self.search_results: list[Faction | Asset | Location] = []
+        self.search_key: tuple[str, int] = None
+        self.search_time: float = 0.0
+        # Rules search, and the query its results were found for
+        self.rules_query: str = ""
+        self.rules_results: list["RulesEntry"] = []
+        self.rules_key: str = None
+        self.rules_time: float = 0.0
         # Load project data from file
         config_project: dict = config_data.get("project", {})
         self.project_filename: str = config_project.get("filename", DEFAULT_PROJECT)
+        self.event_log = events.EventLog(config_project.get("eventfile", events.DEFAULT_EVENTFILE))
+        self.goal_tracker = GoalTracker()
+        self.event_log.subscribe(self.goal_tracker.on_event)
+        self.history = HistoryStore(config_project.get("historyfile", DEFAULT_HISTORYFILE))
+        # Faction metrics of the last turns, filled from the history
+        config_charts: dict = config_data.get("charts", {})
+        self.metrics = FactionMetrics(config_charts.get("turns", DEFAULT_CAPACITY))
+        self.chart_metric: int = 0
+        self.ai = ai.AIController(ai.AISettings.from_config(config_data))
+        # Round being planned in the background, if any
+        self.round_plan: "RoundPlan" = None
+        # Resolve NPC faction turns as soon as they come up
+        self.auto_run: bool = False
+        # What execute draws each frame, in order, by name
+        self.windows: list[tuple[str, Callable[[], None]]] = [
+            ("Factions", self.faction_window),
+            ("Locations", self.location_window),
+            ("Turn", self.turn_window),
+            ("AI", self.ai_window),
+            ("Economy", self.economy_window),
+            ("Changes", self.changes_window),
+            ("Charts", self.chart_window),
+            ("Search", self.search_window),
+            ("Rules", self.rules_window),
+            ("Project", self.project_window),
+            ("Server", self.server_update),
+        ]
+        # Total CPU time spent in each of the windows, when set to a dict
+        self.window_times: dict[str, float] = None
+        # Total [peak bytes, net bytes, labels built] allocated in each of the windows, when set
+        # to a dict while tracemalloc is tracing. Peak is the most held at once in the window.
+        self.window_allocations: dict[str, list[int]] = None
+        self.economy_settings = economy.EconomySettings.from_config(config_data)
+        self.economy_faction: int = 0
+        self.economy_turns: int = self.economy_settings.turns
+        # Read-only HTTP API for players on the local network
+        self.server = server.ApiServer(server.ServerSettings.from_config(config_data))
+        self.event_log.subscribe(self.server.on_event)
+        self.index.subscribe(self.server.on_change)
+        # The label cache is rebuilt on changes, and forgets removed entities
+        self.event_log.subscribe(LABELS.on_event)
+        self.index.subscribe(LABELS.on_change)
+        # State at the start of the current round, and the changes shown in the changes window
+        self.round_snapshot: "Snapshot" = None
+        self.round_active: bool = False
+        self.changes: list["Change"] = []
+        self.changes_title: str = ""
+        self.changes_turn: int = 0
+        # Project file being loaded in the background, if any
+        self.project_load: ProjectLoad = None
         self.open_project()
+        if self.server.settings.enabled:
+            self.server.start()
 
     def execute(self: Self) -> None:
         """Draw GUI windows."""
-        self.faction_window()
-        self.location_window()
-        self.turn.execute(self.factions, self.locations)
-        self.project_window()
+        if self.project_load:
+            # Nothing else is drawn until the project has loaded, so it can't be edited
+            self.loading_window()
+            return
+        if self.auto_run:
+            self.resolve_npc_turns()
+        if self.window_times is None and self.window_allocations is None:
+            for _, draw in self.windows:
+                draw()
+            return
+        for name, draw in self.windows:
+            self.profile_window(name, draw)
+
+    def profile_window(self: Self, name: str, draw: Callable[[], None]) -> None:
+        """Draw a window, adding up its CPU time and allocations, see `window_times`."""
+        tracing = self.window_allocations is not None and tracemalloc.is_tracing()
+        if tracing:
+            built = LABELS.built
+            tracemalloc.reset_peak()
+            start_size = tracemalloc.get_traced_memory()[0]
+        start_time = time.thread_time()
+        draw()
+        if self.window_times is not None:
+            self.window_times[name] = (
+                self.window_times.get(name, 0.0) + time.thread_time() - start_time
+            )
+        if tracing:
+            size, peak = tracemalloc.get_traced_memory()
+            totals = self.window_allocations.setdefault(name, [0, 0, 0])
+            totals[0] += peak - start_size
+            totals[1] += size - start_size
+            totals[2] += LABELS.built - built
+
+    def turn_window(self: Self) -> None:
+        """Draw the turn GUI, and keep track of the rounds it starts and ends."""
+        self.turn.execute(self.factions, self.locations, self.index)
+        self.track_rounds()
+
+    def server_update(self: Self) -> None:
+        self.server.update(self.factions, self.locations, self.turn, self.index)
 
     def open_project(self: Self) -> None:
-        """Load project from file."""
-        project_data = open_yaml(self.project_filename)
-        if project_data:
-            self.factions: list[Faction] = project_data.get("factions", [])
-            self.locations: list[Location] = project_data.get("locations", [])
-            self.turn: FactionTurn = project_data.get("turn", FactionTurn())
-
-            self.restore_links()
-
-    def restore_links(self: Self) -> None:
-        # Restore links to objects using uuid and ident strings
-        for faction in self.factions:
-            # BoI locations
-            for base in faction.bases:
-                for location in self.locations:
-                    if base.location == location.uuid:
-                        base.location = location
-                        break
-            # Tags (from prototype)
-            for tag in faction.tags:
-                if tag.prototype:  # Note, can be None
-                    for prototype in tags_list():
-                        if tag.prototype == prototype.id:
-                            tag.prototype = prototype
-                            break
-            # Assets (from prototype)
-            for asset in faction.assets:
-                # Qualities set on assets
-                qualities: list[Quality] = []
-                for q in asset.qualities:
-                    for prototype in quality_list():
-                        if q == prototype.id:
-                            qualities.append(prototype)
-                asset.qualities = qualities
-                # Asset location
-                if asset.loc:
-                    for location in self.locations:
-                        if asset.loc == location.uuid:
-                            asset.loc = location
-                            break
-
-        # Faction turn order
-        if self.turn.turn_order:
-            factions: list[Faction] = []
-            for faction_id in self.turn.turn_order:
-                for faction in self.factions:
-                    if faction_id == faction.uuid:
-                        factions.append(faction)
-                        break
-                else:
-                    # TODO(orkaboy): Exception
-                    pass
-            self.turn.turn_order = factions
-        # Location references
-        for location in self.locations:
-            assets: list[Asset] = []
-            for asset_id in location.assets:
-                for faction in self.factions:
-                    for asset in faction.assets:
-                        if asset_id == asset.uuid:
-                            assets.append(asset)
-                            # TODO(orkaboy): Exception on outer for loop?
-            location.assets = assets
-            bases: list[BaseOfInfluence] = []
-            for boi_id in location.bases:
-                for faction in self.factions:
-                    for boi in faction.bases:
-                        if boi_id == boi.uuid:
-                            bases.append(boi)
-                            # TODO(orkaboy): Exception on outer for loop?
-            location.bases = bases
+        """Start loading the project file in the background, see `loading_window`."""
+        if not self.project_load:
+            self.project_load = ProjectLoad(self.project_filename)
+
+    def loading_window(self: Self) -> None:
+        """Draw the progress of loading the project, and set it up once it has loaded."""
+        if self.project_load.done:
+            project = self.project_load.project
+            self.project_load = None
+            self.set_project(project)
+            return
+        imgui.begin("Loading")
+        imgui.text(f"Loading {self.project_load.filename}")
+        imgui.progress_bar(self.project_load.progress, imgui.ImVec2(300, 0))
+        imgui.end()
+
+    def set_project(self: Self, project: Project | None) -> None:
+        """Set up a loaded project. Keeps the current one if loading failed."""
+        if project:
+            self.factions = project.factions
+            self.locations = project.locations
+            self.turn = project.turn
+            self.index.rebuild(self.factions)
+            LABELS.clear()
+        self.search.rebuild(self.factions, self.locations)
+        self.turn.event_log = self.event_log
+        self.turn.goal_tracker = self.goal_tracker
+        self.goal_tracker.bind(self.factions)
+        self.round_snapshot = diff.Snapshot.from_project(self.project())
+        self.round_active = bool(self.turn.turn_order)
+        self.metrics.load_history(self.history)
+        self.changes = []
+        self.changes_title = ""
+
+    def project(self: Self) -> Project:
+        """Return the current project state, for saving and diffs."""
+        return Project(self.factions, self.locations, self.turn)
 
     def save_project(self: Self) -> None:
         """Save project to file."""
-        data = {
-            "factions": self.factions,
-            "locations": self.locations,
-            "turn": self.turn,
-        }
-        write_yaml(filename=self.project_filename, data=data)
+        save_project(self.project_filename, self.project())
+        self.event_log.flush()
+
+    def close(self: Self) -> None:
+        """Write out pending events, stop the AI workers and server, and close the GUI."""
+        self.event_log.flush()
+        self.ai.close()
+        self.server.stop()
+        self.history.close()
+        super().close()
 
     def project_window(self: Self) -> None:
         """Draw project GUI."""
@@ -139,8 +235,329 @@ class WwnApp(App):
         if imgui.button("Load project"):
             self.open_project()
 
+        LayoutHelper.add_spacer()
+        changed, serve = imgui.checkbox(label="Serve to players", v=self.server.running)
+        LayoutHelper.add_tooltip("Share the project state read-only over HTTP, see src/server.py.")
+        if changed:
+            if serve:
+                self.server.start()
+            else:
+                self.server.stop()
+        if self.server.running:
+            imgui.text_wrapped(f"Serving on {self.server.address}/api/turn")
+
+        imgui.end()
+
+    def resolve_npc_turns(self: Self) -> None:
+        """Run the turn logic without drawing until a player faction's turn."""
+        # The controller is busy planning, and the plans would go stale
+        if not self.turn.turn_order or self.round_plan:
+            return
+        start_time = time.perf_counter()
+        completed = self.turn.run_npc_turns(
+            main_action=lambda faction: self.ai.act(
+                faction, self.turn, self.factions, self.locations, self.index
+            )
+        )
+        if completed:
+            logger.info(
+                f"Resolved {completed} NPC faction turns in {time.perf_counter() - start_time:.2f}s"
+            )
+
+    def ai_window(self: Self) -> None:
+        """Draw AI planning GUI."""
+        imgui.begin("AI")
+
+        imgui.set_window_pos("AI", imgui.ImVec2(745, 5), imgui.Cond_.first_use_ever)
+        imgui.set_window_size(imgui.ImVec2(240, 410), cond=imgui.Cond_.first_use_ever)
+
+        _, self.auto_run = imgui.checkbox(label="Auto-run NPC factions", v=self.auto_run)
+        LayoutHelper.add_tooltip("Resolve NPC faction turns as soon as they come up.")
+
+        if not self.turn.turn_order or self.turn.cur_faction >= len(self.turn.turn_order):
+            imgui.text_wrapped("Start a turn to plan the faction actions.")
+            imgui.end()
+            return
+
+        if self.round_plan:
+            if not self.round_plan.done:
+                imgui.text("Planning the round...")
+                imgui.end()
+                return
+            # Factions that have taken their turn while planning don't need a plan anymore
+            left = {faction.uuid for faction in self.turn.turn_order[self.turn.cur_faction :]}
+            plans = self.round_plan.plans or {}
+            self.ai.plans = {uuid: plan for uuid, plan in plans.items() if uuid in left}
+            self.round_plan = None
+
+        if imgui.button("Plan round"):
+            # Planning runs the rollouts, so it runs in the background not to hold up drawing
+            self.round_plan = ai.RoundPlan(self.ai, self.turn, self.factions, self.locations)
+        LayoutHelper.add_tooltip("Plan the main action of every faction left in the turn order.")
+        imgui.same_line()
+        if imgui.button("Resolve NPC turns"):
+            self.resolve_npc_turns()
+        LayoutHelper.add_tooltip(
+            "Resolve the rest of the round, up to the next player faction, using the planned actions."  # noqa: E501
+        )
+        if not self.turn.turn_order:
+            imgui.end()
+            return
+
+        if self.ai.plans:
+            names = ai.AIController.names(self.factions, self.locations)
+            faction = self.turn.turn_order[self.turn.cur_faction]
+            decision = self.ai.plans.get(faction.uuid)
+            if decision and self.turn.state == FactionTurn.TurnFSM.MAIN_ACTION:
+                LayoutHelper.add_spacer()
+                imgui.text_wrapped(f"{faction.name}: {decision.describe(names)}")
+                if imgui.button("Approve##AI"):
+                    self.ai.apply(decision, self.turn, self.factions, self.locations, self.index)
+                    self.ai.plans.pop(faction.uuid)
+                    self.turn.state = FactionTurn.TurnFSM.POST_ACTION
+                imgui.same_line()
+                STYLE.button_color(STYLE.COL_RED)
+                if imgui.button("Reject##AI"):
+                    self.ai.plans.pop(faction.uuid)
+                STYLE.pop_color()
+            LayoutHelper.add_spacer()
+            imgui.text("PLANNED ACTIONS:")
+            for uuid, planned in self.ai.plans.items():
+                imgui.text_wrapped(f"{names.get(uuid)}: {planned.describe(names)}")
+                LayoutHelper.add_tooltip(f"Score: {planned.score:.1f}")
+
+        imgui.end()
+
+    def economy_window(self: Self) -> None:
+        """Draw the economy forecast of a faction."""
+        imgui.begin("Economy")
+
+        imgui.set_window_pos("Economy", imgui.ImVec2(990, 5), imgui.Cond_.first_use_ever)
+        imgui.set_window_size(imgui.ImVec2(240, 410), cond=imgui.Cond_.first_use_ever)
+
+        if not self.factions:
+            imgui.text_wrapped("Add a faction to forecast its economy.")
+            imgui.end()
+            return
+        self.economy_faction = min(self.economy_faction, len(self.factions) - 1)
+        _, self.economy_faction = imgui.combo(
+            label="Faction##Economy",
+            current_item=self.economy_faction,
+            items=[faction.name for faction in self.factions],
+        )
+        _, self.economy_turns = imgui.slider_int(
+            label="Turns##Economy", v=self.economy_turns, v_min=1, v_max=50
+        )
+        faction = self.factions[self.economy_faction]
+        owners = {owner.uuid: owner for owner in self.factions}
+        # Cached per asset mix, so this is only computed when something changes
+        params = economy.EconomyParams.from_faction(
+            faction, owners, self.index, self.economy_settings
+        )
+        result = economy.forecast(params, faction.treasure, faction.hp, self.economy_turns)
+        long_run = economy.steady_state(params)
+
+        LayoutHelper.add_spacer()
+        imgui.text(f"Treasure gain: {params.gain}")
+        imgui.text(f"Upkeep: {params.upkeep}")
+        imgui.text(f"Incoming damage: {economy.expected_damage(params):.1f}")
+        LayoutHelper.add_tooltip("Expected damage per turn from the rival assets at the bases.")
+
+        LayoutHelper.add_spacer()
+        imgui.text(f"IN {self.economy_turns} TURNS:")
+        self._risk_text("Missed upkeep", result.shortfall[-1])
+        self._risk_text("Destroyed", result.destroyed[-1])
+        imgui.text(f"Expected Treasure: {result.expected_treasure():.1f}")
+
+        LayoutHelper.add_spacer()
+        imgui.text("LONG RUN:" if long_run.converged else "LONG RUN (ESTIMATE):")
+        self._risk_text("Turns with missed upkeep", long_run.shortfall_rate)
+        self._risk_text("Destroyed per turn", long_run.destroy_rate)
+        imgui.text(f"Expected Treasure: {long_run.expected_treasure():.1f}")
+
+        imgui.end()
+
+    def track_rounds(self: Self) -> None:
+        """
+        Follow the rounds as they start and end.
+
+        The end of each round is recorded in the history. When a round starts, a snapshot is
+        taken and the changes window lists what changed during the last round.
+        """
+        round_active = bool(self.turn.turn_order)
+        if self.round_active and not round_active:
+            self.history.record(self.project())
+            self.metrics.append_factions(self.turn.turn_idx, self.factions)
+        self.round_active = round_active
+        if self.round_snapshot and self.round_snapshot.turn_idx == self.turn.turn_idx:
+            return
+        snapshot = diff.Snapshot.from_project(self.project())
+        if self.round_snapshot:
+            self.changes = list(diff.diff_projects(self.round_snapshot, snapshot))
+            self.changes_title = f"During turn {self.round_snapshot.turn_idx}"
+        self.round_snapshot = snapshot
+
+    def changes_window(self: Self) -> None:
+        """Draw the changes between project snapshots."""
+        imgui.begin("Changes")
+
+        imgui.set_window_pos("Changes", imgui.ImVec2(1235, 5), imgui.Cond_.first_use_ever)
+        imgui.set_window_size(imgui.ImVec2(240, 410), cond=imgui.Cond_.first_use_ever)
+
+        if imgui.button("This turn"):
+            self.changes = list(diff.diff_projects(self.round_snapshot, self.project()))
+            self.changes_title = f"Since turn {self.round_snapshot.turn_idx} started"
+        LayoutHelper.add_tooltip("Changes since the start of the current turn.")
+        imgui.same_line()
+        if imgui.button("Since save"):
+            saved = load_project(self.project_filename)
+            if saved:
+                self.changes = list(diff.diff_projects(saved, self.project()))
+                self.changes_title = f"Since {self.project_filename} was saved"
+        LayoutHelper.add_tooltip("Changes since the project file was saved.")
+        _, self.changes_turn = imgui.input_int(label="##ChangesTurn", v=self.changes_turn)
+        imgui.same_line()
+        if imgui.button("Since turn"):
+            self.changes = list(
+                diff.diff_projects(self.history.snapshot(self.changes_turn), self.project())
+            )
+            self.changes_title = f"Since the end of turn {self.changes_turn}"
+        LayoutHelper.add_tooltip("Changes since the end of a past turn, from the campaign history.")
+
+        if self.changes_title:
+            LayoutHelper.add_spacer()
+            imgui.text_wrapped(f"{self.changes_title}: {len(self.changes)} changes")
+        imgui.begin_child("ChangeList")
+        # Only the visible lines are drawn, as a diff can be long
+        clipper = imgui.ListClipper()
+        clipper.begin(len(self.changes))
+        while clipper.step():
+            for change in self.changes[clipper.display_start : clipper.display_end]:
+                color = {"+": STYLE.COL_GREEN, "-": STYLE.COL_RED}.get(change.op)
+                if color:
+                    STYLE.text_color(color)
+                imgui.text(str(change))
+                if color:
+                    STYLE.pop_color()
+        imgui.end_child()
+
         imgui.end()
 
+    def search_window(self: Self) -> None:
+        """Draw the search over factions, assets and locations."""
+        imgui.begin("Search")
+
+        imgui.set_window_pos("Search", imgui.ImVec2(1235, 420), imgui.Cond_.first_use_ever)
+        imgui.set_window_size(imgui.ImVec2(240, 300), cond=imgui.Cond_.first_use_ever)
+
+        _, self.search_query = imgui.input_text_with_hint(
+            label="##SearchQuery", hint="type:force quality:stealth", str=self.search_query
+        )
+        LayoutHelper.add_tooltip(
+            "Words to find in names, descriptions, notes, prototypes, types, qualities, tags, goals, locations and owners. Limit a word to one of them with e.g. tag:martial."  # noqa: E501
+        )
+        # Only searched again when the query or the index changes
+        search_key = (self.search_query, self.search.version)
+        if search_key != self.search_key:
+            self.search_key = search_key
+            start_time = time.perf_counter()
+            self.search_results = self.search.search(self.search_query)
+            self.search_time = time.perf_counter() - start_time
+        if self.search_query:
+            more = "+" if len(self.search_results) >= search_index.DEFAULT_LIMIT else ""
+            imgui.text(
+                f"{len(self.search_results)}{more} results in {1000 * self.search_time:.2f} ms"
+            )
+
+        imgui.begin_child("SearchResults")
+        owners = self.search.factions
+        clipper = imgui.ListClipper()
+        clipper.begin(len(self.search_results))
+        while clipper.step():
+            for entity in self.search_results[clipper.display_start : clipper.display_end]:
+                if isinstance(entity, Asset):
+                    text = LABELS.text(
+                        entity.uuid,
+                        "search",
+                        "{0} ({1}, {0.loc})",
+                        entity,
+                        owners.get(entity.owner),
+                    )
+                else:
+                    text = entity.name
+                imgui.text(text)
+                LayoutHelper.add_tooltip(entity.desc)
+        imgui.end_child()
+
+        imgui.end()
+
+    def rules_window(self: Self) -> None:
+        """Draw the search over the rules of assets, tags, qualities and goals."""
+        imgui.begin("Rules")
+
+        imgui.set_window_pos("Rules", imgui.ImVec2(1480, 420), imgui.Cond_.first_use_ever)
+        imgui.set_window_size(imgui.ImVec2(435, 300), cond=imgui.Cond_.first_use_ever)
+
+        _, self.rules_query = imgui.input_text_with_hint(
+            label="##RulesQuery", hint="attack twice", str=self.rules_query
+        )
+        LayoutHelper.add_tooltip(
+            "Words to find in the rules of assets, tags and qualities, and in goals. Best matches first."  # noqa: E501
+        )
+        if self.rules_query != self.rules_key:
+            self.rules_key = self.rules_query
+            start_time = time.perf_counter()
+            self.rules_results = rules_index().search(self.rules_query)
+            self.rules_time = time.perf_counter() - start_time
+        if self.rules_query:
+            imgui.text(f"{len(self.rules_results)} results in {1000 * self.rules_time:.2f} ms")
+
+        imgui.begin_child("RulesResults")
+        clipper = imgui.ListClipper()
+        clipper.begin(len(self.rules_results))
+        while clipper.step():
+            for entry in self.rules_results[clipper.display_start : clipper.display_end]:
+                imgui.text(entry.title)
+                LayoutHelper.add_tooltip(entry.text)
+        imgui.end_child()
+
+        imgui.end()
+
+    def chart_window(self: Self) -> None:
+        """Draw charts of the faction metrics over the last turns."""
+        imgui.begin("Charts")
+
+        imgui.set_window_pos("Charts", imgui.ImVec2(5, 420), imgui.Cond_.first_use_ever)
+        imgui.set_window_size(imgui.ImVec2(1225, 300), cond=imgui.Cond_.first_use_ever)
+
+        _, self.chart_metric = imgui.combo(
+            label="Metric##Charts", current_item=self.chart_metric, items=list(METRICS)
+        )
+        if not self.metrics.count:
+            imgui.text_wrapped("The charts fill in as rounds end.")
+            imgui.end()
+            return
+        # One point per pixel column is enough, however many turns there are
+        width = int(imgui.get_content_region_avail().x)
+        turns, values = self.metrics.plot_data(self.chart_metric, width)
+        if implot.begin_plot("##Charts", size=imgui.ImVec2(-1, -1)):
+            implot.setup_axes("Turn", METRICS[self.chart_metric])
+            spec = implot.Spec(flags=implot.LineFlags_.skip_nan.value)
+            for uuid, slot in self.metrics.slots.items():
+                implot.plot_line(f"{self.metrics.names[uuid]}##{uuid}", turns, values[slot], spec)
+            implot.end_plot()
+
+        imgui.end()
+
+    @staticmethod
+    def _risk_text(label: str, risk: float) -> None:
+        colored = risk >= HIGH_RISK
+        if colored:
+            STYLE.text_color(STYLE.COL_RED)
+        imgui.text(f"{label}: {100 * risk:.1f}%")
+        if colored:
+            STYLE.pop_color()
+
     def location_window(self: Self) -> None:
         """Draw location browser GUI."""
         imgui.begin("Locations")
@@ -150,50 +567,64 @@ class WwnApp(App):
 
         if imgui.button("Add Location"):
             self.locations.append(Location(uuid=uuid4().hex, name="New Location"))
+            self.index.changed(self.locations[-1])
 
+        owners: dict[str, Faction] = {faction.uuid: faction for faction in self.factions}
         rm_loc = -1
         for idx, loc in enumerate(self.locations):
             loc_open, loc_retain = imgui.collapsing_header(
-                label=f"{loc}##{loc.uuid}", p_visible=True, flags=imgui.TreeNodeFlags_.default_open
+                label=LABELS.label(loc.uuid, "header", loc.name),
+                p_visible=True,
+                flags=imgui.TreeNodeFlags_.default_open,
             )
 
             if loc_open and loc_retain:
-                _, loc.name = imgui.input_text(label=f"Name##Loc_{loc.uuid}", str=loc.name)
-                _, loc.desc = imgui.input_text_multiline(
-                    label=f"Description##Loc_{loc.uuid}", str=loc.desc
-                )
+                imgui.push_id(loc.uuid)
+                renamed, loc.name = imgui.input_text(label="Name", str=loc.name)
+                edited, loc.desc = imgui.input_text_multiline(label="Description", str=loc.desc)
+                if renamed or edited:
+                    self.index.changed(loc)
                 imgui.text("BASES:")
                 for base_cast in loc.bases:
                     base: BaseOfInfluence = base_cast
-                    base_owner: Faction = None
-                    for faction in self.factions:
-                        if faction.uuid == base.owner:
-                            base_owner = faction
-                            break
-                    imgui.text(f"{base_owner} ({base.hp}/{base.max_hp})")
+                    base_owner = owners.get(base.owner)
+                    imgui.text(
+                        LABELS.text(
+                            base.uuid, "at_loc", "{1} ({0.hp}/{0.max_hp})", base, base_owner
+                        )
+                    )
                     LayoutHelper.add_tooltip(text=base.desc)
                 imgui.text("ASSETS:")
                 for asset_cast in loc.assets:
                     asset: Asset = asset_cast
-                    asset_owner: Faction = None
-                    for faction in self.factions:
-                        if faction.uuid == asset.owner:
-                            asset_owner = faction
-                            break
-                    imgui.text(f"{asset_owner}: {asset} ({asset.hp}/{asset.max_hp()})")
+                    asset_owner = owners.get(asset.owner)
+                    imgui.text(
+                        LABELS.text(
+                            asset.uuid,
+                            "at_loc",
+                            # Assets with unknown prototypes show up here too, with no max hp
+                            "{1}: {0} ({0.hp}/{0.prototype.stats.max_hp})"
+                            if asset.is_initialized()
+                            else "{1}: {0} ({0.hp}/0)",
+                            asset,
+                            asset_owner,
+                        )
+                    )
                     LayoutHelper.add_tooltip(text=asset.desc)
-                    if QUALITY.Stealth in asset.qualities:
+                    if asset.has_quality(QUALITY.Stealth):
                         imgui.same_line()
                         imgui.text("STEALTH")
                         LayoutHelper.add_tooltip(text=QUALITY.Stealth.rules)
-                    if QUALITY.Subtle in asset.qualities:
+                    if asset.has_quality(QUALITY.Subtle):
                         imgui.same_line()
                         imgui.text("SUBTLE")
                         LayoutHelper.add_tooltip(text=QUALITY.Subtle.rules)
+                imgui.pop_id()
             if not loc_retain:
                 rm_loc = idx
         if rm_loc >= 0:
-            self.locations.pop(rm_loc)
+            loc = self.locations.pop(rm_loc)
+            self.index.changed(loc, removed=True)
 
         imgui.end()
 
@@ -208,19 +639,23 @@ class WwnApp(App):
             self.factions.append(
                 Faction(uuid=uuid4().hex, name="New Faction"),
             )
+            self.index.changed(self.factions[-1])
 
         rm_faction = -1
         for idx, faction in enumerate(self.factions):
             faction_open, faction_retain = imgui.collapsing_header(
-                f"{faction.name}##{idx}", True, flags=imgui.TreeNodeFlags_.default_open
+                LABELS.label(faction.uuid, "header", faction.name),
+                True,
+                flags=imgui.TreeNodeFlags_.default_open,
             )
             if faction_open and faction_retain:
-                faction.render(idx, self.locations)
+                faction.render(self.locations, self.index)
             if not faction_retain:
                 rm_faction = idx
             if idx < len(self.factions) - 1:
                 LayoutHelper.add_spacer(2)
         if rm_faction >= 0:
-            self.factions.pop(rm_faction)
+            faction = self.factions.pop(rm_faction)
+            self.index.remove_faction(faction)
 
         imgui.end()